@@ -161,8 +161,8 @@ if __name__ == "__main__":
         status = project.list_status()
         print("Cache status:")
         for seg_id, info in status.items():
-            cached = "+" if info.get("segment") else "-"
-            audio = "+" if info.get("combined") else "-"
+            cached = "+" if info.segment else "-"
+            audio = "+" if info.combined else "-"
             print(f"  {seg_id}: segment={cached} audio={audio}")
     elif args.build:
         if args.force:
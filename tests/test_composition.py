@@ -81,22 +81,34 @@ class TestConcatenator:
         concat = FFmpegConcatenator()
         assert concat is not None
 
-    def test_ffmpeg_concatenator_command(self, temp_dir):
-        """FFmpegConcatenator should build correct command."""
+    def test_ffmpeg_concatenator_escapes_quotes_in_list_file(self, temp_dir, monkeypatch):
+        """List-file entries should escape single quotes per concat demuxer rules."""
+        import subprocess
         from video_toolkit.composition import FFmpegConcatenator
 
+        written = {}
+
+        class FakeProc:
+            returncode = 0
+            stderr = iter(())
+
+            def wait(self):
+                return 0
+
+        def fake_popen(cmd, **kwargs):
+            list_file = Path(cmd[cmd.index("-i") + 1])
+            written["content"] = list_file.read_text()
+            return FakeProc()
+
+        monkeypatch.setattr(subprocess, "Popen", fake_popen)
+
         concat = FFmpegConcatenator()
-        files = [
-            temp_dir / "seg1.mp4",
-            temp_dir / "seg2.mp4",
-        ]
+        files = [temp_dir / "it's a seg.mp4"]
         output = temp_dir / "output.mp4"
 
-        cmd = concat.build_command(files, output)
+        concat.concatenate(files, output)
 
-        assert "ffmpeg" in cmd
-        assert "-f" in cmd
-        assert "concat" in cmd
+        assert "it'\\''s a seg.mp4'" in written["content"]
 
     def test_moviepy_concatenator_creation(self):
         """MoviePyConcatenator should be creatable."""
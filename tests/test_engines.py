@@ -156,3 +156,23 @@ class TestEngineInterface:
             assert hasattr(engine, "get_voice")
             assert hasattr(engine, "get_cache_key")
             assert hasattr(engine, "is_cached")
+
+
+class TestLazyImports:
+    """Tests for deferred heavy imports in engine modules."""
+
+    def test_elevenlabs_module_has_no_heavy_imports(self):
+        """Importing the module should not pull in its SDK stack."""
+        import subprocess
+        import sys
+
+        code = (
+            "import sys\n"
+            "import video_toolkit.tts_engines.elevenlabs\n"
+            "for mod in ('httpx', 'elevenlabs', 'pydub', 'av'):\n"
+            "    assert mod not in sys.modules, mod\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+        assert result.returncode == 0, result.stderr
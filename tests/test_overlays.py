@@ -16,6 +16,19 @@ class TestOverlayBase:
         with pytest.raises(TypeError):
             Overlay()
 
+    def test_drawtext_escape_apostrophe(self):
+        """Apostrophes must close, escape and reopen the quote."""
+        from video_toolkit.overlays.base import drawtext_escape
+
+        assert drawtext_escape("It's fine") == "It'\\''s fine"
+
+    def test_drawtext_escape_backslash_and_percent(self):
+        """Backslash and % are escaped for drawtext text expansion."""
+        from video_toolkit.overlays.base import drawtext_escape
+
+        assert drawtext_escape("a\\b") == "a\\\\b"
+        assert drawtext_escape("100%") == "100\\%"
+
 
 class TestTitleBarOverlay:
     """Tests for TitleBarOverlay."""
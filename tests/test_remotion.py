@@ -62,6 +62,14 @@ class TestRemotionExceptions:
             raise BundleError("test")
 
 
+def _mock_node_proc(stdout=b"", stderr=b"", returncode=0):
+    """Build a mocked Popen handle for the Node bridge (bytes I/O)."""
+    proc = MagicMock()
+    proc.communicate.return_value = (stdout, stderr)
+    proc.returncode = returncode
+    return proc
+
+
 class TestRemotionRenderer:
     """Tests for RemotionRenderer with mocked subprocess."""
 
@@ -111,11 +119,9 @@ class TestRemotionRenderer:
         renderer._deps_checked = True
 
         bundle_output = json.dumps({"serveUrl": "/tmp/bundle_abc123"})
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = bundle_output
+        mock_proc = _mock_node_proc(stdout=bundle_output.encode())
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.Popen", return_value=mock_proc):
             url = renderer.bundle(force=True)
             assert url == "/tmp/bundle_abc123"
 
@@ -132,11 +138,9 @@ class TestRemotionRenderer:
         output_file.write_bytes(b"fake mp4")
 
         render_output = json.dumps({"success": True, "outputPath": str(output_file)})
-        mock_result = MagicMock()
-        mock_result.returncode = 0
-        mock_result.stdout = render_output
+        mock_proc = _mock_node_proc(stdout=render_output.encode())
 
-        with patch("subprocess.run", return_value=mock_result) as mock_run:
+        with patch("subprocess.Popen", return_value=mock_proc) as mock_run:
             result = renderer.render(
                 composition_id="AnimatedTitle",
                 input_props={"title": "Hello"},
@@ -158,11 +162,11 @@ class TestRemotionRenderer:
         renderer._deps_checked = True
         renderer._serve_url = "/tmp/bundle"
 
-        mock_result = MagicMock()
-        mock_result.returncode = 1
-        mock_result.stderr = "Composition not found"
+        mock_proc = _mock_node_proc(
+            stderr=b"Composition not found", returncode=1
+        )
 
-        with patch("subprocess.run", return_value=mock_result):
+        with patch("subprocess.Popen", return_value=mock_proc):
             with pytest.raises(RenderError, match="Composition not found"):
                 renderer.render(
                     composition_id="NonExistent",
@@ -182,10 +186,15 @@ class TestRemotionRenderer:
         renderer._deps_checked = True
         renderer._serve_url = "/tmp/bundle"
 
-        with patch(
-            "subprocess.run",
-            side_effect=subprocess.TimeoutExpired("node", 1),
-        ):
+        mock_proc = _mock_node_proc()
+        # First communicate (with payload) times out; the second, after
+        # kill(), drains the pipes
+        mock_proc.communicate.side_effect = [
+            subprocess.TimeoutExpired("node", 1),
+            (b"", b""),
+        ]
+
+        with patch("subprocess.Popen", return_value=mock_proc):
             with pytest.raises(RenderError, match="timed out"):
                 renderer.render(
                     composition_id="AnimatedTitle",
@@ -13,7 +13,7 @@ from .generated import GeneratedCache
 from .tts import TTSCache
 from .segments import SegmentCache
 from .combined import CombinedCache
-from .manager import CacheManager
+from .manager import CacheManager, SegStatus
 
 __all__ = [
     "CacheLayer",
@@ -22,4 +22,5 @@ __all__ = [
     "SegmentCache",
     "CombinedCache",
     "CacheManager",
+    "SegStatus",
 ]
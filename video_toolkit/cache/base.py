@@ -3,9 +3,10 @@ Base class for cache layers.
 """
 
 import hashlib
+import os
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Set
 
 
 def generate_cache_key(data: dict) -> str:
@@ -19,7 +20,7 @@ def generate_cache_key(data: dict) -> str:
         16-character hex string
     """
     key_string = str(sorted(data.items()))
-    return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+    return hashlib.sha256(key_string.encode()).digest()[:8].hex()
 
 
 class CacheLayer(ABC):
@@ -70,6 +71,21 @@ class CacheLayer(ABC):
         """
         return self.get_path(key, **kwargs).exists()
 
+    def existing_files(self) -> Set[str]:
+        """
+        List the filenames currently present in this layer.
+
+        One directory read instead of a stat call per file, so batch
+        status checks are O(1) syscalls regardless of segment count.
+
+        Returns:
+            Set of filenames in the layer's directory
+        """
+        try:
+            return {entry.name for entry in os.scandir(self.base_dir)}
+        except FileNotFoundError:
+            return set()
+
     def invalidate(self, key: str, **kwargs) -> bool:
         """
         Invalidate (delete) a cached file.
@@ -2,8 +2,9 @@
 Cache manager that orchestrates all cache layers.
 """
 
+import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, NamedTuple, Optional, Set
 
 from .generated import GeneratedCache
 from .tts import TTSCache
@@ -11,6 +12,18 @@ from .segments import SegmentCache
 from .combined import CombinedCache
 
 
+class SegStatus(NamedTuple):
+    """Cache status for a single segment.
+
+    A lightweight alternative to a per-segment dict: one small tuple
+    per segment instead of a 2-entry dict, which matters when listing
+    status for projects with many segments.
+    """
+
+    segment: bool
+    combined: bool
+
+
 class CacheManager:
     """
     Orchestrates the 5-layer cache system.
@@ -38,6 +51,32 @@ class CacheManager:
         self.segments = SegmentCache(base_dir=self.base_dir / "segments")
         self.combined = CombinedCache(base_dir=self.base_dir / "combined")
 
+    def scan(self) -> Set[str]:
+        """Sweep the whole cache tree in one pass.
+
+        Returns the relative path (as a string) of every file under
+        base_dir, so callers can answer "definitely not cached" with a
+        set lookup instead of a stat syscall per candidate.
+        """
+        found: Set[str] = set()
+        stack = [self.base_dir]
+
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(Path(entry.path))
+                        else:
+                            found.add(
+                                str(Path(entry.path).relative_to(self.base_dir))
+                            )
+            except FileNotFoundError:
+                continue
+
+        return found
+
     def get_status(
         self,
         segment_id: str,
@@ -176,7 +215,7 @@ class CacheManager:
         mode: str,
         engine: str,
         voice: str,
-    ) -> Dict[str, Dict[str, bool]]:
+    ) -> Dict[str, SegStatus]:
         """
         Get cache status for multiple segments.
 
@@ -187,9 +226,21 @@ class CacheManager:
             voice: Voice identifier
 
         Returns:
-            Dict mapping segment_id -> status dict
+            Dict mapping segment_id -> SegStatus
         """
-        return {
-            sid: self.get_status(sid, mode, engine, voice)
-            for sid in segment_ids
-        }
+        # One directory scan per layer instead of a stat call per
+        # segment per layer
+        segment_files = self.segments.existing_files()
+        combined_files = self.combined.existing_files()
+
+        status = dict.fromkeys(segment_ids)
+        for sid in segment_ids:
+            segment_name = self.segments.get_path(segment_id=sid, mode=mode).name
+            combined_name = self.combined.get_path(
+                segment_id=sid, mode=mode, engine=engine, voice=voice
+            ).name
+            status[sid] = SegStatus(
+                segment=segment_name in segment_files,
+                combined=combined_name in combined_files,
+            )
+        return status
@@ -3,12 +3,28 @@ Compositor for applying overlays to video clips.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, List, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
     from video_toolkit.overlays import Overlay
 
+# Compiled filter chains per (overlay set, resolution). The resolution
+# is fixed for a project, so identical overlay combinations (repeated
+# sections, shared subtitles) compile once and reuse the string
+_FILTER_CACHE: Dict[Tuple[str, Tuple[int, int]], Optional[str]] = {}
+_FILTER_CACHE_MAX = 256
+
+
+def _rect_contains(outer: tuple, inner: tuple) -> bool:
+    """Whether rect outer fully contains rect inner (x0, y0, x1, y1)."""
+    return (
+        outer[0] <= inner[0]
+        and outer[1] <= inner[1]
+        and outer[2] >= inner[2]
+        and outer[3] >= inner[3]
+    )
+
 
 @dataclass
 class Compositor:
@@ -36,12 +52,134 @@ class Compositor:
         Returns:
             VideoClip with overlays applied
         """
-        result = clip
+        from video_toolkit.overlays import OverlayStack
+
+        # Fuse all overlays into one composite pass instead of
+        # re-blending the full frame once per overlay
+        return OverlayStack(self._visible_overlays(config)).apply(clip, config)
+
+    def _visible_overlays(self, config: "ProjectConfig") -> List["Overlay"]:
+        """Drop overlays fully hidden behind later opaque overlays.
+
+        Walks from the topmost overlay down, accumulating the rects
+        covered by opaque overlays; anything whose known bounding rect
+        is fully inside a covered rect would never be seen, so its draw
+        is skipped.
+        """
+        visible = []
+        opaque_rects = []
+
+        for overlay in reversed(self.overlays):
+            box = overlay.bbox(config)
+            if box is not None and any(
+                _rect_contains(rect, box) for rect in opaque_rects
+            ):
+                continue
+            visible.append(overlay)
+            if box is not None and overlay.is_opaque():
+                opaque_rects.append(box)
+
+        visible.reverse()
+        return visible
+
+    def compose_static(
+        self,
+        clip: Any,
+        config: "ProjectConfig",
+    ) -> Any:
+        """Pre-bake static overlays into one RGBA layer and composite once.
+
+        When every overlay is constant for the segment's duration, they are
+        rasterized onto a single full-frame transparent canvas that is
+        composited as one ImageClip, so per-frame work is a single native
+        alpha blend instead of one blit per overlay sprite.
+
+        Falls back to compose() when any overlay is dynamic or cannot be
+        rasterized (e.g. no usable font).
+        """
+        overlays = self._visible_overlays(config)
+        if not overlays:
+            return clip
+
+        if not all(overlay.is_static() for overlay in overlays):
+            return self.compose(clip, config)
+
+        import numpy as np
+        from moviepy import CompositeVideoClip, ImageClip
+        from PIL import Image
+
+        canvas = Image.new("RGBA", config.dimensions, (0, 0, 0, 0))
+
+        try:
+            for overlay in overlays:
+                overlay.render_static(canvas, config)
+        except (NotImplementedError, OSError):
+            return self.compose(clip, config)
+
+        # Full-frame clips: skip CompositeVideoClip's per-frame blit
+        # machinery and blend with precomputed numpy buffers — the
+        # per-frame work is two vectorized multiply-adds
+        if tuple(clip.size) == tuple(config.dimensions):
+            overlay = np.asarray(canvas, dtype=np.float32)
+            alpha = overlay[..., 3:4] / 255.0
+            premultiplied = overlay[..., :3] * alpha
+            inv_alpha = 1.0 - alpha
+
+            def blend(get_frame, t):
+                return (
+                    get_frame(t) * inv_alpha + premultiplied
+                ).astype(np.uint8)
+
+            return clip.transform(blend)
+
+        baked = ImageClip(np.asarray(canvas), transparent=True)
+        baked = baked.with_duration(clip.duration)
+
+        return CompositeVideoClip([clip, baked], size=config.dimensions)
+
+    def to_ffmpeg_filter(self, config: "ProjectConfig") -> Optional[str]:
+        """Fuse all overlays into one ffmpeg filter chain, or None.
+
+        Returns a comma-joined chain that draws every overlay in a
+        single ffmpeg pass. None means at least one overlay has no
+        filter equivalent (or there is nothing to draw) and callers
+        must use the clip-compositing path instead.
+
+        Chains are fully determined by the overlay fields and the
+        resolution, so compiled strings are cached and shared verbatim
+        across segment builds (and parallel workers).
+        """
+        cache_key = (repr(self.overlays), config.dimensions)
+        if cache_key in _FILTER_CACHE:
+            return _FILTER_CACHE[cache_key]
+
+        chain = self._build_filter_chain(config)
+
+        if len(_FILTER_CACHE) >= _FILTER_CACHE_MAX:
+            _FILTER_CACHE.clear()
+        _FILTER_CACHE[cache_key] = chain
+
+        return chain
+
+    def _build_filter_chain(self, config: "ProjectConfig") -> Optional[str]:
+        """Compile the overlay filter expressions into one chain."""
+        filters = []
+        for overlay in self._visible_overlays(config):
+            expr = overlay.to_ffmpeg_filter(config)
+            if expr is None:
+                return None
+            if expr:
+                filters.append(expr)
+
+        if not filters:
+            return None
 
-        for overlay in self.overlays:
-            result = overlay.apply(result, config)
+        # Multi-chain graphs (movie= watermark sources) don't compose by
+        # comma-joining with other filters
+        if len(filters) > 1 and any(";" in expr for expr in filters):
+            return None
 
-        return result
+        return ",".join(filters)
 
     def add_overlay(self, overlay: "Overlay") -> None:
         """Add an overlay to the compositor."""
@@ -1,18 +1,36 @@
 """Video concatenation utilities."""
 
+import json
+import os
 import subprocess
 import tempfile
+import threading
+import warnings
 from abc import ABC, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, TYPE_CHECKING
-
-from moviepy import VideoFileClip, concatenate_videoclips
+from typing import List, Optional, Tuple, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
 
 
+# Shared worker pool for concurrent concat jobs. ffmpeg does the heavy
+# lifting in its own process (subprocess.run releases the GIL), so threads
+# are enough to keep all cores busy while reusing one pool across calls.
+_POOL: Optional[ThreadPoolExecutor] = None
+
+
+def _get_pool() -> ThreadPoolExecutor:
+    """Get or create the shared concat worker pool."""
+    global _POOL
+    if _POOL is None:
+        _POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+    return _POOL
+
+
 class Concatenator(ABC):
     """Abstract base class for video concatenators."""
 
@@ -34,114 +52,410 @@ class FFmpegConcatenator(Concatenator):
     ffmpeg_path: str = "ffmpeg"
     overwrite: bool = True
 
+    # The concat demuxer has no hard input limit, but cap list files at a
+    # sane size and fan very long lists through intermediates
+    _MAX_LIST_LEN = 1000
+
     def concatenate(
         self,
         files: List[Path],
         output: Path,
         config: Optional["ProjectConfig"] = None,
     ) -> Path:
-        """Concatenate videos using FFmpeg concat demuxer."""
-        cmd = self.build_command(files, output)
+        """Concatenate videos using FFmpeg concat demuxer.
 
-        result = subprocess.run(
-            cmd,
-            shell=True,
-            capture_output=True,
-            text=True,
-        )
+        `files` may be arbitrarily long. Prefer a single N-way call over
+        staged pairwise concats (concat A+B, then result+C, ...), which
+        re-mux already-written bytes at every stage.
+        """
+        output_resolved = Path(output).resolve()
+        if any(Path(f).resolve() == output_resolved for f in files):
+            warnings.warn(
+                "Concat output is also one of the inputs; this usually "
+                "means staged re-concat of a previous concat result. "
+                "Pass all source files in one call instead.",
+                stacklevel=2,
+            )
 
-        if result.returncode != 0:
-            raise RuntimeError(f"FFmpeg failed: {result.stderr}")
+        if len(files) > self._MAX_LIST_LEN:
+            return self._chunked_concatenate(files, output)
 
-        return output
+        return self.concatenate_with_list_file(files, output)
 
-    def build_command(self, files: List[Path], output: Path) -> str:
-        """Build FFmpeg concat command."""
-        file_list = "|".join(f"file '{f}'" for f in files)
-        overwrite_flag = "-y" if self.overwrite else ""
+    def _chunked_concatenate(self, files: List[Path], output: Path) -> Path:
+        """Concatenate a very long list via stream-copied intermediates."""
+        intermediates: List[Path] = []
 
-        cmd = (
-            f'{self.ffmpeg_path} {overwrite_flag} '
-            f'-f concat -safe 0 -protocol_whitelist file,pipe '
-            f'-i <(echo -e "{file_list}") '
-            f'-c copy "{output}"'
-        )
+        try:
+            for i in range(0, len(files), self._MAX_LIST_LEN):
+                group = files[i:i + self._MAX_LIST_LEN]
+                with tempfile.NamedTemporaryFile(
+                    suffix=".mp4", delete=False
+                ) as f:
+                    intermediate = Path(f.name)
+                self.concatenate_with_list_file(group, intermediate)
+                intermediates.append(intermediate)
+
+            return self.concatenate_with_list_file(intermediates, output)
+
+        finally:
+            for intermediate in intermediates:
+                intermediate.unlink(missing_ok=True)
+
+    def concatenate_many(
+        self, jobs: List[Tuple[List[Path], Path]]
+    ) -> List[Path]:
+        """Run multiple concat jobs concurrently on the shared worker pool.
 
-        return cmd
+        Args:
+            jobs: List of (files, output) tuples.
+
+        Returns:
+            Output paths in the same order as the jobs.
+        """
+        pool = _get_pool()
+        futures = [
+            pool.submit(self.concatenate_with_list_file, files, output)
+            for files, output in jobs
+        ]
+        return [future.result() for future in futures]
 
     def concatenate_with_list_file(self, files: List[Path], output: Path) -> Path:
         """Concatenate using a temporary list file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".txt",
-            delete=False,
-        ) as f:
-            for file_path in files:
-                # Use absolute paths so ffmpeg can find files regardless of CWD
-                abs_path = Path(file_path).resolve()
-                f.write(f"file '{abs_path}'\n")
-            list_file = Path(f.name)
+        list_file = self._write_list_file(files)
 
         try:
             cmd = [
                 self.ffmpeg_path,
-                "-y" if self.overwrite else "",
+                *(["-y"] if self.overwrite else []),
                 "-f", "concat",
                 "-safe", "0",
+                # Regenerate missing PTS on the inputs so concat never
+                # needs an extra timestamp-fixing pass
+                "-fflags", "+genpts",
                 "-i", str(list_file),
                 "-c", "copy",
-                str(output),
+                *self._output_flags(output),
             ]
-            cmd = [c for c in cmd if c]
 
-            result = subprocess.run(cmd, capture_output=True, text=True)
+            self._run(cmd)
+            return output
+
+        finally:
+            list_file.unlink()
+
+    def concatenate_with_silent_audio(
+        self,
+        files: List[Path],
+        output: Path,
+        audio_codec: str = "aac",
+    ) -> Path:
+        """Concatenate video-only segments, adding one silent track.
+
+        For projects with no narration at all, this skips per-segment
+        audio muxing entirely: video streams are concat stream-copied
+        and a single anullsrc track covering the whole output is encoded
+        once, with -shortest trimming it to the video.
+        """
+        list_file = self._write_list_file(files)
 
-            if result.returncode != 0:
-                raise RuntimeError(f"FFmpeg failed: {result.stderr}")
+        try:
+            cmd = [
+                self.ffmpeg_path,
+                *(["-y"] if self.overwrite else []),
+                "-f", "concat",
+                "-safe", "0",
+                "-fflags", "+genpts",
+                "-i", str(list_file),
+                "-f", "lavfi", "-i", "anullsrc=r=44100:cl=stereo",
+                "-map", "0:v", "-map", "1:a",
+                "-c:v", "copy",
+                "-c:a", audio_codec,
+                "-shortest",
+                *self._output_flags(output),
+            ]
 
+            self._run(cmd)
             return output
 
         finally:
             list_file.unlink()
 
+    @staticmethod
+    def _write_list_file(files: List[Path]) -> Path:
+        """Write a concat-demuxer list file for the given inputs."""
+        # Use absolute paths so ffmpeg can find files regardless of CWD;
+        # escape single quotes per the concat demuxer quoting rules.
+        # Resolve everything up front and write in one buffered call.
+        lines = [
+            "file '{}'\n".format(str(Path(file_path).resolve()).replace("'", "'\\''"))
+            for file_path in files
+        ]
+
+        with tempfile.NamedTemporaryFile(
+            mode="w",
+            suffix=".txt",
+            delete=False,
+        ) as f:
+            f.writelines(lines)
+            f.flush()
+            os.fsync(f.fileno())
+            return Path(f.name)
+
+    @staticmethod
+    def _output_flags(output: Path) -> List[str]:
+        """Common output-side flags shared by the concat commands."""
+        return [
+            # Front-load the moov atom so players can start before the
+            # download finishes
+            *(
+                ["-movflags", "+faststart"]
+                if Path(output).suffix.lower() in {".mp4", ".m4v", ".mov"}
+                else []
+            ),
+            # Machine-readable key=value progress instead of the
+            # human-formatted stats banner
+            "-nostats",
+            "-loglevel", "error",
+            "-progress", "pipe:2",
+            str(output),
+        ]
+
+    @staticmethod
+    def _run(cmd: List[str]) -> None:
+        """Run an ffmpeg command, keeping only a bounded stderr tail.
+
+        ffmpeg emits progress lines proportional to input duration,
+        which capture_output would hold in memory in full. Lines stay
+        as bytes on the hot path; decode only on failure.
+        close_fds=False lets CPython use posix_spawn instead of
+        fork+exec, avoiding page-table duplication of a parent that
+        may hold large frame buffers mid-build.
+        """
+        proc = subprocess.Popen(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            close_fds=False,
+        )
+        stderr_tail: deque = deque(maxlen=200)
+        drain = threading.Thread(
+            target=stderr_tail.extend, args=(proc.stderr,), daemon=True
+        )
+        drain.start()
+        proc.wait()
+        drain.join()
+
+        if proc.returncode != 0:
+            tail = b"".join(stderr_tail).decode(errors="replace")
+            raise RuntimeError(f"FFmpeg failed: {tail}")
+
 
 @dataclass
 class MoviePyConcatenator(Concatenator):
-    """Concatenation using MoviePy."""
+    """Concatenation with automatic stream-copy / re-encode dispatch.
+
+    Historically this class decoded every clip in Python via MoviePy and
+    re-encoded the result frame by frame. It now probes input streams and
+    stream-copies via the concat demuxer when all inputs share the same
+    parameters, falling back to a single ffmpeg re-encode command when
+    the inputs need normalization. No frames pass through Python either way.
+    """
 
     fps: int = 30
     codec: str = "libx264"
     audio_codec: str = "aac"
     preset: str = "medium"
+    ffmpeg_path: str = "ffmpeg"
+    ffprobe_path: str = "ffprobe"
 
     def concatenate(
         self,
         files: List[Path],
         output: Path,
         config: Optional["ProjectConfig"] = None,
+        force_reencode: bool = False,
+    ) -> Path:
+        """Concatenate videos, stream-copying when inputs match.
+
+        The common "just concatenate files" case collapses to a single
+        ffmpeg concat-demuxer invocation instead of opening a decoder per
+        clip. Pass force_reencode=True to normalize inputs even when their
+        stream parameters already agree.
+        """
+        if not force_reencode and self._inputs_match(files):
+            return FFmpegConcatenator(
+                ffmpeg_path=self.ffmpeg_path
+            ).concatenate_with_list_file(files, output)
+
+        return self._reencode(files, output, config)
+
+    def _tree_concat(
+        self,
+        files: List[Path],
+        output: Path,
+        chunk: int = 20,
     ) -> Path:
-        """Concatenate videos using MoviePy."""
-        clips = [VideoFileClip(str(f)) for f in files]
+        """Concatenate in a tree to bound peak open file handles.
+
+        Splits files into groups of at most `chunk`, stream-copies each
+        group to an intermediate MP4, then concatenates the intermediates
+        (recursing if needed). Peak simultaneously-open inputs drops from
+        N to `chunk` for very long file lists.
+        """
+        if len(files) <= chunk:
+            return FFmpegConcatenator(
+                ffmpeg_path=self.ffmpeg_path
+            ).concatenate_with_list_file(files, output)
+
+        concatenator = FFmpegConcatenator(ffmpeg_path=self.ffmpeg_path)
+        intermediates: List[Path] = []
 
         try:
-            final = concatenate_videoclips(clips, method="compose")
-
-            fps = config.fps if config else self.fps
-            codec = config.codec if config else self.codec
-            audio_codec = config.audio_codec if config else self.audio_codec
-
-            final.write_videofile(
-                str(output),
-                fps=fps,
-                codec=codec,
-                audio_codec=audio_codec,
-                preset=self.preset,
-            )
+            for i in range(0, len(files), chunk):
+                group = files[i:i + chunk]
+                with tempfile.NamedTemporaryFile(
+                    suffix=".mp4", delete=False
+                ) as f:
+                    intermediate = Path(f.name)
+                concatenator.concatenate_with_list_file(group, intermediate)
+                intermediates.append(intermediate)
 
-            return output
+            return self._tree_concat(list(intermediates), output, chunk)
 
         finally:
-            for clip in clips:
-                clip.close()
-            if "final" in locals():
-                final.close()
+            for intermediate in intermediates:
+                intermediate.unlink(missing_ok=True)
+
+    def _probe(self, file: Path) -> Optional[list]:
+        """Get stream parameters for a file via ffprobe."""
+        result = subprocess.run(
+            [
+                self.ffprobe_path, "-v", "error",
+                "-show_entries",
+                "stream=codec_name,width,height,r_frame_rate,sample_rate,channels",
+                "-of", "json",
+                str(file),
+            ],
+            capture_output=True,
+            text=True,
+        )
+
+        if result.returncode != 0:
+            return None
+
+        return json.loads(result.stdout).get("streams")
+
+    def _inputs_match(self, files: List[Path]) -> bool:
+        """Check if all inputs share codec/geometry/audio parameters."""
+        first = None
+        for file in files:
+            streams = self._probe(file)
+            if streams is None:
+                return False
+            if first is None:
+                first = streams
+            elif streams != first:
+                return False
+        return first is not None
+
+    def _has_audio(self, file: Path) -> bool:
+        """Whether the file contains at least one audio stream."""
+        result = subprocess.run(
+            [
+                self.ffprobe_path, "-v", "error",
+                "-select_streams", "a",
+                "-show_entries", "stream=codec_type",
+                "-of", "csv=p=0",
+                str(file),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        return result.returncode == 0 and bool(result.stdout.strip())
+
+    def _duration(self, file: Path) -> float:
+        """Container duration in seconds, 0.0 when unknown."""
+        result = subprocess.run(
+            [
+                self.ffprobe_path, "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "csv=p=0",
+                str(file),
+            ],
+            capture_output=True,
+            text=True,
+        )
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            return 0.0
+
+    def _reencode(
+        self,
+        files: List[Path],
+        output: Path,
+        config: Optional["ProjectConfig"] = None,
+    ) -> Path:
+        """Normalize mismatched inputs with a single ffmpeg re-encode.
+
+        Inputs may disagree on audio as well as video parameters —
+        Layer 2 segment caches are written without audio — so each
+        input's audio leg is normalized to one common format, with
+        silence injected for audio-less files, and the audio leg is
+        dropped entirely when no input carries audio.
+        """
+        fps = config.fps if config else self.fps
+        codec = config.codec if config else self.codec
+        audio_codec = config.audio_codec if config else self.audio_codec
+
+        cmd = [self.ffmpeg_path, "-y"]
+        for file in files:
+            cmd += ["-i", str(file)]
+
+        has_audio = [self._has_audio(file) for file in files]
+        use_audio = any(has_audio)
+        _AFORMAT = (
+            "aformat=sample_fmts=fltp"
+            ":sample_rates=44100:channel_layouts=stereo"
+        )
+
+        chains: List[str] = []
+        legs: List[str] = []
+        for i, present in enumerate(has_audio):
+            if not use_audio:
+                legs.append(f"[{i}:v]")
+            elif present:
+                chains.append(f"[{i}:a]aresample=44100,{_AFORMAT}[a{i}]")
+                legs.append(f"[{i}:v][a{i}]")
+            else:
+                chains.append(
+                    f"anullsrc=r=44100:cl=stereo,{_AFORMAT},"
+                    f"atrim=duration={self._duration(files[i]):.3f}[a{i}]"
+                )
+                legs.append(f"[{i}:v][a{i}]")
+
+        concat = (
+            "".join(legs)
+            + f"concat=n={len(files)}:v=1:a={int(use_audio)}[v]"
+            + ("[a]" if use_audio else "")
+        )
+        filtergraph = ";".join(chains + [concat])
+
+        cmd += [
+            "-filter_complex", filtergraph,
+            "-map", "[v]",
+            *(["-map", "[a]"] if use_audio else []),
+            "-r", str(fps),
+            "-c:v", codec,
+            "-preset", self.preset,
+            *(["-c:a", audio_codec] if use_audio else []),
+            str(output),
+        ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+
+        if result.returncode != 0:
+            raise RuntimeError(f"FFmpeg failed: {result.stderr}")
+
+        return output
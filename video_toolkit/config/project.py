@@ -9,17 +9,25 @@ from typing import Union, Optional
 from .resolution import Resolution
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ProjectConfig:
     """
     Configuration for a video project.
 
+    Frozen with __slots__: attribute reads skip the instance __dict__,
+    instances are hashable (usable as cache keys), and configs can't be
+    mutated after the derived values are snapshotted.
+
     Attributes:
         resolution: Video resolution (enum or string like 'draft', 'standard', 'high')
         fps: Frames per second (default: 30)
         codec: Video codec (default: libx264)
         audio_codec: Audio codec (default: aac)
         preset: Encoding preset (default: medium)
+        intermediate_preset: Preset for intermediate cache encodes
+            (default: ultrafast). Segment caches are stream-copied into
+            the final export, so their quality carries through; the
+            speed/size trade-off is deliberate.
         output_dir: Directory for output files
         cache_dir: Directory for cache files
     """
@@ -29,36 +37,50 @@ class ProjectConfig:
     codec: str = "libx264"
     audio_codec: str = "aac"
     preset: str = "medium"
+    intermediate_preset: str = "ultrafast"
     output_dir: Path = field(default_factory=lambda: Path("./output"))
     cache_dir: Path = field(default_factory=lambda: Path("./cache"))
+    _width: int = field(init=False, repr=False, compare=False)
+    _height: int = field(init=False, repr=False, compare=False)
+    _dimensions: tuple = field(init=False, repr=False, compare=False)
+    _scale_factor: float = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Convert string resolution to enum."""
         if isinstance(self.resolution, str):
-            self.resolution = Resolution.from_string(self.resolution)
+            object.__setattr__(
+                self, "resolution", Resolution.from_string(self.resolution)
+            )
 
         # Ensure paths are Path objects
         if isinstance(self.output_dir, str):
-            self.output_dir = Path(self.output_dir)
+            object.__setattr__(self, "output_dir", Path(self.output_dir))
         if isinstance(self.cache_dir, str):
-            self.cache_dir = Path(self.cache_dir)
+            object.__setattr__(self, "cache_dir", Path(self.cache_dir))
+
+        # Snapshot derived resolution values so hot paths read plain
+        # attributes instead of chaining through two property layers
+        object.__setattr__(self, "_width", self.resolution.width)
+        object.__setattr__(self, "_height", self.resolution.height)
+        object.__setattr__(self, "_dimensions", self.resolution.dimensions)
+        object.__setattr__(self, "_scale_factor", self.resolution.scale_factor)
 
     @property
     def width(self) -> int:
         """Video width in pixels."""
-        return self.resolution.width
+        return self._width
 
     @property
     def height(self) -> int:
         """Video height in pixels."""
-        return self.resolution.height
+        return self._height
 
     @property
     def dimensions(self) -> tuple:
         """Video dimensions as (width, height)."""
-        return self.resolution.dimensions
+        return self._dimensions
 
     @property
     def scale_factor(self) -> float:
         """Scale factor relative to 1080p."""
-        return self.resolution.scale_factor
+        return self._scale_factor
@@ -3,6 +3,7 @@ Resolution presets for video generation.
 """
 
 from enum import Enum
+from types import MappingProxyType
 from typing import Tuple
 
 
@@ -16,6 +17,10 @@ class Resolution(Enum):
     def __init__(self, width: int, height: int):
         self._width = width
         self._height = height
+        # Precompute derived values once at enum creation so hot paths
+        # don't rebuild tuples or redo the division per access
+        self._dimensions = (width, height)
+        self._scale_factor = height / 1080
 
     @property
     def width(self) -> int:
@@ -30,12 +35,12 @@ class Resolution(Enum):
     @property
     def dimensions(self) -> Tuple[int, int]:
         """Return (width, height) tuple."""
-        return (self._width, self._height)
+        return self._dimensions
 
     @property
     def scale_factor(self) -> float:
         """Scale factor relative to 1080p baseline."""
-        return self._height / 1080
+        return self._scale_factor
 
     @classmethod
     def from_string(cls, name: str) -> "Resolution":
@@ -56,17 +61,18 @@ class Resolution(Enum):
         Raises:
             ValueError: If name is not recognized
         """
-        name_lower = name.lower()
-        mapping = {
-            "draft": cls.DRAFT,
-            "standard": cls.HD_1080,
-            "1080p": cls.HD_1080,
-            "high": cls.HD_2K,
-            "2k": cls.HD_2K,
-        }
-
-        if name_lower not in mapping:
-            valid = ", ".join(mapping.keys())
-            raise ValueError(f"Unknown resolution '{name}'. Valid: {valid}")
-
-        return mapping[name_lower]
+        try:
+            return _NAME_TO_RESOLUTION[name.lower()]
+        except KeyError:
+            valid = ", ".join(_NAME_TO_RESOLUTION)
+            raise ValueError(f"Unknown resolution '{name}'. Valid: {valid}") from None
+
+
+# Built once at import instead of per from_string call
+_NAME_TO_RESOLUTION = MappingProxyType({
+    "draft": Resolution.DRAFT,
+    "standard": Resolution.HD_1080,
+    "1080p": Resolution.HD_1080,
+    "high": Resolution.HD_2K,
+    "2k": Resolution.HD_2K,
+})
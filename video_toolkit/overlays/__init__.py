@@ -8,12 +8,14 @@ Overlays add visual elements on top of video content:
 """
 
 from .base import Overlay
+from .stack import OverlayStack
 from .title_bar import TitleBarOverlay
 from .subtitle import SubtitleOverlay
 from .watermark import WatermarkOverlay
 
 __all__ = [
     "Overlay",
+    "OverlayStack",
     "TitleBarOverlay",
     "SubtitleOverlay",
     "WatermarkOverlay",
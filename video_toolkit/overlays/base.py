@@ -4,7 +4,7 @@ Base class for overlays.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Any, Dict, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
@@ -33,6 +33,49 @@ class Overlay(ABC):
         """
         pass
 
+    def is_static(self) -> bool:
+        """Whether this overlay is constant for a segment's duration.
+
+        Static overlays can be pre-baked into a single RGBA canvas and
+        composited once per segment instead of once per frame.
+        """
+        return False
+
+    def render_static(self, canvas: Any, config: "ProjectConfig") -> None:
+        """Draw this overlay onto a shared full-frame RGBA PIL canvas.
+
+        Only called when is_static() returns True.
+        """
+        raise NotImplementedError
+
+    def bbox(self, config: "ProjectConfig") -> Optional[tuple]:
+        """Bounding rect (x0, y0, x1, y1) this overlay draws into.
+
+        None means the extent isn't known ahead of rendering (e.g.
+        text whose size depends on rasterization), in which case the
+        overlay is never considered for occlusion culling.
+        """
+        return None
+
+    def is_opaque(self) -> bool:
+        """Whether this overlay fully covers its bounding rect.
+
+        Opaque overlays hide anything drawn below them inside bbox(),
+        letting the compositor skip those draws entirely.
+        """
+        return False
+
+    def to_ffmpeg_filter(self, config: "ProjectConfig") -> Optional[str]:
+        """Return an ffmpeg filter expression drawing this overlay.
+
+        Lets the segment build run the overlay pass inside ffmpeg's C
+        filters instead of Python-space CompositeVideoClip blending.
+        Returns an empty string when there is nothing to draw, or None
+        when this overlay has no filter equivalent (callers must fall
+        back to compose()).
+        """
+        return None
+
     @abstractmethod
     def get_scaled_dimensions(self, config: "ProjectConfig") -> Dict[str, int]:
         """
@@ -45,3 +88,17 @@ class Overlay(ABC):
             Dict with scaled dimension values
         """
         pass
+
+
+def drawtext_escape(text: str) -> str:
+    """Escape text for embedding in a single-quoted drawtext option.
+
+    Callers emit the result as text='...'. Two parsers then see it:
+    the filtergraph parser, for which the surrounding quotes make
+    everything literal except ' itself — closed, escaped and reopened
+    as '\\'' (the same sequence the concat list writer emits) — and
+    drawtext's own text expansion, for which backslash and % need a
+    backslash.
+    """
+    text = text.replace("\\", "\\\\").replace("%", "\\%")
+    return text.replace("'", "'\\''")
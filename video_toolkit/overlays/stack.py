@@ -0,0 +1,44 @@
+"""Single-pass overlay compositing."""
+
+from dataclasses import dataclass, field
+from typing import Any, List, TYPE_CHECKING
+
+from moviepy import CompositeVideoClip
+
+from .base import Overlay
+
+if TYPE_CHECKING:
+    from video_toolkit.config import ProjectConfig
+
+
+@dataclass
+class OverlayStack:
+    """Applies a set of overlays in one CompositeVideoClip pass.
+
+    Compositing each overlay separately re-blends the full frame once per
+    overlay. The stack collects every overlay's sprites and builds a single
+    composite, so the frame is blended once regardless of overlay count.
+    """
+
+    overlays: List[Overlay] = field(default_factory=list)
+
+    def add_overlay(self, overlay: Overlay) -> None:
+        """Add an overlay to the stack."""
+        self.overlays.append(overlay)
+
+    def apply(self, clip: Any, config: "ProjectConfig") -> Any:
+        """Apply all overlays to a clip in a single composite pass."""
+        sprites: List[Any] = []
+
+        for overlay in self.overlays:
+            render = getattr(overlay, "render_sprites", None)
+            if render is not None:
+                sprites.extend(render(config, clip.duration))
+            else:
+                # Overlays without sprite support keep their own pass
+                clip = overlay.apply(clip, config)
+
+        if not sprites:
+            return clip
+
+        return CompositeVideoClip([clip, *sprites], size=config.dimensions)
@@ -1,17 +1,44 @@
 """Subtitle overlay implementation."""
 
+import functools
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 from moviepy import CompositeVideoClip
+from PIL import Image
 
-from .base import Overlay
-from video_toolkit.utils import create_text_clip, rgb_to_string
+from .base import Overlay, drawtext_escape
+from video_toolkit.utils import (
+    create_text_clip,
+    render_text_sprite,
+    resolve_font_path,
+    rgb_to_string,
+    wrap_text,
+)
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
 
 
+@functools.lru_cache(maxsize=64)
+def _scaled(
+    font_size: int,
+    max_width: int,
+    margin_bottom: int,
+    stroke_width: int,
+    background_padding: int,
+    scale: float,
+) -> Tuple[int, int, int, int, int]:
+    """Scale subtitle dimensions, memoized per (dimensions, scale)."""
+    return (
+        int(font_size * scale),
+        int(max_width * scale),
+        int(margin_bottom * scale),
+        int(stroke_width * scale),
+        int(background_padding * scale),
+    )
+
+
 @dataclass
 class SubtitleOverlay(Overlay):
     """Subtitle/narration text overlay."""
@@ -28,21 +55,34 @@ class SubtitleOverlay(Overlay):
     background_color: Tuple[int, int, int, int] = (255, 255, 255, 200)
     background_padding: int = 10
 
+    def __post_init__(self):
+        # Pre-format MoviePy color strings once instead of per apply
+        self._text_color_str = rgb_to_string(self.text_color)
+        self._stroke_color_str = rgb_to_string(self.stroke_color)
+
     def apply(self, clip: Any, config: "ProjectConfig") -> Any:
         """Apply subtitle overlay to clip."""
-        if not self.text:
+        sprites = self.render_sprites(config, clip.duration)
+        if not sprites:
             return clip
 
+        return CompositeVideoClip([clip, *sprites], size=config.dimensions)
+
+    def render_sprites(self, config: "ProjectConfig", duration: float) -> list:
+        """Build positioned subtitle sprites for a single composite pass."""
+        if not self.text:
+            return []
+
         dims = self.get_scaled_dimensions(config)
 
         txt = create_text_clip(
             text=self.text,
             font_size=dims["font_size"],
-            color=rgb_to_string(self.text_color),
+            color=self._text_color_str,
             font=self.font,
-            stroke_color=rgb_to_string(self.stroke_color) if self.stroke_width else None,
+            stroke_color=self._stroke_color_str if self.stroke_width else None,
             stroke_width=dims["stroke_width"],
-            duration=clip.duration,
+            duration=duration,
             max_width=dims["max_width"],
             text_align="center",
         )
@@ -50,17 +90,79 @@ class SubtitleOverlay(Overlay):
         x = (config.width - txt.w) // 2
         y = config.height - dims["margin_bottom"] - txt.h
 
-        txt = txt.with_position((x, y))
+        return [txt.with_position((x, y))]
+
+    def is_static(self) -> bool:
+        """Subtitle text is constant for the segment's duration."""
+        return True
+
+    def render_static(self, canvas: Image.Image, config: "ProjectConfig") -> None:
+        """Draw the subtitle onto a shared full-frame RGBA canvas."""
+        if not self.text:
+            return
+
+        dims = self.get_scaled_dimensions(config)
+        text = wrap_text(self.text, self.font, dims["font_size"], dims["max_width"])
 
-        return CompositeVideoClip([clip, txt], size=config.dimensions)
+        sprite = Image.fromarray(render_text_sprite(
+            text,
+            self.font,
+            dims["font_size"],
+            self._text_color_str,
+            self._stroke_color_str if self.stroke_width else None,
+            dims["stroke_width"],
+            (10, 10),
+            "center",
+        ))
+
+        x = (config.width - sprite.width) // 2
+        y = config.height - dims["margin_bottom"] - sprite.height
+
+        canvas.alpha_composite(sprite, (x, y))
+
+    def to_ffmpeg_filter(self, config: "ProjectConfig") -> Optional[str]:
+        """Express the subtitle as a centered drawtext ffmpeg filter."""
+        if not self.text:
+            return ""
+
+        font_path = resolve_font_path(self.font)
+        if font_path is None:
+            return None
+
+        dims = self.get_scaled_dimensions(config)
+        text = wrap_text(self.text, self.font, dims["font_size"], dims["max_width"])
+
+        r, g, b = self.text_color
+        parts = [
+            f"drawtext=fontfile={font_path}",
+            f"text='{drawtext_escape(text)}'",
+            f"fontsize={dims['font_size']}",
+            f"fontcolor=0x{r:02x}{g:02x}{b:02x}",
+            "x=(w-tw)/2",
+            f"y=h-{dims['margin_bottom']}-th",
+        ]
+
+        if self.stroke_width:
+            sr, sg, sb = self.stroke_color
+            parts.append(f"borderw={dims['stroke_width']}")
+            parts.append(f"bordercolor=0x{sr:02x}{sg:02x}{sb:02x}")
+
+        return ":".join(parts)
 
     def get_scaled_dimensions(self, config: "ProjectConfig") -> Dict[str, int]:
         """Get scaled dimensions for resolution."""
-        scale = config.scale_factor
+        font_size, max_width, margin_bottom, stroke_width, background_padding = _scaled(
+            self.font_size,
+            self.max_width,
+            self.margin_bottom,
+            self.stroke_width,
+            self.background_padding,
+            config.scale_factor,
+        )
         return {
-            "font_size": int(self.font_size * scale),
-            "max_width": int(self.max_width * scale),
-            "margin_bottom": int(self.margin_bottom * scale),
-            "stroke_width": int(self.stroke_width * scale),
-            "background_padding": int(self.background_padding * scale),
+            "font_size": font_size,
+            "max_width": max_width,
+            "margin_bottom": margin_bottom,
+            "stroke_width": stroke_width,
+            "background_padding": background_padding,
         }
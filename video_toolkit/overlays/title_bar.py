@@ -1,17 +1,39 @@
 """Title bar overlay implementation."""
 
+import functools
 from dataclasses import dataclass
-from typing import Any, Dict, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Optional, Tuple, TYPE_CHECKING
 
 from moviepy import CompositeVideoClip, ColorClip
+from PIL import Image
 
-from .base import Overlay
-from video_toolkit.utils import create_text_clip, rgb_to_string
+from .base import Overlay, drawtext_escape
+from video_toolkit.utils import (
+    create_text_clip,
+    render_text_sprite,
+    resolve_font_path,
+    rgb_to_string,
+)
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
 
 
+@functools.lru_cache(maxsize=64)
+def _scaled(
+    height: int,
+    font_size: int,
+    padding: int,
+    scale: float,
+) -> Tuple[int, int, int]:
+    """Scale title-bar dimensions, memoized per (dimensions, scale)."""
+    return (
+        int(height * scale),
+        int(font_size * scale),
+        int(padding * scale),
+    )
+
+
 @dataclass
 class TitleBarOverlay(Overlay):
     """Title/section bar overlay."""
@@ -25,44 +47,185 @@ class TitleBarOverlay(Overlay):
     padding: int = 20
     font: str = "Arial"
 
+    def __post_init__(self):
+        # Pre-format the MoviePy color string once instead of per apply
+        self._text_color_str = rgb_to_string(self.text_color)
+
     def apply(self, clip: Any, config: "ProjectConfig") -> Any:
         """Apply title bar overlay to clip."""
-        dims = self.get_scaled_dimensions(config)
+        sprites = self.render_sprites(config, clip.duration)
 
-        bar = ColorClip(
-            size=(config.width, dims["height"]),
-            color=self.background_color[:3],
-        ).with_duration(clip.duration)
+        # Nothing to draw: skip the full-resolution composite pass entirely
+        if not sprites:
+            return clip
 
-        if len(self.background_color) == 4:
-            bar = bar.with_opacity(self.background_color[3] / 255)
+        return CompositeVideoClip([clip, *sprites], size=config.dimensions)
 
-        txt = create_text_clip(
-            text=self.text,
-            font_size=dims["font_size"],
-            color=rgb_to_string(self.text_color),
-            font=self.font,
-            duration=clip.duration,
+    def render_sprites(self, config: "ProjectConfig", duration: float) -> list:
+        """Build positioned title-bar sprites for a single composite pass."""
+        bar_visible = (
+            len(self.background_color) < 4 or self.background_color[3] > 0
         )
 
-        # Position text with proper vertical centering
+        if not self.text and not bar_visible:
+            return []
+
+        dims = self.get_scaled_dimensions(config)
+
         if self.position == "top":
             bar_y = 0
-            text_y = max(5, (dims["height"] - txt.h) // 2)
         else:
             bar_y = config.height - dims["height"]
+
+        sprites = []
+
+        if bar_visible:
+            bar = ColorClip(
+                size=(config.width, dims["height"]),
+                color=self.background_color[:3],
+            ).with_duration(duration)
+
+            if len(self.background_color) == 4:
+                bar = bar.with_opacity(self.background_color[3] / 255)
+
+            sprites.append(bar.with_position((0, bar_y)))
+
+        if self.text:
+            txt = create_text_clip(
+                text=self.text,
+                font_size=dims["font_size"],
+                color=self._text_color_str,
+                font=self.font,
+                duration=duration,
+            )
+
+            # Position text with proper vertical centering
             text_y = bar_y + max(5, (dims["height"] - txt.h) // 2)
+            sprites.append(txt.with_position((dims["padding"], text_y)))
+
+        return sprites
+
+    def is_static(self) -> bool:
+        """Title-bar text and background are constant per segment."""
+        return True
+
+    def render_static(self, canvas: Image.Image, config: "ProjectConfig") -> None:
+        """Draw the title bar onto a shared full-frame RGBA canvas."""
+        bar_visible = (
+            len(self.background_color) < 4 or self.background_color[3] > 0
+        )
+
+        if not self.text and not bar_visible:
+            return
 
-        bar = bar.with_position((0, bar_y))
-        txt = txt.with_position((dims["padding"], text_y))
+        dims = self.get_scaled_dimensions(config)
+
+        if self.position == "top":
+            bar_y = 0
+        else:
+            bar_y = config.height - dims["height"]
 
-        return CompositeVideoClip([clip, bar, txt], size=config.dimensions)
+        if bar_visible:
+            alpha = (
+                self.background_color[3]
+                if len(self.background_color) == 4
+                else 255
+            )
+            bar = Image.new(
+                "RGBA",
+                (config.width, dims["height"]),
+                (*self.background_color[:3], alpha),
+            )
+            canvas.alpha_composite(bar, (0, bar_y))
+
+        if self.text:
+            sprite = Image.fromarray(render_text_sprite(
+                self.text,
+                self.font,
+                dims["font_size"],
+                self._text_color_str,
+                None,
+                0,
+                (10, 10),
+                "center",
+            ))
+
+            text_y = bar_y + max(5, (dims["height"] - sprite.height) // 2)
+            canvas.alpha_composite(sprite, (dims["padding"], text_y))
+
+    def bbox(self, config: "ProjectConfig") -> Optional[tuple]:
+        """The full-width strip the bar occupies, or None without a bar."""
+        bar_visible = (
+            len(self.background_color) < 4 or self.background_color[3] > 0
+        )
+        if not bar_visible:
+            return None
+
+        dims = self.get_scaled_dimensions(config)
+        bar_y = 0 if self.position == "top" else config.height - dims["height"]
+        return (0, bar_y, config.width, bar_y + dims["height"])
+
+    def is_opaque(self) -> bool:
+        """Opaque only when the bar has a fully opaque background."""
+        return len(self.background_color) < 4 or self.background_color[3] == 255
+
+    def to_ffmpeg_filter(self, config: "ProjectConfig") -> Optional[str]:
+        """Express the title bar as drawbox + drawtext ffmpeg filters."""
+        bar_visible = (
+            len(self.background_color) < 4 or self.background_color[3] > 0
+        )
+
+        if not self.text and not bar_visible:
+            return ""
+
+        dims = self.get_scaled_dimensions(config)
+
+        if self.position == "top":
+            bar_y = 0
+        else:
+            bar_y = config.height - dims["height"]
+
+        filters = []
+
+        if bar_visible:
+            alpha = (
+                self.background_color[3] / 255
+                if len(self.background_color) == 4
+                else 1.0
+            )
+            r, g, b = self.background_color[:3]
+            filters.append(
+                f"drawbox=x=0:y={bar_y}:w=iw:h={dims['height']}"
+                f":color=0x{r:02x}{g:02x}{b:02x}@{alpha:.3f}:t=fill"
+            )
+
+        if self.text:
+            font_path = resolve_font_path(self.font)
+            if font_path is None:
+                return None
+
+            r, g, b = self.text_color
+            filters.append(
+                f"drawtext=fontfile={font_path}"
+                f":text='{drawtext_escape(self.text)}'"
+                f":fontsize={dims['font_size']}"
+                f":fontcolor=0x{r:02x}{g:02x}{b:02x}"
+                f":x={dims['padding']}"
+                f":y={bar_y}+max(5\\,({dims['height']}-th)/2)"
+            )
+
+        return ",".join(filters)
 
     def get_scaled_dimensions(self, config: "ProjectConfig") -> Dict[str, int]:
         """Get scaled dimensions for resolution."""
-        scale = config.scale_factor
+        height, font_size, padding = _scaled(
+            self.height,
+            self.font_size,
+            self.padding,
+            config.scale_factor,
+        )
         return {
-            "height": int(self.height * scale),
-            "font_size": int(self.font_size * scale),
-            "padding": int(self.padding * scale),
+            "height": height,
+            "font_size": font_size,
+            "padding": padding,
         }
@@ -1,17 +1,38 @@
 """Watermark overlay implementation."""
 
+import functools
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Optional, Tuple, Union, TYPE_CHECKING
 
-from moviepy import CompositeVideoClip, TextClip, ImageClip
+from moviepy import CompositeVideoClip, ImageClip
 
-from .base import Overlay
+from .base import Overlay, drawtext_escape
+from video_toolkit.utils import create_text_clip, resolve_font_path, rgb_to_string
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
 
 
+# Position formulas resolved once per overlay instead of rebuilding a
+# dict per apply; each takes (watermark_size, video_size, margin)
+_POSITION_FNS = {
+    "top_left": lambda wm, vid, m: (m, m),
+    "top_right": lambda wm, vid, m: (vid[0] - wm[0] - m, m),
+    "bottom_left": lambda wm, vid, m: (m, vid[1] - wm[1] - m),
+    "bottom_right": lambda wm, vid, m: (vid[0] - wm[0] - m, vid[1] - wm[1] - m),
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _scaled(font_size: int, margin: int, scale: float) -> Tuple[int, int]:
+    """Scale watermark dimensions, memoized per (dimensions, scale)."""
+    return (
+        int(font_size * scale),
+        int(margin * scale),
+    )
+
+
 @dataclass
 class WatermarkOverlay(Overlay):
     """Watermark/logo overlay."""
@@ -25,17 +46,26 @@ class WatermarkOverlay(Overlay):
     margin: int = 20
     font: str = "Arial"
 
+    def __post_init__(self):
+        # Resolve the position formula once for the overlay's lifetime
+        self._pos_fn = _POSITION_FNS.get(
+            self.position, _POSITION_FNS["bottom_right"]
+        )
+
     def apply(self, clip: Any, config: "ProjectConfig") -> Any:
         """Apply watermark overlay to clip."""
         dims = self.get_scaled_dimensions(config)
 
         if self.text:
-            watermark = TextClip(
+            # create_text_clip serves repeated watermark text from the
+            # shared sprite cache instead of re-rasterizing per segment
+            watermark = create_text_clip(
                 text=self.text,
                 font_size=dims["font_size"],
-                color=f"rgb{self.text_color}",
+                color=rgb_to_string(self.text_color),
                 font=self.font,
-            ).with_duration(clip.duration).with_opacity(self.opacity)
+                duration=clip.duration,
+            ).with_opacity(self.opacity)
 
         elif self.image_path:
             image_path = Path(self.image_path)
@@ -65,22 +95,66 @@ class WatermarkOverlay(Overlay):
         margin: int,
     ) -> Tuple[int, int]:
         """Calculate watermark position based on position setting."""
-        wm_w, wm_h = watermark_size
-        vid_w, vid_h = video_size
-
-        positions = {
-            "top_left": (margin, margin),
-            "top_right": (vid_w - wm_w - margin, margin),
-            "bottom_left": (margin, vid_h - wm_h - margin),
-            "bottom_right": (vid_w - wm_w - margin, vid_h - wm_h - margin),
-        }
+        return self._pos_fn(watermark_size, video_size, margin)
 
-        return positions.get(self.position, positions["bottom_right"])
+    def to_ffmpeg_filter(self, config: "ProjectConfig") -> Optional[str]:
+        """Express the watermark as a drawtext or overlay ffmpeg filter."""
+        dims = self.get_scaled_dimensions(config)
+        margin = dims["margin"]
+
+        if self.text:
+            font_path = resolve_font_path(self.font)
+            if font_path is None:
+                return None
+
+            # drawtext coordinates: w/h frame size, tw/th text size
+            positions = {
+                "top_left": (str(margin), str(margin)),
+                "top_right": (f"w-tw-{margin}", str(margin)),
+                "bottom_left": (str(margin), f"h-th-{margin}"),
+                "bottom_right": (f"w-tw-{margin}", f"h-th-{margin}"),
+            }
+            x, y = positions.get(self.position, positions["bottom_right"])
+
+            r, g, b = self.text_color
+            return (
+                f"drawtext=fontfile={font_path}"
+                f":text='{drawtext_escape(self.text)}'"
+                f":fontsize={dims['font_size']}"
+                f":fontcolor=0x{r:02x}{g:02x}{b:02x}@{self.opacity:.3f}"
+                f":x={x}:y={y}"
+            )
+
+        if self.image_path:
+            image_path = Path(self.image_path)
+            if not image_path.exists():
+                raise FileNotFoundError(f"Watermark image not found: {image_path}")
+
+            # overlay coordinates: W/H main frame, w/h watermark image
+            positions = {
+                "top_left": (str(margin), str(margin)),
+                "top_right": (f"W-w-{margin}", str(margin)),
+                "bottom_left": (str(margin), f"H-h-{margin}"),
+                "bottom_right": (f"W-w-{margin}", f"H-h-{margin}"),
+            }
+            x, y = positions.get(self.position, positions["bottom_right"])
+
+            return (
+                f"movie={image_path},format=rgba,"
+                f"colorchannelmixer=aa={self.opacity:.3f}[wm];"
+                f"[in][wm]overlay=x={x}:y={y}"
+            )
+
+        return ""
 
     def get_scaled_dimensions(self, config: "ProjectConfig") -> Dict[str, int]:
         """Get scaled dimensions for resolution."""
-        scale = config.scale_factor
+        font_size, margin = _scaled(
+            self.font_size,
+            self.margin,
+            config.scale_factor,
+        )
         return {
-            "font_size": int(self.font_size * scale),
-            "margin": int(self.margin * scale),
+            "font_size": font_size,
+            "margin": margin,
         }
@@ -1,5 +1,8 @@
 """VideoProject - Main orchestrator for video generation."""
 
+import functools
+import shutil
+import threading
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Dict, List, Optional, Union, TYPE_CHECKING
@@ -7,9 +10,11 @@ from typing import Dict, List, Optional, Union, TYPE_CHECKING
 from moviepy import VideoFileClip, AudioFileClip
 
 from .config import ProjectConfig, Resolution
-from .cache import CacheManager
+from .cache import CacheManager, SegStatus
 from .composition import AudioSync, Compositor, FFmpegConcatenator
 from .overlays import TitleBarOverlay, SubtitleOverlay
+from .utils import set_text_cache_dir
+from .utils.ffmpeg_worker import shared_worker
 
 if TYPE_CHECKING:
     from .segments import Segment
@@ -19,6 +24,70 @@ if TYPE_CHECKING:
 
 _USE_DEFAULT_TTS = object()  # Sentinel for default TTS engine
 
+# Hardware h264 encoders in preference order
+_HW_ENCODERS = ("h264_nvenc", "h264_qsv", "h264_videotoolbox")
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_hw_encoder() -> Optional[str]:
+    """Pick a hardware h264 encoder if ffmpeg has a working one.
+
+    A listed encoder can still fail at runtime (driver or device
+    missing), so candidates are verified with a tiny null encode before
+    being selected. Returns None when only libx264 is usable.
+    """
+    import subprocess
+
+    if shutil.which("ffmpeg") is None:
+        return None
+
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            capture_output=True, text=True, timeout=10,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+
+    for encoder in _HW_ENCODERS:
+        if encoder not in result.stdout:
+            continue
+        try:
+            probe = subprocess.run(
+                [
+                    "ffmpeg", "-hide_banner",
+                    "-f", "lavfi", "-i", "color=c=black:s=64x64:d=0.1",
+                    "-c:v", encoder,
+                    "-f", "null", "-",
+                ],
+                capture_output=True, timeout=15,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            continue
+        if probe.returncode == 0:
+            return encoder
+
+    return None
+
+_SILENT_BUFFER = None  # Shared zeros buffer for the MoviePy silence fallback
+
+
+def _make_silence(t):
+    """Constant-silence sampler returning views of one shared buffer.
+
+    MoviePy calls the sampler thousands of times per segment; returning
+    slices of a preallocated zeros array avoids an allocation per call.
+    Only used when the anullsrc stream-copy mux isn't available.
+    """
+    global _SILENT_BUFFER
+    import numpy as np
+
+    if isinstance(t, np.ndarray):
+        if _SILENT_BUFFER is None or len(_SILENT_BUFFER) < len(t):
+            _SILENT_BUFFER = np.zeros((max(len(t), 44100), 2))
+        return _SILENT_BUFFER[: len(t)]
+    return np.zeros(2)
+
 
 class VideoProject:
     """Main orchestrator for video generation projects."""
@@ -32,13 +101,18 @@ class VideoProject:
         output_dir: Union[str, Path] = "./output",
         cache_dir: Union[str, Path] = "./cache",
         fps: int = 30,
+        codec: Optional[str] = None,
         remotion_config: Optional["RemotionConfig"] = None,
+        max_workers: Optional[int] = None,
     ):
+        # Explicit codec wins; otherwise prefer a verified hardware
+        # encoder over CPU libx264
         self.config = ProjectConfig(
             resolution=resolution,
             output_dir=Path(output_dir),
             cache_dir=Path(cache_dir),
             fps=fps,
+            codec=codec or _detect_hw_encoder() or "libx264",
         )
 
         if tts_engine is _USE_DEFAULT_TTS:
@@ -48,15 +122,49 @@ class VideoProject:
             self.tts_engine = tts_engine
         self.default_overlays = default_overlays or {}
         self.overlay_styles = overlay_styles or {}
+        # Builds mostly wait on ffmpeg/node subprocesses, so a few
+        # workers overlap cleanly while sharing one warm TTS engine,
+        # Remotion bundle, and cache manager
+        if max_workers is None:
+            import os
+            max_workers = min(4, os.cpu_count() or 1)
+        self.max_workers = max_workers
         self.segments: List["Segment"] = []
+        self._segments_by_id: Dict[str, "Segment"] = {}
+        self._duration_cache: Dict[str, Optional[float]] = {}
+        self._narration_paths: Dict[tuple, str] = {}
+        self._tts_identity: Optional[tuple] = None
+        self._overlay_cache: Dict[tuple, object] = {}
+        self._non_transition_positions: List[int] = []
 
         self.cache_manager = CacheManager(base_dir=self.config.cache_dir)
+        set_text_cache_dir(self.config.cache_dir)
+        # One startup sweep so cache misses during builds are answered
+        # from memory instead of a stat syscall each
+        self._cached_files = self.cache_manager.scan()
         self.audio_sync = AudioSync()
         self.config.output_dir.mkdir(parents=True, exist_ok=True)
 
         # Remotion support (lazy-initialized)
         self._remotion_config = remotion_config
         self._remotion_renderer: Optional["RemotionRenderer"] = None
+        self._renderer_lock = threading.Lock()
+
+    def _tts_names(self) -> tuple:
+        """Get (engine_name, voice), cached per engine instance.
+
+        Some engines do real work in get_name()/get_voice(); cache the
+        pair and recompute only if self.tts_engine is reassigned.
+        """
+        engine = self.tts_engine
+        if self._tts_identity is None or self._tts_identity[0] is not engine:
+            if engine is None:
+                self._tts_identity = (None, "none", "none")
+            else:
+                self._tts_identity = (
+                    engine, engine.get_name(), engine.get_voice()
+                )
+        return self._tts_identity[1], self._tts_identity[2]
 
     @property
     def mode(self) -> str:
@@ -73,14 +181,18 @@ class VideoProject:
         """Get or create the Remotion renderer (lazy initialization).
 
         Only created when the first RemotionSegment is added, so projects
-        that don't use Remotion pay zero overhead.
+        that don't use Remotion pay zero overhead. Creation is locked so
+        parallel build workers share one renderer (and one webpack
+        bundle) instead of racing to create several.
         """
         if self._remotion_renderer is None:
-            from .remotion.config import RemotionConfig
-            from .remotion.renderer import RemotionRenderer
+            with self._renderer_lock:
+                if self._remotion_renderer is None:
+                    from .remotion.config import RemotionConfig
+                    from .remotion.renderer import RemotionRenderer
 
-            config = self._remotion_config or RemotionConfig()
-            self._remotion_renderer = RemotionRenderer(config, self.config)
+                    config = self._remotion_config or RemotionConfig()
+                    self._remotion_renderer = RemotionRenderer(config, self.config)
         return self._remotion_renderer
 
     def add_segment(self, segment: "Segment") -> None:
@@ -88,20 +200,55 @@ class VideoProject:
 
         If the segment is a RemotionSegment without a renderer, the project's
         shared RemotionRenderer is auto-injected.
+
+        Raises:
+            ValueError: If a segment with the same ID was already added.
         """
         from .remotion.segments import RemotionSegment
+        from .remotion.transitions import RemotionTransition
+
+        if segment.id in self._segments_by_id:
+            raise ValueError(f"Duplicate segment ID '{segment.id}'")
 
         if isinstance(segment, RemotionSegment) and segment.renderer is None:
             segment.renderer = self.remotion_renderer
 
         self.segments.append(segment)
+        self._segments_by_id[segment.id] = segment
+        if not isinstance(segment, RemotionTransition):
+            # Sorted index of non-transition positions, so transition
+            # neighbours resolve by bisect instead of a linear scan
+            self._non_transition_positions.append(len(self.segments) - 1)
 
     def get_segment(self, segment_id: str) -> "Segment":
         """Get a segment by ID."""
-        for segment in self.segments:
-            if segment.id == segment_id:
-                return segment
-        raise KeyError(f"Segment '{segment_id}' not found")
+        try:
+            return self._segments_by_id[segment_id]
+        except KeyError:
+            raise KeyError(f"Segment '{segment_id}' not found") from None
+
+    def _is_cached(self, path: Path) -> bool:
+        """Check a cache path against the startup sweep, then disk.
+
+        Misses are answered from the in-memory sweep with no syscall;
+        hits are confirmed with one stat so files deleted behind our
+        back never produce stale cache hits.
+        """
+        try:
+            rel = str(path.relative_to(self.config.cache_dir))
+        except ValueError:
+            return path.exists()
+
+        if rel not in self._cached_files:
+            return False
+        return path.exists()
+
+    def _mark_cached(self, path: Path) -> None:
+        """Record a freshly written cache file in the sweep set."""
+        try:
+            self._cached_files.add(str(path.relative_to(self.config.cache_dir)))
+        except ValueError:
+            pass
 
     def build_segment(self, segment_id: str) -> Path:
         """Build a single segment (Layer 2: video only, no audio)."""
@@ -112,26 +259,252 @@ class VideoProject:
             mode=self.mode,
         )
 
-        if cache_path.exists():
+        if self._is_cached(cache_path):
             print(f"  [Cache HIT] {segment_id}")
             return cache_path
 
+        # Segments with identical render inputs produce byte-identical
+        # video: share one encode via a content-addressed cache entry
+        content_hash = self._segment_content_hash(segment)
+        content_path = None
+        if content_hash is not None:
+            content_path = self.cache_manager.segments.get_path(
+                key=f"content_{content_hash}_{self.mode}"
+            )
+            if self._is_cached(content_path):
+                print(f"  [Dedup HIT] {segment_id}")
+                self._link_or_copy(content_path, cache_path)
+                self._mark_cached(cache_path)
+                return cache_path
+
         print(f"  [Building] {segment_id}...")
 
         clip = segment.render(self.config)
 
         effective_overlays = segment.get_effective_overlays(self.default_overlays)
-        clip = self._apply_overlays(clip, segment, effective_overlays)
+        compositor = self._build_compositor(segment, effective_overlays)
+
+        # When every overlay has an ffmpeg filter equivalent, write the
+        # bare clip and draw the overlays in one ffmpeg pass instead of
+        # Python-space CompositeVideoClip blending during the encode
+        filter_chain = compositor.to_ffmpeg_filter(self.config)
+        if filter_chain and shutil.which("ffmpeg"):
+            base_path = cache_path.with_name(f"base_{cache_path.name}")
+            self._write_clip(clip, base_path)
+            clip.close()
+            try:
+                self._run_overlay_filter(base_path, cache_path, filter_chain)
+            finally:
+                base_path.unlink(missing_ok=True)
+            self._register_content(cache_path, content_path)
+            self._mark_cached(cache_path)
+            return cache_path
+
+        clip = compositor.compose_static(clip, self.config)
+
+        self._write_clip(clip, cache_path)
+
+        clip.close()
+        self._register_content(cache_path, content_path)
+        self._mark_cached(cache_path)
+        return cache_path
+
+    def _segment_content_hash(self, segment: "Segment") -> Optional[str]:
+        """Hash a segment's render inputs, ignoring its identity.
+
+        Two segments whose fields (other than id) match render the same
+        video under the same config, so the hash lets them share one
+        encoded file. Returns None for non-dataclass segments, which
+        opt out of deduplication.
+        """
+        import dataclasses
+        import hashlib
+
+        if not dataclasses.is_dataclass(segment):
+            return None
+
+        spec = [
+            f"{f.name}={self._stable_repr(getattr(segment, f.name))}"
+            for f in dataclasses.fields(segment)
+            if f.name != "id"
+        ]
+        spec.append(f"config={self.config!r}")
+        spec.append(f"overlays={self.default_overlays!r}|{self.overlay_styles!r}")
+
+        return hashlib.sha1("|".join(spec).encode("utf-8")).hexdigest()[:16]
+
+    @classmethod
+    def _stable_repr(cls, value) -> str:
+        """Represent a field value stably across processes.
+
+        The content hash persists in the cache dir, so it must not
+        embed anything run-specific. Raw repr() of a ContentSource can
+        — FunctionGenerator's includes the function's memory address —
+        so sources contribute their cache_key() instead, recursing
+        through containers (e.g. GridSegment cells wrapping sources).
+        """
+        import dataclasses
+
+        from .sources.base import ContentSource
+
+        if isinstance(value, ContentSource):
+            return f"source:{value.cache_key()}"
+        if isinstance(value, (list, tuple)):
+            items = ",".join(cls._stable_repr(item) for item in value)
+            return f"[{items}]"
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            fields = ",".join(
+                f"{f.name}={cls._stable_repr(getattr(value, f.name))}"
+                for f in dataclasses.fields(value)
+            )
+            return f"{type(value).__name__}({fields})"
+        return repr(value)
+
+    @staticmethod
+    def _link_or_copy(src: Path, dst: Path) -> None:
+        """Hard-link src to dst, copying when linking isn't possible."""
+        import os
+
+        dst.unlink(missing_ok=True)
+        try:
+            os.link(src, dst)
+        except OSError:
+            shutil.copy2(src, dst)
+
+    def _register_content(self, src: Path, content_path: Optional[Path]) -> None:
+        """Publish a freshly built segment under its content hash."""
+        import os
+
+        if content_path is None or content_path.exists():
+            return
+        try:
+            os.link(src, content_path)
+        except OSError:
+            # Cross-device or unsupported: dedup is best-effort
+            return
+        self._mark_cached(content_path)
+
+    # Tile length for parallel intra-segment encoding
+    _TILE_SECONDS = 10.0
+
+    def _write_clip(self, clip, output_path: Path) -> None:
+        """Write a video-only clip, tiling long ones into parallel encodes.
+
+        Long segments are split into fixed-duration tiles encoded
+        concurrently and stream-copy concatenated, so a single long
+        segment still uses all configured workers. Tiling is skipped for
+        file-backed clips — including composites that wrap one, like a
+        grid with video cells: their stateful ffmpeg readers aren't safe
+        to pull frames from in multiple threads.
+        """
+        if (
+            self.max_workers > 1
+            and clip.duration
+            and clip.duration > 2 * self._TILE_SECONDS
+            and not self._has_file_reader(clip)
+        ):
+            self._write_clip_tiled(clip, output_path)
+            return
 
         clip.write_videofile(
-            str(cache_path),
+            str(output_path),
             fps=self.config.fps,
             codec=self.config.codec,
             audio=False,
+            ffmpeg_params=self._intermediate_params(),
         )
 
-        clip.close()
-        return cache_path
+    @classmethod
+    def _has_file_reader(cls, clip) -> bool:
+        """Whether a clip, or any clip it wraps, reads frames from a file.
+
+        CompositeVideoClip carries no reader itself but composes clips
+        that may, so the whole tree (subclips and masks included) is
+        walked before deciding a clip is safe to tile.
+        """
+        if getattr(clip, "reader", None) is not None:
+            return True
+        mask = getattr(clip, "mask", None)
+        if mask is not None and cls._has_file_reader(mask):
+            return True
+        return any(
+            cls._has_file_reader(child)
+            for child in getattr(clip, "clips", ()) or ()
+        )
+
+    def _intermediate_params(self) -> List[str]:
+        """Extra ffmpeg args for intermediate (Layer 2) encodes.
+
+        libx264's default medium preset spends most of its time on
+        motion search that intermediates don't need; ultrafast is
+        several times faster at a size cost the cache can absorb.
+        Hardware encoders use their own preset names, so the flags only
+        apply to libx264.
+        """
+        if self.config.codec != "libx264":
+            return []
+        return [
+            "-preset", self.config.intermediate_preset,
+            "-tune", "fastdecode",
+            "-g", str(self.config.fps * 2),
+        ]
+
+    def _write_clip_tiled(self, clip, output_path: Path) -> None:
+        """Encode a clip as parallel fixed-duration tiles, then concat."""
+        import math
+        from concurrent.futures import ThreadPoolExecutor
+
+        n_tiles = math.ceil(clip.duration / self._TILE_SECONDS)
+        tile_paths = [
+            output_path.with_name(f"tile_{i}_{output_path.name}")
+            for i in range(n_tiles)
+        ]
+
+        def write_tile(i: int) -> None:
+            start = i * self._TILE_SECONDS
+            end = min(start + self._TILE_SECONDS, clip.duration)
+            clip.subclipped(start, end).write_videofile(
+                str(tile_paths[i]),
+                fps=self.config.fps,
+                codec=self.config.codec,
+                audio=False,
+                ffmpeg_params=self._intermediate_params(),
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                list(pool.map(write_tile, range(n_tiles)))
+
+            FFmpegConcatenator().concatenate_with_list_file(
+                tile_paths, output_path
+            )
+        finally:
+            for tile_path in tile_paths:
+                tile_path.unlink(missing_ok=True)
+
+    def _run_overlay_filter(
+        self, input_path: Path, output_path: Path, filter_chain: str
+    ) -> None:
+        """Apply an overlay filter chain to a base segment with ffmpeg."""
+        import subprocess
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-i", str(input_path),
+            "-vf", filter_chain,
+            "-c:v", self.config.codec,
+            *self._intermediate_params(),
+            "-r", str(self.config.fps),
+            "-an",
+            "-loglevel", "error",
+            str(output_path),
+        ]
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            output_path.unlink(missing_ok=True)
+            raise RuntimeError(
+                f"ffmpeg overlay pass failed: {result.stderr.strip()}"
+            )
 
     def build_segment_with_audio(self, segment_id: str, force_audio: bool = True) -> Path:
         """Build a single segment with audio (Layer 3).
@@ -141,12 +514,10 @@ class VideoProject:
             force_audio: If True, add silent audio to segments without narration
         """
         from moviepy.audio.AudioClip import AudioClip
-        import numpy as np
 
         segment = self.get_segment(segment_id)
 
-        engine_name = self.tts_engine.get_name() if self.tts_engine else "none"
-        voice = self.tts_engine.get_voice() if self.tts_engine else "none"
+        engine_name, voice = self._tts_names()
 
         cache_path = self.cache_manager.combined.get_path(
             segment_id=segment_id,
@@ -155,7 +526,7 @@ class VideoProject:
             voice=voice,
         )
 
-        if cache_path.exists():
+        if self._is_cached(cache_path):
             print(f"  [Cache HIT] {segment_id} (with audio)")
             return cache_path
 
@@ -163,23 +534,44 @@ class VideoProject:
 
         print(f"  [Adding audio] {segment_id}...")
 
+        # The Layer 2 video stream is already encoded correctly, so when
+        # possible mux the audio in with -c:v copy instead of re-decoding
+        # and re-encoding the whole segment through MoviePy
+        if shutil.which("ffmpeg") and self._mux_audio_stream_copy(
+            segment, video_path, cache_path, force_audio
+        ):
+            self._mark_cached(cache_path)
+            return cache_path
+
         video_clip = VideoFileClip(str(video_path))
+        audio_clip = None
 
         if segment.narration and self.tts_engine:
-            audio_path = self.tts_engine.synthesize_cached(segment.narration)
-            audio_clip = AudioFileClip(audio_path)
+            audio_clip = self._load_narration_audio(
+                engine_name, voice, segment.narration
+            )
 
             final_clip = self.audio_sync.sync_clips(
                 video_clip, audio_clip, self.config
             )
         elif force_audio:
-            # Add silent audio track to ensure consistent streams for concatenation
-            def make_silence(t):
-                if isinstance(t, np.ndarray):
-                    return np.zeros((len(t), 2))
-                return np.zeros(2)
-
-            silent_audio = AudioClip(make_silence, duration=video_clip.duration, fps=44100)
+            # Add silent audio track to ensure consistent streams for
+            # concatenation. Prefer the cached pre-encoded blob: MoviePy
+            # then streams existing samples instead of calling a Python
+            # sampler thousands of times during the encode
+            silent_path = (
+                self._get_silent_audio(video_clip.duration)
+                if shutil.which("ffmpeg")
+                else None
+            )
+            if silent_path is not None:
+                silent_audio = AudioFileClip(str(silent_path)).with_duration(
+                    video_clip.duration
+                )
+            else:
+                silent_audio = AudioClip(
+                    _make_silence, duration=video_clip.duration, fps=44100
+                )
             final_clip = video_clip.with_audio(silent_audio)
         else:
             final_clip = video_clip
@@ -193,9 +585,276 @@ class VideoProject:
 
         final_clip.close()
         video_clip.close()
+        if audio_clip is not None:
+            audio_clip.close()
+
+        self._mark_cached(cache_path)
+        return cache_path
+
+    def _mux_audio_stream_copy(
+        self,
+        segment: "Segment",
+        video_path: Path,
+        cache_path: Path,
+        force_audio: bool,
+    ) -> bool:
+        """Mux audio onto a Layer 2 video without re-encoding it.
+
+        Layer 3 only changes the audio stream, so a -c:v copy mux does
+        the job in O(mux + audio encode) instead of a full video
+        re-decode/re-encode. Returns False when the fast path doesn't
+        apply (the video would need extending to fit the narration, or
+        probing/muxing failed) so the caller falls back to MoviePy.
+        """
+        import subprocess
+
+        if segment.narration and self.tts_engine:
+            if self.audio_sync.strategy != "extend_video":
+                return False
+
+            audio_path = self.tts_engine.synthesize_cached(segment.narration)
+
+            video_dur = self._probe_duration(video_path)
+            # TTS files are content-addressed, so their durations are
+            # safe to memoize; video cache files can be rebuilt in-place
+            audio_dur = self._probe_duration_cached(Path(audio_path))
+            if video_dur is None or audio_dur is None:
+                return False
+
+            total_audio = (
+                self.audio_sync.padding_start
+                + audio_dur
+                + self.audio_sync.padding_end
+            )
+            if total_audio > video_dur:
+                # Narration outlasts the video: the last frame must be
+                # frozen to extend it, which needs the re-encode path
+                return False
+
+            audio_filters = []
+            if self.audio_sync.padding_start > 0:
+                delay_ms = int(self.audio_sync.padding_start * 1000)
+                audio_filters.append(f"adelay={delay_ms}:all=1")
+            audio_filters.append("apad")
+
+            cmd = [
+                "ffmpeg", "-y",
+                "-i", str(video_path),
+                "-i", str(audio_path),
+                "-map", "0:v", "-map", "1:a",
+                "-c:v", "copy",
+                "-c:a", self.config.audio_codec,
+                "-af", ",".join(audio_filters),
+                "-shortest",
+                "-loglevel", "error",
+                str(cache_path),
+            ]
+        elif force_audio:
+            # Silent AAC blobs are byte-identical per duration bucket,
+            # so reuse a pre-encoded one and make the mux pure stream
+            # copy; fall back to encoding from anullsrc directly
+            video_dur = self._probe_duration(video_path)
+            silent_path = (
+                self._get_silent_audio(video_dur)
+                if video_dur is not None
+                else None
+            )
+            if silent_path is not None:
+                cmd = [
+                    "ffmpeg", "-y",
+                    "-i", str(video_path),
+                    "-i", str(silent_path),
+                    "-map", "0:v", "-map", "1:a",
+                    "-c", "copy",
+                    "-shortest",
+                    "-loglevel", "error",
+                    str(cache_path),
+                ]
+            else:
+                cmd = [
+                    "ffmpeg", "-y",
+                    "-i", str(video_path),
+                    "-f", "lavfi", "-i", "anullsrc=r=44100:cl=stereo",
+                    "-map", "0:v", "-map", "1:a",
+                    "-c:v", "copy",
+                    "-c:a", self.config.audio_codec,
+                    "-shortest",
+                    "-loglevel", "error",
+                    str(cache_path),
+                ]
+        else:
+            cmd = [
+                "ffmpeg", "-y",
+                "-i", str(video_path),
+                "-c", "copy",
+                "-loglevel", "error",
+                str(cache_path),
+            ]
+
+        result = subprocess.run(cmd, capture_output=True, text=True)
+        if result.returncode != 0:
+            cache_path.unlink(missing_ok=True)
+            return False
+        return True
+
+    def build_segment_fused(
+        self, segment_id: str, force_audio: bool = True
+    ) -> Path:
+        """Build straight to Layer 3 with a single MoviePy encode.
+
+        The split build writes the video-only Layer 2 file, reopens it
+        with VideoFileClip, and re-encodes it with audio attached —
+        when MoviePy does the muxing, the same pixels are encoded
+        twice and decoded once in between. This path keeps the
+        composited clip in memory, attaches the audio, and writes once.
+
+        With ffmpeg available the split path already touches every
+        pixel once (Layer 2 encode plus a -c:v copy mux) and leaves
+        the Layer 2 file on disk for transition-frame extraction, so
+        this delegates to it rather than give that up.
+
+        Args:
+            segment_id: ID of the segment to build
+            force_audio: If True, add silent audio to segments without narration
+        """
+        from moviepy.audio.AudioClip import AudioClip
+
+        if shutil.which("ffmpeg"):
+            return self.build_segment_with_audio(segment_id, force_audio)
+
+        segment = self.get_segment(segment_id)
+        engine_name, voice = self._tts_names()
+
+        cache_path = self.cache_manager.combined.get_path(
+            segment_id=segment_id,
+            mode=self.mode,
+            engine=engine_name,
+            voice=voice,
+        )
+
+        if self._is_cached(cache_path):
+            print(f"  [Cache HIT] {segment_id} (with audio)")
+            return cache_path
+
+        print(f"  [Building] {segment_id} (fused)...")
+
+        clip = segment.render(self.config)
+
+        effective_overlays = segment.get_effective_overlays(self.default_overlays)
+        compositor = self._build_compositor(segment, effective_overlays)
+        clip = compositor.compose_static(clip, self.config)
+
+        audio_clip = None
+        if segment.narration and self.tts_engine:
+            audio_clip = self._load_narration_audio(
+                engine_name, voice, segment.narration
+            )
+            final_clip = self.audio_sync.sync_clips(
+                clip, audio_clip, self.config
+            )
+        elif force_audio:
+            final_clip = clip.with_audio(
+                AudioClip(_make_silence, duration=clip.duration, fps=44100)
+            )
+        else:
+            final_clip = clip
+
+        final_clip.write_videofile(
+            str(cache_path),
+            fps=self.config.fps,
+            codec=self.config.codec,
+            audio_codec=self.config.audio_codec,
+        )
+
+        final_clip.close()
+        clip.close()
+        if audio_clip is not None:
+            audio_clip.close()
 
+        self._mark_cached(cache_path)
         return cache_path
 
+    def _load_narration_audio(
+        self, engine: str, voice: str, text: str
+    ) -> AudioFileClip:
+        """Open narration audio, memoizing the synthesis per text.
+
+        Repeat builds of the same narration within a session skip the
+        TTS cache lookup, but every build gets its own AudioFileClip:
+        MoviePy readers are stateful, and parallel build_all segments
+        sharing a narration would otherwise pull samples from one
+        reader concurrently. A lost race on the memo just repeats the
+        synthesize_cached call, which dedups internally.
+        """
+        key = (engine, voice, text)
+        audio_path = self._narration_paths.get(key)
+        if audio_path is None:
+            audio_path = self.tts_engine.synthesize_cached(text)
+            self._narration_paths[key] = audio_path
+        return AudioFileClip(audio_path)
+
+    def close(self) -> None:
+        """Clear memoized narration synthesis paths."""
+        self._narration_paths.clear()
+
+    def _get_silent_audio(self, duration: float) -> Optional[Path]:
+        """Get a cached silent AAC file at least ``duration`` long.
+
+        Durations are rounded up to 100 ms buckets so silent segments
+        of similar length share one blob under cache_dir/silence/; the
+        mux relies on -shortest to trim the excess. Generated once per
+        bucket with a tmp-file + replace so parallel workers never see
+        a partial file. Returns None if generation fails.
+        """
+        import math
+        import subprocess
+
+        bucket_ms = int(math.ceil(duration * 10)) * 100
+        silence_dir = self.config.cache_dir / "silence"
+        silence_dir.mkdir(parents=True, exist_ok=True)
+
+        path = silence_dir / f"{bucket_ms}.m4a"
+        if path.exists():
+            return path
+
+        tmp_path = silence_dir / f"{bucket_ms}.tmp.m4a"
+        result = subprocess.run(
+            [
+                "ffmpeg", "-y",
+                "-f", "lavfi", "-i", "anullsrc=r=44100:cl=stereo",
+                "-t", str(bucket_ms / 1000),
+                "-c:a", "aac", "-b:a", "96k",
+                "-loglevel", "error",
+                str(tmp_path),
+            ],
+            capture_output=True, text=True,
+        )
+        if result.returncode != 0:
+            tmp_path.unlink(missing_ok=True)
+            return None
+
+        tmp_path.replace(path)
+        return path
+
+    @staticmethod
+    def _probe_duration(path: Path) -> Optional[float]:
+        """Get a media file's duration via ffprobe, or None on failure."""
+        import subprocess
+
+        result = subprocess.run(
+            [
+                "ffprobe", "-v", "error",
+                "-show_entries", "format=duration",
+                "-of", "default=noprint_wrappers=1:nokey=1",
+                str(path),
+            ],
+            capture_output=True, text=True,
+        )
+        try:
+            return float(result.stdout.strip())
+        except ValueError:
+            return None
+
     def build_all(self) -> List[Path]:
         """Build all segments with audio (Layer 3).
 
@@ -204,36 +863,120 @@ class VideoProject:
 
         For RemotionTransition segments, extracts frames from neighbouring
         segments before rendering the transition.
+
+        Segments are independent (distinct cache paths, no shared mutable
+        state), so with max_workers > 1 they are built concurrently,
+        preserving segment order in the returned paths. The heavy work
+        happens in ffmpeg subprocesses and GIL-releasing numpy calls, so
+        worker threads overlap the encode pipelines while sharing one
+        warm TTS engine and Remotion renderer.
         """
+        import os
+
+        # Transitions depend on neighbouring segments; resolve serially
+        # before the independent builds fan out
         self._prepare_transitions()
 
-        paths = []
+        segment_ids = [segment.id for segment in self.segments]
+
+        self._prewarm_remotion()
+        self._batch_render_remotion()
+
+        workers = min(
+            self.max_workers, len(segment_ids), os.cpu_count() or 1
+        )
+        if workers > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(self.build_segment_with_audio, segment_ids))
+
+        return [self.build_segment_with_audio(sid) for sid in segment_ids]
+
+    def _prewarm_remotion(self) -> None:
+        """Bundle the Remotion project once if any render will need it.
+
+        Bundling is the serial seconds-long prefix of the first
+        Remotion render; doing it before the worker pool starts pays it
+        once up front instead of stalling the first worker (and any
+        others queued behind the bundle lock). Skipped entirely when
+        every Remotion-backed segment is already cached.
+        """
+        from .remotion.generator import RemotionGenerator
+        from .remotion.segments import RemotionSegment
+
+        engine_name, voice = self._tts_names()
+
+        for segment in self.segments:
+            if not (
+                isinstance(segment, RemotionSegment)
+                or isinstance(getattr(segment, "source", None), RemotionGenerator)
+            ):
+                continue
+            cache_path = self.cache_manager.combined.get_path(
+                segment_id=segment.id,
+                mode=self.mode,
+                engine=engine_name,
+                voice=voice,
+            )
+            if not self._is_cached(cache_path):
+                self.remotion_renderer.prewarm()
+                return
+
+    def _batch_render_remotion(self) -> None:
+        """Render every uncached Remotion segment in one Node invocation.
+
+        Per-segment renders each pay a Node startup, Chromium launch,
+        and bundle mount; shipping all pending jobs to a single
+        render_batch call pays those once. Segments render into their
+        Remotion cache paths, so the per-segment builds that follow in
+        build_all all hit the cache. Runs after _prepare_transitions so
+        transition segments carry their frame props.
+        """
+        from .remotion.segments import RemotionSegment
+
+        jobs = []
         for segment in self.segments:
-            path = self.build_segment_with_audio(segment.id)
-            paths.append(path)
-        return paths
+            if not isinstance(segment, RemotionSegment):
+                continue
+            if segment.duration is None or getattr(
+                segment, "needs_frames", False
+            ):
+                # Invalid or frame-less: let the per-segment path
+                # surface its error
+                continue
+            if not segment.remotion_cache_path(self.config).exists():
+                jobs.append(segment.render_job(self.config))
+
+        if len(jobs) > 1:
+            print(f"  [Remotion] Batch rendering {len(jobs)} compositions...")
+            self.remotion_renderer.render_batch(jobs)
 
     def _prepare_transitions(self) -> None:
         """Extract frames for any RemotionTransition segments that need them."""
+        import bisect
+
         from .remotion.transitions import RemotionTransition
 
+        # Pass 1: pair each transition with its neighbouring segments.
+        # Back-to-back transitions share neighbours (A, T1, B, T2, C
+        # needs B for both T1 and T2), so collect the pairs first and
+        # build each unique neighbour exactly once below.
+        positions = self._non_transition_positions
+        pending = []
         for i, segment in enumerate(self.segments):
             if not isinstance(segment, RemotionTransition):
                 continue
             if not segment.needs_frames:
                 continue
 
-            # Find previous and next non-transition segments
-            prev_seg = None
-            next_seg = None
-            for j in range(i - 1, -1, -1):
-                if not isinstance(self.segments[j], RemotionTransition):
-                    prev_seg = self.segments[j]
-                    break
-            for j in range(i + 1, len(self.segments)):
-                if not isinstance(self.segments[j], RemotionTransition):
-                    next_seg = self.segments[j]
-                    break
+            # Locate the neighbouring non-transition segments in the
+            # sorted position index maintained by add_segment
+            pos = bisect.bisect_left(positions, i)
+            prev_seg = self.segments[positions[pos - 1]] if pos > 0 else None
+            next_seg = (
+                self.segments[positions[pos]] if pos < len(positions) else None
+            )
 
             if prev_seg is None or next_seg is None:
                 print(
@@ -242,22 +985,79 @@ class VideoProject:
                 )
                 continue
 
-            # Build the neighbouring segments (video only) so we can extract frames
-            prev_path = self.build_segment(prev_seg.id)
-            next_path = self.build_segment(next_seg.id)
+            pending.append((segment, prev_seg.id, next_seg.id))
+
+        if not pending:
+            return
+
+        # Pass 2: build each unique neighbour (video only) once
+        neighbour_ids = {sid for _, prev_id, next_id in pending
+                         for sid in (prev_id, next_id)}
+        paths = {sid: self.build_segment(sid) for sid in sorted(neighbour_ids)}
 
-            # Extract last frame of previous and first frame of next
-            frames_dir = self.config.cache_dir / "transition_frames"
-            frames_dir.mkdir(parents=True, exist_ok=True)
+        # Pass 3: extract last frame of previous and first frame of next
+        frames_dir = self.config.cache_dir / "transition_frames"
+        frames_dir.mkdir(parents=True, exist_ok=True)
+
+        for segment, prev_id, next_id in pending:
+            prev_path = paths[prev_id]
+            next_path = paths[next_id]
 
             from_frame = frames_dir / f"from_{segment.id}.png"
             to_frame = frames_dir / f"to_{segment.id}.png"
 
-            self._extract_frame(prev_path, from_frame, position="last")
-            self._extract_frame(next_path, to_frame, position="first")
+            if not self._extract_transition_frames(
+                prev_path, next_path, from_frame, to_frame
+            ):
+                self._extract_frame(prev_path, from_frame, position="last")
+                self._extract_frame(next_path, to_frame, position="first")
 
             segment.set_frames(str(from_frame), str(to_frame))
 
+    def _probe_duration_cached(self, video_path: Path) -> Optional[float]:
+        """Probe a video's duration once per path per project."""
+        key = str(video_path)
+        if key not in self._duration_cache:
+            self._duration_cache[key] = self._probe_duration(video_path)
+        return self._duration_cache[key]
+
+    def _extract_transition_frames(
+        self,
+        prev_path: Path,
+        next_path: Path,
+        from_frame: Path,
+        to_frame: Path,
+    ) -> bool:
+        """Extract both transition frames with one ffmpeg invocation.
+
+        The last frame of the previous segment and the first frame of
+        the next come out of a single command with two seeked inputs,
+        instead of an ffprobe plus two ffmpeg runs. Durations are
+        memoized per path, so a segment reused by several transitions
+        is probed once. Returns False so the caller can fall back to
+        per-frame extraction.
+        """
+        import subprocess
+
+        duration = self._probe_duration_cached(prev_path)
+        if duration is None:
+            return False
+
+        cmd = [
+            "ffmpeg", "-y",
+            "-ss", str(max(0, duration - 0.1)), "-i", str(prev_path),
+            "-ss", "0.033", "-i", str(next_path),
+            "-map", "0:v", "-frames:v", "1", "-update", "1", str(from_frame),
+            "-map", "1:v", "-frames:v", "1", "-update", "1", str(to_frame),
+        ]
+
+        try:
+            result = subprocess.run(cmd, capture_output=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return False
+
+        return result.returncode == 0 and from_frame.exists() and to_frame.exists()
+
     @staticmethod
     def _extract_frame(
         video_path: Path, output_path: Path, position: str = "first"
@@ -268,20 +1068,38 @@ class VideoProject:
             video_path: Path to the source video.
             output_path: Where to save the extracted frame (PNG).
             position: "first" or "last".
+
+        Raises:
+            RuntimeError: If ffmpeg/ffprobe fails — a silently empty
+                PNG would only surface later as a broken transition.
         """
         import subprocess
 
+        # In-process extraction first: PyAV skips the ffmpeg process
+        # startup (linking + codec registry) that dominates a
+        # one-frame job. Falls through to the subprocess path when
+        # PyAV is missing or the container defeats it.
+        if shared_worker.extract_frame(video_path, output_path, position):
+            return
+
         if position == "last":
             # Seek near end - use ffprobe to get duration, then seek
             probe = subprocess.run(
                 [
                     "ffprobe", "-v", "error",
+                    "-select_streams", "v:0",
                     "-show_entries", "format=duration",
                     "-of", "default=noprint_wrappers=1:nokey=1",
                     str(video_path),
                 ],
-                capture_output=True, text=True,
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, timeout=30,
             )
+            if probe.returncode != 0:
+                raise RuntimeError(
+                    f"ffprobe failed for {video_path}: "
+                    f"{probe.stderr.strip()[-4096:]}"
+                )
             duration = float(probe.stdout.strip()) if probe.stdout.strip() else 1.0
             seek_time = max(0, duration - 0.1)
             cmd = [
@@ -298,7 +1116,18 @@ class VideoProject:
                 str(output_path),
             ]
 
-        subprocess.run(cmd, capture_output=True, timeout=30)
+        # DEVNULL stdout: nothing useful arrives there and un-drained
+        # pipes can stall ffmpeg; keep stderr for the error message
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            text=True, timeout=30,
+        )
+        if result.returncode != 0 or not output_path.exists():
+            raise RuntimeError(
+                f"ffmpeg frame extraction failed for {video_path}: "
+                f"{result.stderr.strip()[-4096:]}"
+            )
 
     def export(self, output_path: Union[str, Path]) -> Path:
         """Export final concatenated video."""
@@ -306,6 +1135,16 @@ class VideoProject:
 
         segment_paths = self.build_all()
 
+        if len(segment_paths) == 1:
+            # Nothing to concatenate: hard-link the built segment to
+            # the output (O(1) on the same filesystem) instead of
+            # running it through ffmpeg; _link_or_copy falls back to a
+            # plain copy across devices
+            print("  [Linking] 1 segment...")
+            self._link_or_copy(segment_paths[0], output_path)
+            print(f"  [Done] {output_path}")
+            return output_path
+
         print(f"  [Concatenating] {len(segment_paths)} segments...")
 
         concatenator = FFmpegConcatenator()
@@ -314,10 +1153,39 @@ class VideoProject:
         print(f"  [Done] {output_path}")
         return output_path
 
-    def list_status(self) -> Dict[str, Dict[str, bool]]:
+    def export_fast(self, output_path: Union[str, Path]) -> Path:
+        """Export without per-segment audio muxing when nothing narrates.
+
+        When no segment has narration, the Layer 3 pass only exists to
+        attach identical silent tracks that the concat immediately
+        re-reads. This path builds the video-only Layer 2 segments,
+        concatenates them with one silent track over the whole output,
+        and so touches every byte once. Projects with any narration fall
+        back to the regular export.
+        """
+        output_path = Path(output_path)
+
+        if any(segment.narration for segment in self.segments) or not shutil.which(
+            "ffmpeg"
+        ):
+            return self.export(output_path)
+
+        self._prepare_transitions()
+        segment_paths = [self.build_segment(s.id) for s in self.segments]
+
+        print(f"  [Concatenating] {len(segment_paths)} segments (silent)...")
+
+        concatenator = FFmpegConcatenator()
+        concatenator.concatenate_with_silent_audio(
+            segment_paths, output_path, audio_codec=self.config.audio_codec
+        )
+
+        print(f"  [Done] {output_path}")
+        return output_path
+
+    def list_status(self) -> Dict[str, SegStatus]:
         """Get cache status for all segments."""
-        engine_name = self.tts_engine.get_name() if self.tts_engine else "none"
-        voice = self.tts_engine.get_voice() if self.tts_engine else "none"
+        engine_name, voice = self._tts_names()
 
         return self.cache_manager.list_all_status(
             segment_ids=[s.id for s in self.segments],
@@ -326,21 +1194,54 @@ class VideoProject:
             voice=voice,
         )
 
-    def _apply_overlays(
+    def _build_compositor(
         self,
-        clip,
         segment: "Segment",
         effective_overlays: Dict[str, bool],
-    ):
-        """Apply overlays to a clip based on settings."""
+    ) -> Compositor:
+        """Build the compositor holding a segment's enabled overlays.
+
+        Overlay instances are shared across segments with the same text
+        and style (e.g. a section label repeated over a whole series):
+        overlays hold no per-clip state, so one instance can sit in many
+        compositors, and reuse keeps caches keyed on overlay identity
+        warm.
+        """
         compositor = Compositor()
 
         if effective_overlays.get("title_bar") and segment.section:
             title_bar_style = self.overlay_styles.get("title_bar", {})
-            compositor.add_overlay(TitleBarOverlay(text=segment.section, **title_bar_style))
+            compositor.add_overlay(
+                self._cached_overlay(TitleBarOverlay, segment.section, title_bar_style)
+            )
 
         if effective_overlays.get("subtitle") and segment.narration:
             subtitle_style = self.overlay_styles.get("subtitle", {})
-            compositor.add_overlay(SubtitleOverlay(text=segment.narration, **subtitle_style))
+            compositor.add_overlay(
+                self._cached_overlay(SubtitleOverlay, segment.narration, subtitle_style)
+            )
+
+        return compositor
+
+    def _cached_overlay(self, overlay_cls, text: str, style: Dict):
+        """Get or build the overlay for a (type, text, style) tuple."""
+        key = (overlay_cls.__name__, text, tuple(sorted(style.items())))
+        try:
+            overlay = self._overlay_cache.get(key)
+        except TypeError:
+            # Unhashable style value (e.g. a list color): skip caching
+            return overlay_cls(text=text, **style)
+        if overlay is None:
+            overlay = overlay_cls(text=text, **style)
+            self._overlay_cache[key] = overlay
+        return overlay
 
-        return compositor.compose(clip, self.config)
+    def _apply_overlays(
+        self,
+        clip,
+        segment: "Segment",
+        effective_overlays: Dict[str, bool],
+    ):
+        """Apply overlays to a clip based on settings."""
+        compositor = self._build_compositor(segment, effective_overlays)
+        return compositor.compose_static(clip, self.config)
@@ -5,31 +5,24 @@
  * Usage:
  *   echo '{}' | node render.mjs bundle
  *   echo '{}' | node render.mjs render
+ *   node render.mjs --daemon
  *
- * JSON args are read from stdin. All output is JSON on stdout.
+ * One-shot mode reads JSON args from stdin and writes the JSON result
+ * on stdout. Daemon mode reads newline-delimited {id, action, args}
+ * requests on stdin and writes one {id, ok, result|error} line per
+ * request, keeping the module graph (and Remotion's internals) warm
+ * across actions.
  */
 
 import { bundle } from "@remotion/bundler";
 import { renderMedia, getCompositions } from "@remotion/renderer";
 import path from "path";
+import readline from "readline";
 import { fileURLToPath } from "url";
 
 const __dirname = path.dirname(fileURLToPath(import.meta.url));
 
-const action = process.argv[2];
-if (!action) {
-  console.error("Usage: node render.mjs <bundle|render>");
-  process.exit(1);
-}
-
-// Read JSON args from stdin
-const chunks = [];
-for await (const chunk of process.stdin) {
-  chunks.push(chunk);
-}
-const args = JSON.parse(Buffer.concat(chunks).toString());
-
-async function main() {
+async function runAction(action, args) {
   switch (action) {
     case "bundle": {
       const entryPoint = args.entryPoint || path.join(__dirname, "src/index.tsx");
@@ -38,8 +31,7 @@ async function main() {
         outDir: args.outDir || undefined,
         webpackOverride: (config) => config,
       });
-      console.log(JSON.stringify({ serveUrl }));
-      break;
+      return { serveUrl };
     }
 
     case "render": {
@@ -55,6 +47,7 @@ async function main() {
         concurrency,
         chromiumExecutable,
         logLevel = "warn",
+        hardwareAcceleration = "if-possible",
       } = args;
 
       if (!serveUrl || !compositionId || !outputPath) {
@@ -88,11 +81,80 @@ async function main() {
         inputProps,
         ...(concurrency && { concurrency }),
         ...(chromiumExecutable && { chromiumExecutable }),
+        hardwareAcceleration,
         logLevel,
       });
 
-      console.log(JSON.stringify({ success: true, outputPath }));
-      break;
+      return { success: true, outputPath };
+    }
+
+    case "render_batch": {
+      // One Node process + one Chromium instance for many compositions:
+      // per-render process startup is the dominant fixed cost.
+      const {
+        jobs = [],
+        concurrency,
+        chromiumExecutable,
+        logLevel = "warn",
+        hardwareAcceleration = "if-possible",
+      } = args;
+
+      const compositionsByServeUrl = new Map();
+
+      for (const job of jobs) {
+        const {
+          serveUrl,
+          compositionId,
+          outputPath,
+          inputProps = {},
+          durationInFrames,
+          fps,
+          width,
+          height,
+        } = job;
+
+        if (!serveUrl || !compositionId || !outputPath) {
+          throw new Error(
+            "serveUrl, compositionId, and outputPath are required for every job"
+          );
+        }
+
+        if (!compositionsByServeUrl.has(serveUrl)) {
+          compositionsByServeUrl.set(
+            serveUrl,
+            await getCompositions(serveUrl, { inputProps, logLevel })
+          );
+        }
+        const compositions = compositionsByServeUrl.get(serveUrl);
+
+        const composition = compositions.find((c) => c.id === compositionId);
+        if (!composition) {
+          const available = compositions.map((c) => c.id).join(", ");
+          throw new Error(
+            `Composition "${compositionId}" not found. Available: ${available}`
+          );
+        }
+
+        await renderMedia({
+          composition: {
+            ...composition,
+            ...(durationInFrames && { durationInFrames }),
+            ...(fps && { fps }),
+            ...(width && { width }),
+            ...(height && { height }),
+          },
+          serveUrl,
+          codec: "h264",
+          outputLocation: outputPath,
+          inputProps,
+          ...(concurrency && { concurrency }),
+          ...(chromiumExecutable && { chromiumExecutable }),
+          hardwareAcceleration,
+          logLevel,
+        });
+      }
+
+      return { success: true, rendered: jobs.length };
     }
 
     default:
@@ -100,7 +162,63 @@ async function main() {
   }
 }
 
-main().catch((err) => {
+async function daemonLoop() {
+  const rl = readline.createInterface({
+    input: process.stdin,
+    terminal: false,
+  });
+
+  for await (const line of rl) {
+    const trimmed = line.trim();
+    if (!trimmed) continue;
+
+    let request;
+    try {
+      request = JSON.parse(trimmed);
+    } catch (err) {
+      process.stdout.write(
+        JSON.stringify({ ok: false, error: `Bad request: ${err.message}` }) +
+          "\n"
+      );
+      continue;
+    }
+
+    try {
+      const result = await runAction(request.action, request.args || {});
+      process.stdout.write(
+        JSON.stringify({ id: request.id, ok: true, result }) + "\n"
+      );
+    } catch (err) {
+      process.stdout.write(
+        JSON.stringify({
+          id: request.id,
+          ok: false,
+          error: err.message || String(err),
+        }) + "\n"
+      );
+    }
+  }
+}
+
+async function oneShot(action) {
+  // Read JSON args from stdin
+  const chunks = [];
+  for await (const chunk of process.stdin) {
+    chunks.push(chunk);
+  }
+  const args = JSON.parse(Buffer.concat(chunks).toString());
+  const result = await runAction(action, args);
+  console.log(JSON.stringify(result));
+}
+
+const action = process.argv[2];
+if (!action) {
+  console.error("Usage: node render.mjs <bundle|render|--daemon>");
+  process.exit(1);
+}
+
+const entry = action === "--daemon" ? daemonLoop() : oneShot(action);
+entry.catch((err) => {
   console.error(err.message || err);
   process.exit(1);
 });
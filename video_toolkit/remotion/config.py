@@ -19,6 +19,17 @@ class RemotionConfig:
         chromium_executable: Path to Chromium binary (auto-detected if None).
         timeout_per_segment: Max seconds for a single segment render.
         log_level: Remotion log level ("verbose", "info", "warn", "error").
+        hardware_acceleration: Remotion hardware-encode policy
+            ("disable", "if-possible", "required"). "if-possible" uses
+            the platform hardware encoder when available and silently
+            falls back to software x264 otherwise.
+        bundle_cache_max: Number of content-addressed bundles retained
+            in the bundle cache; older ones are pruned after each new
+            bundle. 0 disables pruning.
+        use_daemon: Keep one long-lived Node process serving all
+            bundle/render actions instead of spawning one per action,
+            amortizing Node startup and module loading. Falls back to
+            per-action subprocesses if the daemon dies.
     """
 
     node_executable: str = "node"
@@ -29,3 +40,6 @@ class RemotionConfig:
     chromium_executable: Optional[str] = None
     timeout_per_segment: int = 120
     log_level: str = "warn"
+    hardware_acceleration: str = "if-possible"
+    bundle_cache_max: int = 4
+    use_daemon: bool = False
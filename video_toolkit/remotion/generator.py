@@ -81,10 +81,18 @@ class RemotionGenerator(Generator):
         return output_path
 
     def cache_key(self) -> str:
-        return generate_cache_key({
+        # Memoized by input_props identity: mutators replace the props
+        # dict wholesale, which drops the memo
+        cached = getattr(self, "_cache_key_memo", None)
+        if cached is not None and cached[0] is self.input_props:
+            return cached[1]
+
+        key = generate_cache_key({
             "type": "remotion_generator",
             "key": self.key,
             "composition_id": self.composition_id,
-            "input_props": str(sorted(self.input_props.items())),
+            "input_props": self.input_props,
             "duration": self.duration,
         })
+        self._cache_key_memo = (self.input_props, key)
+        return key
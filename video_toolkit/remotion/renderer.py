@@ -1,21 +1,68 @@
 """RemotionRenderer - Python-to-Node.js bridge for Remotion rendering."""
 
+import functools
 import hashlib
 import json
+import os
+import re
 import shutil
+import stat as stat_module
 import subprocess
+import threading
 from pathlib import Path
 from typing import Any, Dict, Optional, TYPE_CHECKING
 
 from .config import RemotionConfig
 from .exceptions import BundleError, DependencyError, RenderError, RemotionError
 
+# orjson is optional: it serializes several times faster and produces
+# bytes directly, which matches the bytes-mode Node pipe. The stdlib
+# fallback keeps the package dependency-free.
+try:
+    import orjson
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    _loads = json.loads
+
+
+class _DaemonUnavailable(Exception):
+    """Internal: the Node daemon died before answering a request."""
+
+
+def _error_cls(action: str) -> type:
+    """Exception type for a failed render.mjs action."""
+    return {
+        "bundle": BundleError,
+        "render": RenderError,
+        "render_batch": RenderError,
+    }.get(action, RemotionError)
+
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
 
 # Path to the _node/ project shipped with this package
 _NODE_PROJECT_DIR = Path(__file__).parent / "_node"
 
+# Prop keys that may carry local asset paths
+_ASSET_KEY_RE = re.compile(r"path|image|source|src|asset|background")
+
+
+@functools.lru_cache(maxsize=1024)
+def _asset_key_match(key: str) -> bool:
+    """Whether a prop key looks like it carries an asset path.
+
+    Prop keys repeat heavily across segments (imagePath, imagePaths,
+    ...), so results are memoized rather than re-scanning the key.
+    """
+    return _ASSET_KEY_RE.search(key.lower()) is not None
+
 
 class RemotionRenderer:
     """Python-to-Node.js bridge for Remotion rendering.
@@ -27,6 +74,13 @@ class RemotionRenderer:
     - Asset path resolution for browser access
     """
 
+    # Node/npm availability is a per-process fact, not per-renderer:
+    # once any instance has verified it, the others skip the subprocess
+    # probes. The lock keeps concurrent first callers from racing into
+    # a double `npm install`.
+    _deps_lock = threading.Lock()
+    _deps_checked_globally = False
+
     def __init__(
         self,
         remotion_config: Optional[RemotionConfig] = None,
@@ -36,6 +90,18 @@ class RemotionRenderer:
         self._project_config = project_config
         self._serve_url: Optional[str] = None
         self._deps_checked = False
+        self._bundle_lock = threading.Lock()
+        # Long-lived Node process (use_daemon mode); requests are
+        # serialized over its stdin/stdout under the lock
+        self._daemon: Optional[subprocess.Popen] = None
+        self._daemon_lock = threading.Lock()
+        self._daemon_req_id = 0
+        # Asset staging state shared across renders in one run:
+        # (src, dest) pairs already queued, and one stat per source
+        self._copied: set = set()
+        self._src_stats: Dict[str, Optional[os.stat_result]] = {}
+        self._resolved_props: Dict[tuple, Dict[str, Any]] = {}
+        self._digests: Dict[str, tuple] = {}
 
         # Determine bundle cache directory (must be absolute for webpack)
         if self._config.bundle_cache_dir:
@@ -56,9 +122,20 @@ class RemotionRenderer:
         Raises:
             DependencyError: If Node.js is missing or version is too old.
         """
-        if self._deps_checked:
+        if self._deps_checked or RemotionRenderer._deps_checked_globally:
+            self._deps_checked = True
             return
 
+        with RemotionRenderer._deps_lock:
+            if RemotionRenderer._deps_checked_globally:
+                self._deps_checked = True
+                return
+            self._check_dependencies()
+            self._deps_checked = True
+            RemotionRenderer._deps_checked_globally = True
+
+    def _check_dependencies(self) -> None:
+        """Probe Node.js and node_modules (called once per process)."""
         # Check Node.js
         try:
             result = subprocess.run(
@@ -106,19 +183,69 @@ class RemotionRenderer:
                     "Install Node.js from https://nodejs.org/"
                 )
 
-        self._deps_checked = True
+    def prewarm(self) -> str:
+        """Bundle ahead of the first render.
+
+        Dependency checking and the webpack bundle are the serial,
+        seconds-long part of the first render; calling this before
+        fanning renders out to worker threads pays that cost once
+        up front instead of inside the first worker (with the others
+        queued behind the bundle lock).
+
+        Returns:
+            The serve URL (path to the bundled output).
+        """
+        return self.bundle()
+
+    @classmethod
+    def from_cached(
+        cls,
+        bundle_hash: str,
+        remotion_config: Optional[RemotionConfig] = None,
+        project_config: Optional["ProjectConfig"] = None,
+    ) -> "RemotionRenderer":
+        """Build a renderer bound to a known-good cached bundle.
+
+        Skips hashing and bundling entirely: the serve URL is derived
+        from the content-addressed bundle directory, so callers that
+        already know their bundle hash pay a single stat at startup.
+
+        Raises:
+            BundleError: If no bundle with that hash is cached.
+        """
+        renderer = cls(remotion_config, project_config)
+        cached_bundle = renderer._bundle_cache_dir / f"bundle_{bundle_hash}"
+        serve_url = cls._read_bundle_meta(cached_bundle)
+        if serve_url is None:
+            if not (cached_bundle / "index.html").exists():
+                raise BundleError(
+                    f"No cached bundle for hash '{bundle_hash}' in "
+                    f"{renderer._bundle_cache_dir}"
+                )
+            serve_url = str(cached_bundle)
+        renderer._serve_url = serve_url
+        return renderer
 
     def bundle(self, force: bool = False) -> str:
         """Bundle the Remotion project with webpack.
 
+        Safe to call from concurrent render workers: the first caller
+        bundles under a lock, the rest reuse its serve URL.
+
         Returns:
             The serve URL (path to the bundled output).
 
         Raises:
             BundleError: If bundling fails.
         """
-        self.ensure_dependencies()
+        if not force and self._serve_url:
+            return self._serve_url
+
+        with self._bundle_lock:
+            return self._bundle_locked(force)
 
+    def _bundle_locked(self, force: bool) -> str:
+        """Bundle while holding the bundle lock."""
         if not force and self._serve_url:
             return self._serve_url
 
@@ -126,10 +253,21 @@ class RemotionRenderer:
         cached_bundle = self._bundle_cache_dir / f"bundle_{bundle_hash}"
 
         if not force and cached_bundle.exists():
+            # Prefer the serve URL the bundler actually reported; fall
+            # back to the directory path for bundles predating the meta
+            # file
+            meta_serve_url = self._read_bundle_meta(cached_bundle)
+            if meta_serve_url:
+                self._serve_url = meta_serve_url
+                return self._serve_url
             if (cached_bundle / "index.html").exists():
                 self._serve_url = str(cached_bundle)
                 return self._serve_url
 
+        # Node is only needed on a real miss; a warm start with a
+        # content-addressed bundle on disk resolves with pure stats
+        self.ensure_dependencies()
+
         print("  [Remotion] Bundling project...")
         self._bundle_cache_dir.mkdir(parents=True, exist_ok=True)
 
@@ -145,8 +283,56 @@ class RemotionRenderer:
             raise BundleError(f"Bundle did not return serveUrl: {result}")
 
         self._serve_url = result["serveUrl"]
+        self._write_bundle_meta(cached_bundle, bundle_hash)
+        self._prune_bundle_cache(keep=cached_bundle)
         return self._serve_url
 
+    @staticmethod
+    def _read_bundle_meta(cached_bundle: Path) -> Optional[str]:
+        """Load the serve URL persisted with a cached bundle, if any."""
+        try:
+            meta = json.loads((cached_bundle / ".meta.json").read_text())
+        except (OSError, ValueError):
+            return None
+        serve_url = meta.get("serveUrl")
+        if serve_url and (cached_bundle / "index.html").exists():
+            return serve_url
+        return None
+
+    def _write_bundle_meta(self, cached_bundle: Path, bundle_hash: str) -> None:
+        """Persist the bundle result so warm starts skip Node entirely."""
+        import time
+
+        try:
+            (cached_bundle / ".meta.json").write_text(json.dumps({
+                "serveUrl": self._serve_url,
+                "bundleHash": bundle_hash,
+                "createdAt": time.time(),
+            }))
+        except OSError:
+            pass  # Meta is an optimization; the directory check remains
+
+    def _prune_bundle_cache(self, keep: Path) -> None:
+        """Drop the oldest cached bundles beyond the retention limit."""
+        limit = self._config.bundle_cache_max
+        if limit <= 0:
+            return
+
+        try:
+            bundles = [
+                entry
+                for entry in self._bundle_cache_dir.iterdir()
+                if entry.is_dir() and entry.name.startswith("bundle_")
+            ]
+        except OSError:
+            return
+
+        bundles.sort(key=lambda b: b.stat().st_mtime, reverse=True)
+        for stale in bundles[limit:]:
+            if stale == keep:
+                continue
+            shutil.rmtree(stale, ignore_errors=True)
+
     def render(
         self,
         composition_id: str,
@@ -183,6 +369,7 @@ class RemotionRenderer:
             "width": width,
             "height": height,
             "logLevel": self._config.log_level,
+            "hardwareAcceleration": self._config.hardware_acceleration,
         }
 
         if self._config.concurrency > 1:
@@ -199,15 +386,83 @@ class RemotionRenderer:
 
         return output_path
 
+    def render_batch(self, jobs: list) -> None:
+        """Render several compositions in one Node.js invocation.
+
+        Per-render Node startup, Chromium launch, and bundle load are
+        the dominant fixed costs of a Remotion pipeline; batching pays
+        them once for the whole list. Each job is a dict of
+        render() kwargs (composition_id, input_props, output_path,
+        duration_in_frames, width, height, fps).
+
+        Raises:
+            RenderError: If any job's output file is missing afterwards.
+        """
+        if not jobs:
+            return
+        if len(jobs) == 1:
+            self.render(**jobs[0])
+            return
+
+        serve_url = self.bundle()
+
+        batch = []
+        for job in jobs:
+            output_path = Path(job["output_path"]).resolve()
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            batch.append({
+                "serveUrl": serve_url,
+                "compositionId": job["composition_id"],
+                "outputPath": str(output_path),
+                "inputProps": self._resolve_assets(
+                    job["input_props"], serve_url
+                ),
+                "durationInFrames": job["duration_in_frames"],
+                "fps": job.get("fps", 30),
+                "width": job["width"],
+                "height": job["height"],
+            })
+
+        args = {
+            "jobs": batch,
+            "logLevel": self._config.log_level,
+            "hardwareAcceleration": self._config.hardware_acceleration,
+        }
+        if self._config.concurrency > 1:
+            args["concurrency"] = self._config.concurrency
+        if self._config.chromium_executable:
+            args["chromiumExecutable"] = self._config.chromium_executable
+
+        self._call_node(
+            "render_batch",
+            args,
+            timeout=self._config.timeout_per_segment * len(batch),
+        )
+
+        for item in batch:
+            if not Path(item["outputPath"]).exists():
+                raise RenderError(
+                    "Batch render completed but output file not found: "
+                    f"{item['outputPath']}"
+                )
+
     def cleanup(self) -> None:
-        """Remove cached bundles."""
+        """Remove cached bundles and stop the Node daemon."""
+        self._shutdown_daemon()
         if self._bundle_cache_dir.exists():
             shutil.rmtree(self._bundle_cache_dir)
         self._serve_url = None
 
-    def _call_node(self, action: str, args: Dict[str, Any]) -> Any:
+    def _call_node(
+        self, action: str, args: Dict[str, Any], timeout: Optional[int] = None
+    ) -> Any:
         """Call render.mjs via subprocess, passing JSON on stdin.
 
+        Args:
+            action: render.mjs action name.
+            args: JSON-serializable arguments for the action.
+            timeout: Max seconds; defaults to timeout_per_segment.
+
         Returns:
             Parsed JSON from stdout.
 
@@ -216,48 +471,175 @@ class RemotionRenderer:
         """
         self.ensure_dependencies()
 
+        if timeout is None:
+            timeout = self._config.timeout_per_segment
+
+        if self._config.use_daemon:
+            try:
+                return self._call_daemon(action, args, timeout)
+            except _DaemonUnavailable:
+                pass  # Daemon died mid-request; retry one-shot below
+
         render_script = _NODE_PROJECT_DIR / "render.mjs"
 
+        # Bytes mode end to end: Remotion's progress logs can run to
+        # megabytes and there's no reason to decode them — only the
+        # final JSON line (and stderr on failure) gets decoded.
+        # communicate() writes the payload and closes stdin right away,
+        # so Node never blocks waiting for EOF.
+        proc = subprocess.Popen(
+            [self._config.node_executable, str(render_script), action],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=str(_NODE_PROJECT_DIR),
+        )
+
         try:
-            result = subprocess.run(
-                [self._config.node_executable, str(render_script), action],
-                input=json.dumps(args),
-                capture_output=True,
-                text=True,
-                cwd=str(_NODE_PROJECT_DIR),
-                timeout=self._config.timeout_per_segment,
+            stdout, stderr = proc.communicate(
+                _dumps(args), timeout=timeout
+            )
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise RenderError(
+                f"Remotion {action} timed out after {timeout}s"
             )
 
-            if result.returncode != 0:
-                error_msg = result.stderr.strip() or "Unknown error"
-                error_cls = {
-                    "bundle": BundleError,
-                    "render": RenderError,
-                }.get(action, RemotionError)
-                raise error_cls(f"Remotion {action} failed:\n{error_msg}")
-
-            stdout = result.stdout.strip()
-            if not stdout:
-                raise RemotionError(
-                    f"Remotion {action} produced no output.\n"
-                    f"stderr: {result.stderr.strip()}"
-                )
-
-            # Find last JSON line (Remotion may print warnings before)
-            for line in reversed(stdout.splitlines()):
-                line = line.strip()
-                if line.startswith("{") or line.startswith("["):
-                    return json.loads(line)
+        if proc.returncode != 0:
+            error_msg = (
+                stderr.decode(errors="replace").strip() or "Unknown error"
+            )
+            raise _error_cls(action)(f"Remotion {action} failed:\n{error_msg}")
 
+        stdout = stdout.strip()
+        if not stdout:
             raise RemotionError(
-                f"Remotion {action} output is not valid JSON:\n{stdout}"
+                f"Remotion {action} produced no output.\n"
+                f"stderr: {stderr.decode(errors='replace').strip()}"
             )
 
-        except subprocess.TimeoutExpired:
-            raise RenderError(
-                f"Remotion {action} timed out after "
-                f"{self._config.timeout_per_segment}s"
-            )
+        # Find the last JSON line (Remotion may print warnings before)
+        # by scanning the buffer from the tail — verbose runs can log
+        # thousands of lines, and splitting them all just to take the
+        # last one allocates a full list
+        start = max(stdout.rfind(b"\n{"), stdout.rfind(b"\n["))
+        if start >= 0:
+            line = stdout[start + 1:]
+        elif stdout.startswith((b"{", b"[")):
+            line = stdout
+        else:
+            line = b""
+
+        end = line.find(b"\n")
+        if end != -1:
+            line = line[:end].rstrip()
+
+        if line:
+            try:
+                return _loads(line)
+            except ValueError:
+                pass
+
+        raise RemotionError(
+            f"Remotion {action} output is not valid JSON:\n"
+            f"{stdout.decode(errors='replace')}"
+        )
+
+    def _ensure_daemon(self) -> subprocess.Popen:
+        """Start (or restart) the long-lived Node daemon.
+
+        Must be called with the daemon lock held.
+        """
+        if self._daemon is not None and self._daemon.poll() is None:
+            return self._daemon
+
+        render_script = _NODE_PROJECT_DIR / "render.mjs"
+        # stderr is discarded here: if the daemon dies, the request is
+        # retried through the one-shot path, which captures stderr and
+        # raises with it
+        self._daemon = subprocess.Popen(
+            [self._config.node_executable, str(render_script), "--daemon"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            cwd=str(_NODE_PROJECT_DIR),
+        )
+        return self._daemon
+
+    def _call_daemon(
+        self, action: str, args: Dict[str, Any], timeout: int
+    ) -> Any:
+        """Send one request over the daemon's NDJSON pipe.
+
+        Raises:
+            _DaemonUnavailable: If the daemon died before answering
+                (caller retries via the one-shot subprocess path).
+            RenderError: On timeout (the daemon is killed first).
+        """
+        with self._daemon_lock:
+            proc = self._ensure_daemon()
+            self._daemon_req_id += 1
+            req_id = self._daemon_req_id
+
+            timed_out = []
+
+            def on_timeout() -> None:
+                timed_out.append(True)
+                proc.kill()
+
+            timer = threading.Timer(timeout, on_timeout)
+            timer.start()
+            try:
+                proc.stdin.write(_dumps({
+                    "id": req_id,
+                    "action": action,
+                    "args": args,
+                }) + b"\n")
+                proc.stdin.flush()
+
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        # EOF: the daemon died (or the watchdog killed it)
+                        if timed_out:
+                            raise RenderError(
+                                f"Remotion {action} timed out after {timeout}s"
+                            )
+                        raise _DaemonUnavailable()
+                    line = line.strip()
+                    if not line.startswith(b"{"):
+                        continue  # Stray log line on stdout
+                    try:
+                        response = _loads(line)
+                    except ValueError:
+                        continue
+                    if response.get("id") != req_id:
+                        continue
+                    if response.get("ok"):
+                        return response.get("result")
+                    error_msg = response.get("error") or "Unknown error"
+                    raise _error_cls(action)(
+                        f"Remotion {action} failed:\n{error_msg}"
+                    )
+            except BrokenPipeError:
+                raise _DaemonUnavailable()
+            finally:
+                timer.cancel()
+
+    def _shutdown_daemon(self) -> None:
+        """Terminate the daemon process, if one is running."""
+        with self._daemon_lock:
+            if self._daemon is None:
+                return
+            if self._daemon.poll() is None:
+                self._daemon.terminate()
+                try:
+                    self._daemon.wait(timeout=5)
+                except subprocess.TimeoutExpired:
+                    self._daemon.kill()
+                    self._daemon.wait()
+            self._daemon = None
 
     def _resolve_assets(
         self, props: Dict[str, Any], serve_url: str
@@ -265,93 +647,290 @@ class RemotionRenderer:
         """Resolve local file paths in props for Chromium access.
 
         Props with keys containing 'path', 'image', 'source', 'src', 'asset',
-        or 'background' are checked. Local files are copied to both
-        _node/public/assets/ and the bundle's public/assets/ directory, then
-        prop values are rewritten to staticFile-relative paths.
+        or 'background' are checked. Local files are staged once under
+        _node/public/assets/ and linked into the bundle's public/assets/
+        directory, then prop values are rewritten to staticFile-relative
+        paths.
+
+        The tree walk only collects copy jobs; the copies themselves run
+        on a thread pool afterwards (near-linear with disk parallelism
+        for image-heavy carousels), with (src, dest) pairs deduplicated
+        across every render of this renderer so shared assets are staged
+        once per run. Identical props trees (repeated compositions,
+        re-renders after a cache miss) resolve once per serve URL and
+        reuse the memoized result.
         """
-        asset_keys = {"path", "image", "source", "src", "asset", "background"}
+        try:
+            memo_key = (
+                json.dumps(props, sort_keys=True, default=str),
+                serve_url,
+            )
+        except (TypeError, ValueError):
+            memo_key = None
+
+        if memo_key is not None and memo_key in self._resolved_props:
+            return self._resolved_props[memo_key]
+
+        # Title cards and other text-only props have no asset keys at
+        # all; skip the rebuild and hand the original dict through
+        # (render.mjs never mutates props).
+        if not self._has_asset_keys(props):
+            if memo_key is not None:
+                self._resolved_props[memo_key] = props
+            return props
+
+        jobs: list = []
+        resolved = self._resolve_props_tree(props, serve_url, jobs)
+        self._run_copy_jobs(jobs)
+
+        if memo_key is not None:
+            self._resolved_props[memo_key] = resolved
+        return resolved
+
+    @staticmethod
+    def _has_asset_keys(props: Dict[str, Any]) -> bool:
+        """Whether any key in the props tree looks asset-like."""
+        stack = [props]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if _asset_key_match(key):
+                        return True
+                    if isinstance(value, (dict, list)):
+                        stack.append(value)
+            elif isinstance(node, list):
+                stack.extend(
+                    item for item in node if isinstance(item, (dict, list))
+                )
+        return False
+
+    def _resolve_props_tree(
+        self, props: Dict[str, Any], serve_url: str, jobs: list
+    ) -> Dict[str, Any]:
+        """Walk a props dict, rewriting asset paths and queueing copies."""
         resolved = {}
-        public_assets = _NODE_PROJECT_DIR / "public" / "assets"
-        bundle_assets = Path(serve_url) / "public" / "assets"
 
         for key, value in props.items():
-            if isinstance(value, str) and any(
-                ak in key.lower() for ak in asset_keys
-            ):
-                candidate = Path(value)
-                if candidate.exists() and candidate.is_file():
-                    # Copy to both source public/ and bundle public/
-                    for dest_dir in (public_assets, bundle_assets):
-                        dest_dir.mkdir(parents=True, exist_ok=True)
-                        dest = dest_dir / candidate.name
-                        if not dest.exists() or dest.stat().st_mtime < candidate.stat().st_mtime:
-                            shutil.copy2(str(candidate), str(dest))
-                    resolved[key] = f"assets/{candidate.name}"
-                else:
-                    resolved[key] = value
+            if isinstance(value, str) and _asset_key_match(key):
+                resolved[key] = self._stage_asset(value, serve_url, jobs)
             elif isinstance(value, list):
-                resolved[key] = self._resolve_asset_list(value, serve_url, key)
+                resolved[key] = self._resolve_asset_list(
+                    value, serve_url, key, jobs
+                )
             elif isinstance(value, dict):
-                resolved[key] = self._resolve_assets(value, serve_url)
+                resolved[key] = self._resolve_props_tree(
+                    value, serve_url, jobs
+                )
             else:
                 resolved[key] = value
 
         return resolved
 
     def _resolve_asset_list(
-        self, items: list, serve_url: str, key: str
+        self, items: list, serve_url: str, key: str, jobs: list
     ) -> list:
         """Resolve local file paths within a list prop."""
-        asset_keys = {"path", "image", "source", "src", "asset", "background"}
-        is_asset_key = any(ak in key.lower() for ak in asset_keys)
+        is_asset_key = _asset_key_match(key)
 
         resolved = []
         for item in items:
             if isinstance(item, str) and is_asset_key:
-                candidate = Path(item)
-                if candidate.exists() and candidate.is_file():
-                    public_assets = _NODE_PROJECT_DIR / "public" / "assets"
-                    bundle_assets = Path(serve_url) / "public" / "assets"
-                    for dest_dir in (public_assets, bundle_assets):
-                        dest_dir.mkdir(parents=True, exist_ok=True)
-                        dest = dest_dir / candidate.name
-                        if not dest.exists() or dest.stat().st_mtime < candidate.stat().st_mtime:
-                            shutil.copy2(str(candidate), str(dest))
-                    resolved.append(f"assets/{candidate.name}")
-                else:
-                    resolved.append(item)
+                resolved.append(self._stage_asset(item, serve_url, jobs))
             elif isinstance(item, dict):
-                resolved.append(self._resolve_assets(item, serve_url))
+                resolved.append(
+                    self._resolve_props_tree(item, serve_url, jobs)
+                )
             else:
                 resolved.append(item)
         return resolved
 
+    def _stage_asset(self, value: str, serve_url: str, jobs: list) -> str:
+        """Queue copies for a candidate asset path, returning its prop value.
+
+        Non-files pass through untouched. Each source is stat'ed once
+        per run, and a (src, dest) pair is queued at most once per run.
+        """
+        candidate = Path(value)
+        st = self._stat_source(candidate)
+        if st is None or not stat_module.S_ISREG(st.st_mode):
+            return value
+
+        canonical = _NODE_PROJECT_DIR / "public" / "assets" / candidate.name
+        bundle_dest = Path(serve_url) / "public" / "assets" / candidate.name
+        pair = (str(candidate), serve_url)
+        if pair not in self._copied:
+            self._copied.add(pair)
+            jobs.append((candidate, canonical, bundle_dest, st.st_mtime))
+
+        return f"assets/{candidate.name}"
+
+    def _stat_source(self, path: Path) -> Optional[os.stat_result]:
+        """Stat a source asset once per run."""
+        key = str(path)
+        if key not in self._src_stats:
+            try:
+                self._src_stats[key] = os.stat(path)
+            except OSError:
+                self._src_stats[key] = None
+        return self._src_stats[key]
+
+    @staticmethod
+    def _run_copy_jobs(jobs: list) -> None:
+        """Execute queued (src, canonical, bundle_dest, src_mtime) stages.
+
+        Each asset gets one canonical copy under _node/public/assets/;
+        the bundle's copy is a symlink (or hardlink, or copy as a last
+        resort) to it, so large media never hits the disk twice.
+        """
+        from concurrent.futures import ThreadPoolExecutor
+
+        def stage(job) -> None:
+            src, canonical, bundle_dest, src_mtime = job
+            canonical.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                fresh = canonical.stat().st_mtime >= src_mtime
+            except OSError:
+                fresh = False
+            if not fresh:
+                canonical.unlink(missing_ok=True)
+                try:
+                    # Same filesystem: a hardlink stages the asset
+                    # without touching its bytes
+                    os.link(src, canonical)
+                except OSError:
+                    # Chromium only needs the bytes, so copyfile
+                    # (sendfile on Linux) beats copy2's extra
+                    # chmod/utime syscalls
+                    shutil.copyfile(str(src), str(canonical))
+
+            bundle_dest.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                if os.path.samestat(
+                    os.stat(bundle_dest), os.stat(canonical)
+                ):
+                    return  # Already points at the canonical copy
+            except OSError:
+                pass
+            bundle_dest.unlink(missing_ok=True)
+            try:
+                os.symlink(canonical, bundle_dest)
+            except OSError:
+                # Symlinks need privileges on Windows; hardlink, then
+                # copy, as fallbacks
+                try:
+                    os.link(canonical, bundle_dest)
+                except OSError:
+                    shutil.copyfile(str(canonical), str(bundle_dest))
+
+        if not jobs:
+            return
+        if len(jobs) == 1:
+            stage(jobs[0])
+            return
+
+        workers = min(len(jobs), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            list(pool.map(stage, jobs))
+
     def _compute_bundle_hash(self) -> str:
-        """Compute a hash for bundle cache invalidation."""
+        """Compute a content hash for bundle cache invalidation.
+
+        Hashing mtimes would invalidate the expensive webpack bundle on
+        every git checkout or touch even when the bytes are unchanged,
+        so the hash covers file contents. A manifest of
+        (size, mtime_ns, sha256) per file lets unchanged files reuse
+        their stored digest without re-reading them — the same
+        stat-then-content shortcut webpack's own cache uses.
+        """
         hasher = hashlib.sha256()
 
+        manifest_path = self._bundle_cache_dir / "manifest.json"
+        try:
+            old_manifest = json.loads(manifest_path.read_text())
+        except (OSError, ValueError):
+            old_manifest = {}
+        new_manifest: Dict[str, list] = {}
+
+        files = []
         pkg_json = _NODE_PROJECT_DIR / "package.json"
-        if pkg_json.exists():
-            hasher.update(pkg_json.read_bytes())
+        try:
+            files.append((str(pkg_json), os.stat(pkg_json)))
+        except FileNotFoundError:
+            pass
 
-        src_dir = _NODE_PROJECT_DIR / "src"
-        if src_dir.exists():
-            for f in sorted(src_dir.rglob("*")):
-                if f.is_file():
-                    hasher.update(f.name.encode())
-                    hasher.update(str(f.stat().st_mtime_ns).encode())
+        files.extend(self._walk_files(_NODE_PROJECT_DIR / "src"))
 
         if self._config.custom_compositions_dir:
-            custom_dir = Path(self._config.custom_compositions_dir)
-            if custom_dir.exists():
-                for f in sorted(custom_dir.rglob("*.tsx")):
-                    hasher.update(f.name.encode())
-                    hasher.update(str(f.stat().st_mtime_ns).encode())
+            files.extend(
+                entry
+                for entry in self._walk_files(
+                    Path(self._config.custom_compositions_dir)
+                )
+                if entry[0].endswith(".tsx")
+            )
+
+        for rel, st in files:
+            entry = old_manifest.get(rel)
+            if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+                digest = entry[2]
+            else:
+                digest = self._file_digest(Path(rel))
+            new_manifest[rel] = [st.st_size, st.st_mtime_ns, digest]
+            hasher.update(rel.encode())
+            hasher.update(digest.encode())
+
+        if new_manifest != old_manifest:
+            try:
+                self._bundle_cache_dir.mkdir(parents=True, exist_ok=True)
+                manifest_path.write_text(json.dumps(new_manifest))
+            except OSError:
+                pass  # Manifest is an optimization; hash is still valid
+
+        return hasher.digest()[:8].hex()
+
+    @staticmethod
+    def _walk_files(root: Path) -> list:
+        """Collect (path, stat) for every file under root, sorted by path.
+
+        One os.scandir pass per directory: entry.is_dir/is_file/stat
+        come from the cached dirent instead of a fresh syscall per
+        Path, unlike the rglob + per-file stat pattern this replaces.
+        """
+        out = []
+        stack = [root]
 
-        return hasher.hexdigest()[:16]
+        while stack:
+            directory = stack.pop()
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif entry.is_file(follow_symlinks=False):
+                            out.append((entry.path, entry.stat()))
+            except FileNotFoundError:
+                continue
+
+        out.sort()
+        return out
+
+    @staticmethod
+    def _file_digest(path: Path) -> str:
+        """Stream a file's sha256 without loading it whole."""
+        hasher = hashlib.sha256()
+        with open(path, "rb") as fh:
+            for chunk in iter(lambda: fh.read(65536), b""):
+                hasher.update(chunk)
+        return hasher.hexdigest()
 
     def _copy_custom_compositions(self) -> None:
-        """Copy user-provided .tsx compositions into _node/src/custom/."""
+        """Copy user-provided .tsx compositions into _node/src/custom/.
+
+        Files already present with identical content are left alone, so
+        rebundles don't rewrite unchanged compositions (which would dirty
+        their mtimes and defeat the manifest's stat shortcut).
+        """
         custom_dir = Path(self._config.custom_compositions_dir)
         if not custom_dir.exists():
             return
@@ -361,4 +940,25 @@ class RemotionRenderer:
 
         for tsx_file in custom_dir.glob("*.tsx"):
             dest = target / tsx_file.name
+            try:
+                src_st = tsx_file.stat()
+                dest_st = dest.stat()
+                if (
+                    dest_st.st_size == src_st.st_size
+                    and self._cached_digest(dest, dest_st)
+                    == self._cached_digest(tsx_file, src_st)
+                ):
+                    continue
+            except OSError:
+                pass
             shutil.copy2(str(tsx_file), str(dest))
+
+    def _cached_digest(self, path: Path, st: os.stat_result) -> str:
+        """sha256 of a file, reused while its mtime is unchanged."""
+        key = str(path)
+        cached = self._digests.get(key)
+        if cached is not None and cached[0] == st.st_mtime_ns:
+            return cached[1]
+        digest = self._file_digest(path)
+        self._digests[key] = (st.st_mtime_ns, digest)
+        return digest
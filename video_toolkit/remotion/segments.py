@@ -1,7 +1,7 @@
 """Remotion-based segment types."""
 
 import hashlib
-import json
+import struct
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
@@ -13,10 +13,51 @@ if TYPE_CHECKING:
     from .renderer import RemotionRenderer
 
 
-def _remotion_cache_key(data: Dict[str, Any]) -> str:
-    """Generate a deterministic cache key for Remotion render output."""
-    key_string = json.dumps(data, sort_keys=True, default=str)
-    return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+_TUPLE_LIST_CACHE: Dict[tuple, list] = {}
+
+
+def _as_list(value: tuple) -> list:
+    """JSON-friendly list for a tuple, shared across segments.
+
+    Color tuples are almost always the handful of defaults, so the
+    conversions are cached instead of allocating a fresh 3-element list
+    per segment. The shared lists are only ever serialized, never
+    mutated.
+    """
+    return _TUPLE_LIST_CACHE.setdefault(value, list(value))
+
+
+def _hash_obj(hasher, obj: Any) -> None:
+    """Feed one value (recursively) into the hasher."""
+    if isinstance(obj, dict):
+        hasher.update(b"{")
+        for key in sorted(obj):
+            hasher.update(str(key).encode())
+            hasher.update(b":")
+            _hash_obj(hasher, obj[key])
+            hasher.update(b",")
+        hasher.update(b"}")
+    elif isinstance(obj, (list, tuple)):
+        hasher.update(b"[")
+        for item in obj:
+            _hash_obj(hasher, item)
+            hasher.update(b",")
+        hasher.update(b"]")
+    elif isinstance(obj, str):
+        hasher.update(b"s")
+        hasher.update(obj.encode())
+    elif isinstance(obj, bool):
+        hasher.update(b"T" if obj else b"F")
+    elif isinstance(obj, float):
+        hasher.update(b"f")
+        hasher.update(struct.pack("<d", obj))
+    elif isinstance(obj, int):
+        hasher.update(b"i")
+        hasher.update(str(obj).encode())
+    elif obj is None:
+        hasher.update(b"n")
+    else:
+        hasher.update(repr(obj).encode())
 
 
 @dataclass
@@ -45,8 +86,6 @@ class RemotionSegment(Segment):
         3. Otherwise, call the Remotion renderer to produce the MP4.
         4. Return a VideoFileClip for the existing pipeline.
         """
-        from moviepy import VideoFileClip
-
         if self.renderer is None:
             raise RuntimeError(
                 f"RemotionSegment '{self.id}' has no renderer. "
@@ -59,22 +98,13 @@ class RemotionSegment(Segment):
                 f"RemotionSegment '{self.id}' requires explicit duration"
             )
 
-        fps = config.fps
-        duration_in_frames = round(self.duration * fps)
+        # Check Remotion cache. MoviePy is imported only once a clip is
+        # actually about to be constructed; cache-path math stays cheap
+        # for callers that just probe the cache.
+        from moviepy import VideoFileClip
 
-        # Check Remotion cache
-        cache_dir = config.cache_dir / "remotion"
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        cache_key = _remotion_cache_key({
-            "composition_id": self.composition_id,
-            "input_props": self.input_props,
-            "width": config.width,
-            "height": config.height,
-            "fps": fps,
-            "duration_in_frames": duration_in_frames,
-        })
-        cached_path = cache_dir / f"{cache_key}.mp4"
+        cached_path = self.remotion_cache_path(config)
+        cached_path.parent.mkdir(parents=True, exist_ok=True)
 
         if cached_path.exists():
             print(f"  [Remotion Cache HIT] {self.id}")
@@ -82,25 +112,67 @@ class RemotionSegment(Segment):
 
         print(f"  [Remotion Rendering] {self.id} ({self.composition_id})...")
 
-        # Inject width/height into props for the React component
-        props = {
-            **self.input_props,
+        self.renderer.render(**self.render_job(config))
+
+        return VideoFileClip(str(cached_path))
+
+    def remotion_cache_path(self, config: "ProjectConfig") -> Path:
+        """Where this segment's rendered MP4 lives in the Remotion cache.
+
+        The (composition_id, input_props) fingerprint is cached on the
+        segment and only mixed with the per-config dimensions here, so
+        repeated cache probes don't re-hash the props tree.
+        """
+        hasher = hashlib.sha256(self._props_fingerprint())
+        hasher.update(struct.pack(
+            "<IIII",
+            config.width,
+            config.height,
+            config.fps,
+            round(self.duration * config.fps),
+        ))
+        return config.cache_dir / "remotion" / f"{hasher.digest()[:8].hex()}.mp4"
+
+    def _props_fingerprint(self) -> bytes:
+        """Hash of (composition_id, input_props), cached per props object.
+
+        Invalidated by identity: set_frames and similar mutators
+        replace input_props wholesale, which drops the memo.
+        """
+        cached = getattr(self, "_props_fp", None)
+        if cached is not None and cached[0] is self.input_props:
+            return cached[1]
+
+        hasher = hashlib.sha256()
+        _hash_obj(hasher, {
+            "composition_id": self.composition_id,
+            "input_props": self.input_props,
+        })
+        fingerprint = hasher.digest()
+        self._props_fp = (self.input_props, fingerprint)
+        return fingerprint
+
+    def render_job(self, config: "ProjectConfig") -> Dict[str, Any]:
+        """Describe this segment's render as renderer.render() kwargs.
+
+        Also the unit consumed by RemotionRenderer.render_batch, which
+        ships many of these to a single Node process.
+        """
+        return {
+            "composition_id": self.composition_id,
+            # Inject width/height into props for the React component
+            "input_props": {
+                **self.input_props,
+                "width": config.width,
+                "height": config.height,
+            },
+            "output_path": str(self.remotion_cache_path(config)),
+            "duration_in_frames": round(self.duration * config.fps),
             "width": config.width,
             "height": config.height,
+            "fps": config.fps,
         }
 
-        self.renderer.render(
-            composition_id=self.composition_id,
-            input_props=props,
-            output_path=str(cached_path),
-            duration_in_frames=duration_in_frames,
-            width=config.width,
-            height=config.height,
-            fps=fps,
-        )
-
-        return VideoFileClip(str(cached_path))
-
     def get_duration(self, config: "ProjectConfig") -> float:
         if self.duration is None:
             raise ValueError(
@@ -147,9 +219,9 @@ class RemotionTitleSegment(RemotionSegment):
         props: Dict[str, Any] = {
             "title": self.title,
             "animation": self.animation,
-            "backgroundColor": list(self.background_color),
-            "titleColor": list(self.title_color),
-            "subtitleColor": list(self.subtitle_color),
+            "backgroundColor": _as_list(self.background_color),
+            "titleColor": _as_list(self.title_color),
+            "subtitleColor": _as_list(self.subtitle_color),
             "titleFont": self.title_font,
             "subtitleFont": self.subtitle_font,
         }
@@ -185,7 +257,7 @@ class RemotionImageSegment(RemotionSegment):
             "effect": self.effect,
         }
         if self.background_color != (255, 255, 255):
-            props["backgroundColor"] = list(self.background_color)
+            props["backgroundColor"] = _as_list(self.background_color)
         return props
 
 
@@ -224,7 +296,7 @@ class RemotionKenBurnsSegment(RemotionSegment):
             "panY": self.pan_y,
         }
         if self.background_color != (255, 255, 255):
-            props["backgroundColor"] = list(self.background_color)
+            props["backgroundColor"] = _as_list(self.background_color)
         return props
 
 
@@ -262,7 +334,7 @@ class RemotionSplitScreenSegment(RemotionSegment):
         if self.right_label:
             props["rightLabel"] = self.right_label
         if self.background_color != (255, 255, 255):
-            props["backgroundColor"] = list(self.background_color)
+            props["backgroundColor"] = _as_list(self.background_color)
         return props
 
 
@@ -292,5 +364,5 @@ class RemotionCarouselSegment(RemotionSegment):
             "transition": self.transition,
         }
         if self.background_color != (255, 255, 255):
-            props["backgroundColor"] = list(self.background_color)
+            props["backgroundColor"] = _as_list(self.background_color)
         return props
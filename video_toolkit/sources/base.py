@@ -1,25 +1,104 @@
 """Base classes for content sources."""
 
 import hashlib
+import os
+import threading
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, TYPE_CHECKING
-
-from moviepy import VideoFileClip, ImageClip, ColorClip, TextClip, CompositeVideoClip
+from weakref import WeakValueDictionary
 
 if TYPE_CHECKING:
+    from moviepy import (
+        VideoFileClip, ImageClip, ColorClip, TextClip, CompositeVideoClip,
+    )
     from video_toolkit.config import ProjectConfig
 
+# MoviePy pulls in PIL, imageio and friends — roughly a second of
+# import time that CLI paths touching only cache keys (--list, --status)
+# never need. Its classes are resolved on first clip construction
+# instead of at import.
+_MOVIEPY_NAMES = frozenset((
+    "VideoFileClip", "ImageClip", "ColorClip", "TextClip",
+    "CompositeVideoClip",
+))
+
+
+def _moviepy(name: str) -> Any:
+    """Resolve a MoviePy class on first use, caching it in globals()."""
+    cls = globals().get(name)
+    if cls is None:
+        import moviepy
+
+        cls = getattr(moviepy, name)
+        globals()[name] = cls
+    return cls
+
+
+def __getattr__(name: str) -> Any:
+    if name in _MOVIEPY_NAMES:
+        return _moviepy(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# blake3 is optional: cache keys are not security-sensitive, and blake3
+# hashes the short payloads involved several times faster than software
+# SHA-256. The stdlib fallback keeps the package dependency-free; note
+# the two produce different keys, so installing blake3 re-populates
+# on-disk caches lazily.
+try:
+    from blake3 import blake3 as _new_hasher
+except ImportError:
+    _new_hasher = hashlib.sha256
+
+
+def _hash_value(hasher, value: Any) -> None:
+    """Feed one value (recursively, canonically) into the hasher.
+
+    Dicts hash by sorted key so nested dicts stay order-independent;
+    strings are tagged so "1" and 1 cannot collide; everything else
+    falls back to its repr.
+    """
+    if isinstance(value, dict):
+        hasher.update(b"{")
+        for key in sorted(value):
+            hasher.update(str(key).encode())
+            hasher.update(b"\x00")
+            _hash_value(hasher, value[key])
+            hasher.update(b"\x01")
+        hasher.update(b"}")
+    elif isinstance(value, (list, tuple)):
+        hasher.update(b"[")
+        for item in value:
+            _hash_value(hasher, item)
+            hasher.update(b"\x01")
+        hasher.update(b"]")
+    elif isinstance(value, str):
+        hasher.update(b"s")
+        hasher.update(value.encode())
+    else:
+        hasher.update(repr(value).encode())
+
 
 def generate_cache_key(data: dict) -> str:
-    """Generate a deterministic cache key from a dictionary."""
-    key_string = str(sorted(data.items()))
-    return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+    """Generate a deterministic cache key from a dictionary.
+
+    The dict is fed straight into the hasher (sorted keys, nested
+    values included) rather than built into an intermediate JSON or
+    repr string first — hashing is the hot path when scanning large
+    projects, and the serialization dominated the hash itself.
+    """
+    hasher = _new_hasher()
+    _hash_value(hasher, data)
+    return hasher.digest()[:8].hex()
 
 
 class ContentSource(ABC):
     """Abstract base class for content sources."""
 
+    # Empty here so slotted subclasses actually drop the per-instance
+    # dict; subclasses that don't declare __slots__ get one as usual
+    __slots__ = ()
+
     @abstractmethod
     def get_clip(self, config: "ProjectConfig") -> Any:
         """Get a MoviePy clip from this source."""
@@ -31,27 +110,95 @@ class ContentSource(ABC):
         pass
 
 
+# Live clips keyed by (path, mtime_ns, loader), held per thread:
+# opening a VideoFileClip spawns an ffmpeg subprocess and parses
+# headers, so sources referenced several times in one build reuse the
+# open instance. The cache is thread-local because MoviePy readers are
+# stateful (a seek plus sequential pipe reads) and build_all runs
+# segments on a worker pool — one reader shared across threads would
+# interleave reads and corrupt frames. Weak values mean the cache never
+# extends a clip's lifetime.
+_clip_caches = threading.local()
+
+
+def _clip_cache() -> "WeakValueDictionary[tuple, Any]":
+    cache = getattr(_clip_caches, "cache", None)
+    if cache is None:
+        cache = _clip_caches.cache = WeakValueDictionary()
+    return cache
+
+
+def _open_cached(path: Path, loader) -> Any:
+    """Open a clip, reusing a still-live instance for repeated sources.
+
+    Reuse is per thread; a cached clip whose reader has been closed
+    (the pipeline closes clips after compositing) is discarded and
+    reopened.
+    """
+    try:
+        key = (str(path), os.stat(path).st_mtime_ns, loader.__name__)
+    except OSError:
+        return loader(str(path))
+
+    cache = _clip_cache()
+    clip = cache.get(key)
+    if clip is not None and not getattr(
+        getattr(clip, "reader", None), "closed", False
+    ):
+        return clip
+
+    clip = loader(str(path))
+    cache[key] = clip
+    return clip
+
+
+# Extension → clip-class dispatch for Asset.get_clip (by name, so the
+# table doesn't force the MoviePy import); unknown extensions fall
+# through to VideoFileClip
+_EXT_LOADERS = {
+    ".mp4": "VideoFileClip",
+    ".mov": "VideoFileClip",
+    ".avi": "VideoFileClip",
+    ".mkv": "VideoFileClip",
+    ".webm": "VideoFileClip",
+    ".png": "ImageClip",
+    ".jpg": "ImageClip",
+    ".jpeg": "ImageClip",
+    ".gif": "ImageClip",
+    ".bmp": "ImageClip",
+}
+
+
 class Asset(ContentSource):
     """Static file asset (video or image)."""
 
+    __slots__ = ("path", "_suffix", "_hash_input", "_cache_key")
+
+    # Hasher pre-fed with the type tag, copied per instance so the tag
+    # bytes are only ever compressed once per process
+    _PREFIX = _new_hasher(b"asset\x00")
+
     def __init__(self, path: str | Path):
         self.path = Path(path)
+        self._suffix = self.path.suffix.lower()
+        # Canonical hash input, built once: the key fields are fixed at
+        # construction, so cache_key() has nothing to assemble
+        self._hash_input = str(self.path).encode()
+        self._cache_key: str | None = None
 
     def get_clip(self, config: "ProjectConfig") -> Any:
         """Load the file as a MoviePy clip."""
-        suffix = self.path.suffix.lower()
-        if suffix in (".mp4", ".mov", ".avi", ".mkv", ".webm"):
-            return VideoFileClip(str(self.path))
-        elif suffix in (".png", ".jpg", ".jpeg", ".gif", ".bmp"):
-            return ImageClip(str(self.path))
-        else:
-            return VideoFileClip(str(self.path))
+        loader = _moviepy(_EXT_LOADERS.get(self._suffix, "VideoFileClip"))
+        return _open_cached(self.path, loader)
 
     def cache_key(self) -> str:
-        return generate_cache_key({
-            "type": "asset",
-            "path": str(self.path),
-        })
+        # Sources are immutable after construction, so the key is
+        # computed once and reused across cache probes and log lines
+        if self._cache_key is None:
+            hasher = self._PREFIX.copy()
+            hasher.update(self._hash_input)
+            self._cache_key = hasher.digest()[:8].hex()
+        return self._cache_key
 
     def __str__(self) -> str:
         return f"Asset({self.path})"
@@ -63,6 +210,13 @@ class Asset(ContentSource):
 class Placeholder(ContentSource):
     """Debug placeholder content."""
 
+    __slots__ = (
+        "text", "duration", "color", "text_color", "_hash_input",
+        "_cache_key",
+    )
+
+    _PREFIX = _new_hasher(b"placeholder\x00")
+
     def __init__(
         self,
         text: str,
@@ -74,31 +228,36 @@ class Placeholder(ContentSource):
         self.duration = duration
         self.color = color
         self.text_color = text_color
+        self._hash_input = b"\x00".join((
+            text.encode(),
+            repr(duration).encode(),
+            repr(color).encode(),
+        ))
+        self._cache_key: str | None = None
 
     def get_clip(self, config: "ProjectConfig") -> Any:
         """Create a placeholder clip with text."""
-        bg = ColorClip(
+        bg = _moviepy("ColorClip")(
             size=config.dimensions,
             color=self.color,
             duration=self.duration,
         )
 
-        txt = TextClip(
+        txt = _moviepy("TextClip")(
             text=self.text,
             font_size=int(48 * config.scale_factor),
             color=f"rgb{self.text_color}",
             font="Arial",
         )
         txt = txt.with_position("center").with_duration(self.duration)
-        return CompositeVideoClip([bg, txt])
+        return _moviepy("CompositeVideoClip")([bg, txt])
 
     def cache_key(self) -> str:
-        return generate_cache_key({
-            "type": "placeholder",
-            "text": self.text,
-            "duration": self.duration,
-            "color": self.color,
-        })
+        if self._cache_key is None:
+            hasher = self._PREFIX.copy()
+            hasher.update(self._hash_input)
+            self._cache_key = hasher.digest()[:8].hex()
+        return self._cache_key
 
     def __str__(self) -> str:
         return f"Placeholder({self.text!r})"
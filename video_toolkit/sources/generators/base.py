@@ -1,23 +1,39 @@
 """Base class for content generators."""
 
+import atexit
+import json
+import os
 from abc import abstractmethod
+from os.path import lexists
 from pathlib import Path
-from typing import Any, TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 
-from moviepy import VideoFileClip
-
-from ..base import ContentSource
+from ..base import ContentSource, _moviepy, _open_cached
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
 
 
+def _generate_one(generator: "Generator", output_path: Path, config) -> None:
+    """Render one generator's output (process-pool entry point)."""
+    generator.generate(output_path, config)
+
+
 class Generator(ContentSource):
     """Abstract base class for content generators."""
 
+    # Per-cache-dir manifest of cache_key -> output mtime, so repeat
+    # get_clip calls answer from memory instead of stat'ing the cache
+    # file (which adds up on network filesystems). Loaded lazily,
+    # persisted at interpreter exit.
+    _manifests: Dict[str, dict] = {}
+    _manifests_dirty: set = set()
+
     def __init__(self, key: str, cache_dir: str | Path = "./generated"):
         self.key = key
         self.cache_dir = Path(cache_dir)
+        # Created once here rather than per get_clip call
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     @abstractmethod
     def generate(self, output_path: Path, config: "ProjectConfig") -> Path:
@@ -26,10 +42,101 @@ class Generator(ContentSource):
 
     def get_clip(self, config: "ProjectConfig") -> Any:
         """Get a MoviePy clip, generating if needed."""
-        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache_key = self.cache_key()
+        cache_path = self.cache_dir / f"{cache_key}.mp4"
+
+        manifest = self._manifest_for(self.cache_dir)
+        if cache_key not in manifest:
+            if not lexists(cache_path):
+                self.generate(cache_path, config)
+            try:
+                manifest[cache_key] = os.path.getmtime(cache_path)
+                Generator._manifests_dirty.add(str(self.cache_dir))
+            except OSError:
+                pass
+
+        return _open_cached(cache_path, _moviepy("VideoFileClip"))
+
+    @classmethod
+    def _manifest_for(cls, cache_dir: Path) -> dict:
+        """Load (once) the manifest for a cache directory."""
+        key = str(cache_dir)
+        manifest = cls._manifests.get(key)
+        if manifest is None:
+            try:
+                with open(cache_dir / "manifest.json") as fh:
+                    manifest = json.load(fh)
+            except (OSError, ValueError):
+                manifest = {}
+            cls._manifests[key] = manifest
+        return manifest
+
+    @classmethod
+    def _save_manifests(cls) -> None:
+        """Write out manifests that changed this run."""
+        for key in cls._manifests_dirty:
+            manifest = cls._manifests.get(key)
+            if manifest is None:
+                continue
+            try:
+                with open(Path(key) / "manifest.json", "w") as fh:
+                    json.dump(manifest, fh)
+            except OSError:
+                pass
+        cls._manifests_dirty.clear()
+
+    @staticmethod
+    def prewarm(generators, config: "ProjectConfig") -> None:
+        """Generate every uncached output up front, in parallel.
+
+        Generators are CPU/IO-heavy and independent, so cold projects
+        with many of them scale with core count instead of rendering
+        one at a time inside the pipeline walk. get_clip stays as the
+        safety net for anything missed.
+
+        Generators that can't be pickled (e.g. a FunctionGenerator
+        wrapping a lambda) render inline instead.
+        """
+        import os
+
+        missing = []
+        seen = set()
+        for gen in generators:
+            if not isinstance(gen, Generator):
+                continue
+            cache_path = gen.cache_dir / f"{gen.cache_key()}.mp4"
+            key = str(cache_path)
+            if key in seen or cache_path.exists():
+                continue
+            seen.add(key)
+            gen.cache_dir.mkdir(parents=True, exist_ok=True)
+            missing.append((gen, cache_path))
+
+        if not missing:
+            return
+        if len(missing) == 1:
+            gen, cache_path = missing[0]
+            gen.generate(cache_path, config)
+            return
+
+        import pickle
+        from concurrent.futures import ProcessPoolExecutor
+        from concurrent.futures.process import BrokenProcessPool
+
+        workers = min(len(missing), os.cpu_count() or 1)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_generate_one, gen, cache_path, config)
+                    for gen, cache_path in missing
+                ]
+                for future in futures:
+                    future.result()
+        except (pickle.PicklingError, TypeError, AttributeError,
+                BrokenProcessPool):
+            for gen, cache_path in missing:
+                if not cache_path.exists():
+                    gen.generate(cache_path, config)
 
-        cache_path = self.cache_dir / f"{self.cache_key()}.mp4"
-        if not cache_path.exists():
-            self.generate(cache_path, config)
 
-        return VideoFileClip(str(cache_path))
+atexit.register(Generator._save_manifests)
@@ -6,7 +6,7 @@ from pathlib import Path
 from typing import Callable, Any, TYPE_CHECKING
 
 from .base import Generator
-from ..base import generate_cache_key
+from ..base import _new_hasher
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
@@ -33,6 +33,9 @@ class FunctionGenerator(Generator):
         )
     """
 
+    # Type tag pre-hashed once per process; see sources.base
+    _PREFIX = _new_hasher(b"function_generator\x00")
+
     def __init__(
         self,
         func: Callable,
@@ -52,6 +55,11 @@ class FunctionGenerator(Generator):
         super().__init__(key=key, cache_dir=cache_dir)
         self.func = func
         self.kwargs = kwargs
+        self._hash_input = b"\x00".join((
+            key.encode(),
+            repr(tuple(sorted(kwargs.items()))).encode(),
+        ))
+        self._cache_key: str | None = None
 
     def generate(self, output_path: Path, config: "ProjectConfig") -> Path:
         """
@@ -75,11 +83,11 @@ class FunctionGenerator(Generator):
         - The generator key (version identifier)
         - All kwargs (parameters that affect output)
         """
-        return generate_cache_key({
-            "type": "function_generator",
-            "key": self.key,
-            "kwargs": tuple(sorted(self.kwargs.items())),
-        })
+        if self._cache_key is None:
+            hasher = self._PREFIX.copy()
+            hasher.update(self._hash_input)
+            self._cache_key = hasher.digest()[:8].hex()
+        return self._cache_key
 
     def __str__(self) -> str:
         return f"FunctionGenerator({self.func.__name__}, key={self.key!r})"
@@ -1,10 +1,11 @@
 """Manim generator for math visualizations."""
 
 import os
+import shutil
 import subprocess
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import Any, Dict, TYPE_CHECKING
 
 from .base import Generator
 
@@ -21,15 +22,30 @@ QUALITY_MAP = {
     "k": "-qk",     # 4K60
 }
 
+# The same qualities as manim's config names, for in-process rendering
+QUALITY_NAMES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
 
 class ManimGenerator(Generator):
     """
     Generator that renders Manim scenes to video.
 
     Uses the Manim library (either from submodule or pip install)
-    to render mathematical animations.
+    to render mathematical animations. Scenes render in-process when
+    manim is importable — skipping a fresh interpreter start and
+    manim's import graph per scene — and fall back to the manim CLI
+    otherwise.
     """
 
+    # Scene modules imported once per process, shared across generators
+    _scene_modules: Dict[str, Any] = {}
+
     def __init__(
         self,
         scene_class: str,
@@ -86,12 +102,79 @@ class ManimGenerator(Generator):
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
+        media_dir = output_path.parent / "_manim_media"
+
+        if not self._render_in_process(output_path, media_dir):
+            self._render_subprocess(output_path, media_dir)
+
+        return self._collect_output(output_path, media_dir)
+
+    def _render_in_process(self, output_path: Path, media_dir: Path) -> bool:
+        """Render the scene by calling manim's Python API directly.
+
+        Returns False when manim (or the scene module) cannot be
+        imported in-process, in which case the CLI fallback runs. The
+        submodule configuration always uses the CLI, which controls
+        PYTHONPATH explicitly.
+        """
+        if self.use_submodule:
+            return False
+
+        try:
+            from manim import tempconfig
+        except ImportError:
+            return False
+
+        module = self._load_scene_module()
+        if module is None:
+            return False
+
+        scene_cls = getattr(module, self.scene_class, None)
+        if scene_cls is None:
+            raise RuntimeError(
+                f"Scene class '{self.scene_class}' not found in "
+                f"{self.scene_file}"
+            )
+
+        with tempconfig({
+            "quality": QUALITY_NAMES[self.quality],
+            "media_dir": str(media_dir),
+            "output_file": output_path.stem,
+        }):
+            scene_cls().render()
+        return True
+
+    def _load_scene_module(self) -> Any:
+        """Import the scene file once per process, then reuse it."""
+        key = str(self.scene_file.resolve())
+        module = ManimGenerator._scene_modules.get(key)
+        if module is not None:
+            return module
+
+        import importlib.util
+
+        try:
+            spec = importlib.util.spec_from_file_location(
+                f"_manim_scene_{self.scene_file.stem}", self.scene_file
+            )
+            if spec is None or spec.loader is None:
+                return None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+        except Exception:
+            return None  # Fall back to the CLI, which reports errors
+
+        ManimGenerator._scene_modules[key] = module
+        return module
+
+    def _render_subprocess(self, output_path: Path, media_dir: Path) -> None:
+        """Render via the manim CLI."""
         quality_flag = QUALITY_MAP[self.quality]
 
         cmd = self._get_manim_command() + [
             "render",
             quality_flag,
-            "--media_dir", str(output_path.parent / "_manim_media"),
+            "--media_dir", str(media_dir),
             "-o", output_path.stem,
             str(self.scene_file),
             self.scene_class,
@@ -101,9 +184,12 @@ class ManimGenerator(Generator):
         env["PYTHONPATH"] = str(Path(__file__).parent.parent.parent.parent / "external" / "manim")
 
         try:
+            # Manim's progress output can run to many MB on long
+            # renders; drop stdout and keep only stderr for errors
             subprocess.run(
                 cmd,
-                capture_output=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
                 text=True,
                 check=True,
                 env=env,
@@ -116,23 +202,40 @@ class ManimGenerator(Generator):
                 "Or use the submodule: git submodule update --init"
             )
 
+    @staticmethod
+    def _move_output(rendered_file: Path, output_path: Path) -> None:
+        """Move a rendered file into the cache without copying bytes.
+
+        A hardlink-and-unlink is constant-time on the same filesystem;
+        shutil.move covers the cross-filesystem case (e.g. a tmpfs
+        media dir), where plain rename would fail.
+        """
+        try:
+            os.link(rendered_file, output_path)
+            rendered_file.unlink()
+        except OSError:
+            shutil.move(str(rendered_file), str(output_path))
+
+    def _collect_output(self, output_path: Path, media_dir: Path) -> Path:
+        """Move the rendered file out of manim's nested media tree."""
         # Manim outputs to a nested directory structure, find the output
-        media_dir = output_path.parent / "_manim_media" / "videos" / self.scene_file.stem
+        scene_dir = media_dir / "videos" / self.scene_file.stem
 
         # Find the rendered file (quality-dependent subdirectory)
-        for quality_dir in media_dir.iterdir() if media_dir.exists() else []:
+        for quality_dir in scene_dir.iterdir() if scene_dir.exists() else []:
             rendered_file = quality_dir / f"{output_path.stem}.mp4"
             if rendered_file.exists():
-                rendered_file.rename(output_path)
+                self._move_output(rendered_file, output_path)
                 return output_path
 
         # If not found in expected location, check for any mp4
-        if media_dir.exists():
-            for mp4_file in media_dir.rglob("*.mp4"):
-                mp4_file.rename(output_path)
+        videos_dir = media_dir / "videos"
+        if videos_dir.exists():
+            for mp4_file in videos_dir.rglob("*.mp4"):
+                self._move_output(mp4_file, output_path)
                 return output_path
 
-        raise RuntimeError(f"Manim rendered but output not found in {media_dir}")
+        raise RuntimeError(f"Manim rendered but output not found in {scene_dir}")
 
     def cache_key(self) -> str:
         """Generate cache key including all render parameters."""
@@ -2,12 +2,13 @@
 Script-based content generator.
 """
 
+import string
 import subprocess
 from pathlib import Path
 from typing import TYPE_CHECKING
 
 from .base import Generator
-from ..base import generate_cache_key
+from ..base import _new_hasher
 
 if TYPE_CHECKING:
     from video_toolkit.config import ProjectConfig
@@ -31,6 +32,9 @@ class ScriptGenerator(Generator):
         )
     """
 
+    # Type tag pre-hashed once per process; see sources.base
+    _PREFIX = _new_hasher(b"script_generator\x00")
+
     def __init__(
         self,
         command: str,
@@ -53,6 +57,27 @@ class ScriptGenerator(Generator):
         self.command = command
         self.timeout = timeout
         self.kwargs = kwargs
+        self._hash_input = b"\x00".join((
+            key.encode(),
+            command.encode(),
+            repr(tuple(sorted(kwargs.items()))).encode(),
+        ))
+        self._cache_key: str | None = None
+        # Parse the template once: simple {name} fields become a
+        # (literal, field) list joined per generate call instead of
+        # re-parsing the format string every time. Templates using
+        # format specs, conversions, or positional fields keep the
+        # str.format path.
+        parts = []
+        simple = True
+        for literal, field, spec, conversion in string.Formatter().parse(
+            command
+        ):
+            if spec or conversion or field == "":
+                simple = False
+                break
+            parts.append((literal, field))
+        self._parts = parts if simple else None
 
     def generate(self, output_path: Path, config: "ProjectConfig") -> Path:
         """
@@ -78,8 +103,15 @@ class ScriptGenerator(Generator):
             **self.kwargs,
         }
 
-        # Format the command
-        cmd = self.command.format(**template_vars)
+        # Format the command from the precompiled template
+        if self._parts is not None:
+            cmd = "".join(
+                literal
+                + ("" if field is None else str(template_vars[field]))
+                for literal, field in self._parts
+            )
+        else:
+            cmd = self.command.format(**template_vars)
 
         # Execute
         result = subprocess.run(
@@ -97,12 +129,11 @@ class ScriptGenerator(Generator):
         """
         Generate cache key from command, key, and kwargs.
         """
-        return generate_cache_key({
-            "type": "script_generator",
-            "key": self.key,
-            "command": self.command,
-            "kwargs": tuple(sorted(self.kwargs.items())),
-        })
+        if self._cache_key is None:
+            hasher = self._PREFIX.copy()
+            hasher.update(self._hash_input)
+            self._cache_key = hasher.digest()[:8].hex()
+        return self._cache_key
 
     def __str__(self) -> str:
         return f"ScriptGenerator(key={self.key!r})"
@@ -2,17 +2,58 @@
 
 import hashlib
 import os
-import wave
+import shutil
+import struct
+import threading
+import time
 from abc import ABC, abstractmethod
+from concurrent.futures import Future
 from pathlib import Path
 
+# Optional fast hash for cache keys; see video_toolkit.sources.base
+try:
+    from blake3 import blake3 as _new_hasher
+except ImportError:
+    _new_hasher = hashlib.sha256
+
 
 class TTSEngine(ABC):
     """Abstract base class for text-to-speech engines."""
 
-    def __init__(self, cache_dir: str = "./tts_cache"):
+    def __init__(
+        self,
+        cache_dir: str = "./tts_cache",
+        cache_ttl_hours: float | None = None,
+    ):
+        """
+        Args:
+            cache_dir: Directory for caching synthesized audio
+            cache_ttl_hours: If set, cached audio older than this is
+                deleted at engine construction (None keeps everything)
+        """
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # In-flight synthesis by cache key, so parallel workers hitting
+        # the same narration share one synthesis instead of racing
+        self._inflight: dict = {}
+        self._inflight_lock = threading.Lock()
+        if cache_ttl_hours:
+            self._sweep_cache(cache_ttl_hours)
+
+    def _sweep_cache(self, ttl_hours: float) -> None:
+        """Delete cached audio files older than the TTL."""
+        cutoff = time.time() - ttl_hours * 3600
+        try:
+            entries = os.scandir(self.cache_dir)
+        except OSError:
+            return
+        with entries:
+            for entry in entries:
+                try:
+                    if entry.is_file() and entry.stat().st_mtime < cutoff:
+                        os.unlink(entry.path)
+                except OSError:
+                    pass
 
     @abstractmethod
     def synthesize(self, text: str, output_path: str) -> str:
@@ -43,15 +84,64 @@ class TTSEngine(ABC):
         return {}
 
     def get_cache_key(self, text: str) -> str:
-        """Generate a unique cache key for the given text."""
+        """Generate a unique cache key for the given text.
+
+        Keys are memoized per (text, voice): the same narration is
+        keyed several times per build (is_cached, synthesize_cached,
+        status listings), and engine name and params are fixed per
+        instance.
+        """
+        memo = getattr(self, "_key_memo", None)
+        if memo is None:
+            memo = self._key_memo = {}
+        voice = self.get_voice()
+        memo_key = (text, voice)
+        cached = memo.get(memo_key)
+        if cached is not None:
+            return cached
+
+        hasher = self._static_hasher(voice).copy()
+        hasher.update(text.encode())
+        result = hasher.digest()[:8].hex()
+        memo[memo_key] = result
+        return result
+
+    def _static_hasher(self, voice: str):
+        """Hasher pre-fed with the engine's static cache params.
+
+        Engine name and cache params don't vary per text, so they are
+        hashed once per voice and copied per key instead of rebuilding
+        and sorting a params dict for every narration.
+        """
+        cached = getattr(self, "_static_hasher_memo", None)
+        if cached is not None and cached[0] == voice:
+            return cached[1]
+
         params = {
-            "text": text,
             "engine": self.get_name(),
-            "voice": self.get_voice(),
+            "voice": voice,
             **self.get_cache_params()
         }
-        key_string = str(sorted(params.items()))
-        return hashlib.sha256(key_string.encode()).hexdigest()[:16]
+        hasher = _new_hasher()
+        for key in sorted(params):
+            hasher.update(key.encode())
+            hasher.update(b"\x00")
+            hasher.update(repr(params[key]).encode())
+            hasher.update(b"\x01")
+        hasher.update(b"text\x00")
+        self._static_hasher_memo = (voice, hasher)
+        return hasher
+
+    def prehash_keys(self, texts: list) -> list:
+        """Compute cache keys for many texts in one pass.
+
+        Warms the key memo for a whole project's narrations up front so
+        the later is_cached/synthesize_cached calls are dict lookups.
+
+        Returns:
+            The cache keys, in input order.
+        """
+        return [self.get_cache_key(text) for text in texts]
 
     def get_cached_path(self, cache_key: str) -> Path:
         """Get the path for a cached audio file."""
@@ -63,7 +153,12 @@ class TTSEngine(ABC):
         return self.get_cached_path(cache_key).exists()
 
     def synthesize_cached(self, text: str) -> str:
-        """Synthesize with caching."""
+        """Synthesize with caching.
+
+        Safe to call concurrently: the first caller for a given text
+        owns the synthesis, later callers wait on its result rather
+        than duplicating the work (or racing on the temp file).
+        """
         cache_key = self.get_cache_key(text)
         cached_path = self.get_cached_path(cache_key)
 
@@ -71,24 +166,78 @@ class TTSEngine(ABC):
             print(f"  [Cache HIT] {cache_key}")
             return str(cached_path)
 
-        print(f"  [Cache MISS] {cache_key} - synthesizing...")
+        with self._inflight_lock:
+            future = self._inflight.get(cache_key)
+            owner = future is None
+            if owner:
+                future = self._inflight[cache_key] = Future()
+
+        if not owner:
+            return future.result()
 
-        temp_path = self.cache_dir / f"_temp_{cache_key}.wav"
-        self.synthesize(text, str(temp_path))
-        temp_path.rename(cached_path)
+        print(f"  [Cache MISS] {cache_key} - synthesizing...")
+        try:
+            temp_path = self.cache_dir / f"_temp_{cache_key}.wav"
+            self.synthesize(text, str(temp_path))
+            temp_path.rename(cached_path)
+            future.set_result(str(cached_path))
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(cache_key, None)
 
         return str(cached_path)
 
+    def synthesize_many(self, jobs: list) -> list:
+        """Synthesize (text, output_path) jobs, deduplicating by text.
+
+        Projects repeat short cues ("Next", chapter headings) across
+        segments; each unique text is synthesized once and the result
+        is hardlinked (or copied, cross-device) into every other
+        destination instead of re-hitting the API or model.
+
+        Args:
+            jobs: (text, output_path) pairs
+
+        Returns:
+            Output paths, in input order
+        """
+        by_text: dict = {}
+        for text, path in jobs:
+            by_text.setdefault(text, []).append(str(path))
+
+        for text, paths in by_text.items():
+            self.synthesize(text, paths[0])
+            for extra in paths[1:]:
+                if extra == paths[0]:
+                    continue
+                try:
+                    if os.path.lexists(extra):
+                        os.unlink(extra)
+                    os.link(paths[0], extra)
+                except OSError:
+                    shutil.copyfile(paths[0], extra)
+
+        return [str(path) for _, path in jobs]
+
+
+# Complete zero-frame WAV file (22050 Hz, 16-bit, mono) — byte-for-byte
+# what wave.open used to produce, minus the header-patching round-trip
+_EMPTY_WAV = struct.pack(
+    "<4sI4s4sIHHIIHH4sI",
+    b"RIFF", 36, b"WAVE",
+    b"fmt ", 16, 1, 1, 22050, 44100, 2, 16,
+    b"data", 0,
+)
+
 
 class DummyTTSEngine(TTSEngine):
     """Dummy TTS engine for testing (produces empty audio)."""
 
     def synthesize(self, text: str, output_path: str) -> str:
-        with wave.open(output_path, 'w') as f:
-            f.setnchannels(1)
-            f.setsampwidth(2)
-            f.setframerate(22050)
-            f.writeframes(b'')
+        Path(output_path).write_bytes(_EMPTY_WAV)
         return output_path
 
     def get_name(self) -> str:
@@ -1,14 +1,82 @@
 """ElevenLabs TTS engine implementation."""
 
+import atexit
+import io
 import os
-import subprocess
+import re
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-from elevenlabs.client import ElevenLabs
-from pydub import AudioSegment
-
 from .base import TTSEngine
 
+# httpx, the elevenlabs SDK, pydub and the sentence splitter (which
+# pulls in MoviePy) all import lazily at first use, keeping module
+# import — and with it cold CLI start — to stdlib cost
+
+# Loaded PyAV module, or None when unavailable; resolved on first use.
+# PyAV decodes MP3 in-process; pydub shells out to ffmpeg per file,
+# which costs a fork/exec and temp I/O
+_av_state: list = []
+
+
+def _load_av():
+    if not _av_state:
+        try:
+            import av
+        except ImportError:
+            av = None
+        _av_state.append(av)
+    return _av_state[0]
+
+
+# One HTTP connection pool for every engine instance in the process:
+# keep-alive and TLS session reuse save a handshake round-trip per
+# request when batch-synthesizing many short cues
+_shared_http_client = None
+
+
+def _get_http_client():
+    import httpx
+
+    global _shared_http_client
+    if _shared_http_client is None:
+        limits = httpx.Limits(
+            max_keepalive_connections=8, keepalive_expiry=300
+        )
+        try:
+            _shared_http_client = httpx.Client(http2=True, limits=limits)
+        except ImportError:  # http2 extra not installed
+            _shared_http_client = httpx.Client(limits=limits)
+        atexit.register(_shared_http_client.close)
+    return _shared_http_client
+
+
+# Coalesce small network chunks into writes of this size
+_WRITE_BUFFER_SIZE = 256 * 1024
+
+_ENV_LINE_RE = re.compile(r"^([A-Za-z_][A-Za-z0-9_]*)=(.*)$", re.MULTILINE)
+
+# Parsed .env contents keyed by file mtime, so constructing engines in
+# a loop doesn't re-read and re-parse the file every time
+_env_cache: "tuple[int, dict] | None" = None
+
+
+def _parse_env() -> dict:
+    """Parse .env once, re-reading only when the file changes."""
+    global _env_cache
+    try:
+        mtime_ns = os.stat(".env").st_mtime_ns
+    except OSError:
+        return {}
+    if _env_cache is None or _env_cache[0] != mtime_ns:
+        values = {
+            key: value.strip()
+            for key, value in _ENV_LINE_RE.findall(Path(".env").read_text())
+        }
+        _env_cache = (mtime_ns, values)
+    return _env_cache[1]
+
 
 class ElevenLabsTTSEngine(TTSEngine):
     """Cloud-based ElevenLabs TTS engine."""
@@ -25,6 +93,8 @@ class ElevenLabsTTSEngine(TTSEngine):
         voice_id: str = None,
         model_id: str = "eleven_monolingual_v1",
         cache_dir: str = "./tts_cache",
+        optimize_streaming_latency: int = 3,
+        output_format: str = "pcm_24000",
     ):
         super().__init__(cache_dir)
 
@@ -37,57 +107,231 @@ class ElevenLabsTTSEngine(TTSEngine):
 
         self.voice_id = voice_id or self.VOICES["rachel"]
         self.model_id = model_id
+        self.optimize_streaming_latency = optimize_streaming_latency
+        self.output_format = output_format
         self._client = None
 
     def _load_api_key(self) -> str:
         """Load API key from environment or .env file."""
-        key = os.environ.get("ELEVENLABS_API_KEY")
-        if key:
-            return key
-
-        env_path = Path(".env")
-        if env_path.exists():
-            for line in env_path.read_text().splitlines():
-                if line.startswith("ELEVENLABS_API_KEY="):
-                    return line.split("=", 1)[1].strip()
-
-        return None
+        return (
+            os.environ.get("ELEVENLABS_API_KEY")
+            or _parse_env().get("ELEVENLABS_API_KEY")
+        )
 
     def _get_client(self):
-        """Lazy-load the ElevenLabs client."""
+        """Lazy-load the ElevenLabs client on the shared HTTP pool."""
         if self._client is None:
-            self._client = ElevenLabs(api_key=self.api_key)
+            from elevenlabs.client import ElevenLabs
+
+            try:
+                self._client = ElevenLabs(
+                    api_key=self.api_key,
+                    httpx_client=_get_http_client(),
+                )
+            except TypeError:  # older SDK without httpx_client kwarg
+                self._client = ElevenLabs(api_key=self.api_key)
         return self._client
 
-    def synthesize(self, text: str, output_path: str) -> str:
-        client = self._get_client()
+    def warmup(self) -> None:
+        """Pre-establish the TLS connection to the API.
+
+        Optional: call before a batch so the first synthesis doesn't
+        pay the handshake. Failures are ignored — the real request
+        will surface any connectivity problem.
+        """
+        import httpx
+
+        try:
+            _get_http_client().head("https://api.elevenlabs.io")
+        except httpx.HTTPError:
+            pass
 
-        audio_generator = client.text_to_speech.convert(
+    def _convert_stream(self, text: str, **extra):
+        """Request one utterance from the streaming endpoint.
+
+        Older SDKs expose it as convert_as_stream; newer ones stream
+        from convert directly. Chunks arrive as the server generates
+        them, so the caller can overlap its writes with synthesis.
+        """
+        client = self._get_client()
+        convert = getattr(
+            client.text_to_speech, "convert_as_stream", None
+        ) or client.text_to_speech.convert
+        return convert(
             voice_id=self.voice_id,
             text=text,
             model_id=self.model_id,
+            optimize_streaming_latency=self.optimize_streaming_latency,
+            output_format=self.output_format,
+            **extra,
         )
 
-        output_path = Path(output_path)
+    def synthesize(self, text: str, output_path: str) -> str:
+        from ..utils.text import iter_sentences
 
-        if output_path.suffix.lower() == ".wav":
-            mp3_path = output_path.with_suffix(".mp3")
-            with open(mp3_path, "wb") as f:
-                for chunk in audio_generator:
-                    f.write(chunk)
+        output_path = Path(output_path)
+        is_wav = output_path.suffix.lower() == ".wav"
 
-            self._convert_to_wav(str(mp3_path), str(output_path))
-            mp3_path.unlink()
+        if is_wav and self.output_format.startswith("pcm_"):
+            # Raw PCM wraps straight into a WAV container as chunks
+            # arrive — no MP3 decode, no pydub round-trip. Multi-
+            # sentence passages synthesize per sentence in parallel.
+            sentences = iter_sentences(text) or [text]
+            if len(sentences) > 1:
+                self._synthesize_sentences(sentences, output_path)
+            else:
+                self._write_pcm_wav(
+                    self._convert_stream(text), output_path
+                )
+        elif is_wav:
+            if _load_av() is not None:
+                # Push-decode each MP3 chunk as it arrives, so decode
+                # overlaps network receive and nothing is buffered
+                self._stream_mp3_to_wav(
+                    self._convert_stream(text), output_path
+                )
+            else:
+                buffer = bytearray()
+                for chunk in self._convert_stream(text):
+                    buffer.extend(chunk)
+                self._convert_to_wav(bytes(buffer), str(output_path))
         else:
-            with open(output_path, "wb") as f:
-                for chunk in audio_generator:
-                    f.write(chunk)
+            self._write_buffered(self._convert_stream(text), output_path)
 
         return str(output_path)
 
-    def _convert_to_wav(self, mp3_path: str, wav_path: str):
-        """Convert MP3 to WAV using pydub."""
-        audio = AudioSegment.from_mp3(mp3_path)
+    @staticmethod
+    def _write_buffered(chunks, output_path: Path) -> None:
+        """Write audio chunks coalesced into large buffered writes.
+
+        Network chunks are small, so batching them into 256 KB writes
+        cuts syscalls, and the fadvise hint on close keeps one-shot
+        audio files from crowding the page cache.
+        """
+        fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                     0o644)
+        try:
+            buf = bytearray()
+            for chunk in chunks:
+                buf.extend(chunk)
+                if len(buf) >= _WRITE_BUFFER_SIZE:
+                    os.write(fd, buf)
+                    del buf[:]
+            if buf:
+                os.write(fd, buf)
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        finally:
+            os.close(fd)
+
+    def synthesize_batch(self, items: list) -> list:
+        """Synthesize many (text, output_path) pairs concurrently.
+
+        Throughput for batch narration is bound by network round-trips,
+        so requests overlap across the shared connection pool instead
+        of summing. Concurrency is capped to stay inside ElevenLabs
+        rate limits.
+
+        Args:
+            items: (text, output_path) pairs
+
+        Returns:
+            Output paths, in input order
+        """
+        if not items:
+            return []
+        if len(items) == 1:
+            text, path = items[0]
+            return [self.synthesize(text, path)]
+
+        workers = min(len(items), 16)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return list(
+                pool.map(lambda item: self.synthesize(*item), items)
+            )
+
+    def _synthesize_sentences(
+        self, sentences: list, output_path: Path
+    ) -> None:
+        """Synthesize sentences concurrently, stitching PCM in order.
+
+        Each sentence is an independent request, so K sentences overlap
+        K network round-trips; the previous/next text params keep
+        prosody continuous across the cuts. Buffers are written to the
+        WAV strictly in sentence order.
+        """
+
+        def fetch(index: int) -> bytes:
+            extra = {}
+            if index:
+                extra["previous_text"] = sentences[index - 1]
+            if index + 1 < len(sentences):
+                extra["next_text"] = sentences[index + 1]
+            return b"".join(
+                self._convert_stream(sentences[index], **extra)
+            )
+
+        workers = min(len(sentences), 8)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            buffers = list(pool.map(fetch, range(len(sentences))))
+        self._write_pcm_wav(buffers, output_path)
+
+    def _write_pcm_wav(self, audio_generator, output_path: Path) -> None:
+        """Stream 16-bit mono PCM chunks into a WAV file."""
+        sample_rate = int(self.output_format.split("_", 1)[1])
+        with wave.open(str(output_path), "wb") as f:
+            f.setnchannels(1)
+            f.setsampwidth(2)
+            f.setframerate(sample_rate)
+            for chunk in audio_generator:
+                f.writeframesraw(chunk)
+
+    def _stream_mp3_to_wav(self, audio_generator, output_path: Path):
+        """Push-decode MP3 chunks into a WAV file as they arrive.
+
+        Uses PyAV's parser/decoder directly: each network chunk is fed
+        in and any complete frames come out as PCM, so the whole clip
+        is never held in memory and no temp file or ffmpeg subprocess
+        is involved. The writer opens lazily on the first decoded frame
+        since the stream parameters aren't known until then.
+        """
+        av = _load_av()
+        codec = av.CodecContext.create("mp3", "r")
+        writer = None
+        resampler = None
+
+        def write_frames(frames):
+            nonlocal writer, resampler
+            for frame in frames:
+                if writer is None:
+                    writer = wave.open(str(output_path), "wb")
+                    writer.setnchannels(len(frame.layout.channels))
+                    writer.setsampwidth(2)
+                    writer.setframerate(frame.sample_rate)
+                    resampler = av.AudioResampler(
+                        format="s16",
+                        layout=frame.layout,
+                        rate=frame.sample_rate,
+                    )
+                for resampled in resampler.resample(frame):
+                    writer.writeframesraw(resampled.to_ndarray().tobytes())
+
+        try:
+            for chunk in audio_generator:
+                for packet in codec.parse(chunk):
+                    write_frames(codec.decode(packet))
+            for packet in codec.parse(None):  # Flush the parser
+                write_frames(codec.decode(packet))
+            write_frames(codec.decode(None))  # Flush the decoder
+        finally:
+            if writer is not None:
+                writer.close()
+
+    def _convert_to_wav(self, mp3_bytes: bytes, wav_path: str):
+        """Decode MP3 bytes to a WAV file via pydub (PyAV fallback)."""
+        from pydub import AudioSegment
+
+        audio = AudioSegment.from_mp3(io.BytesIO(mp3_bytes))
         audio.export(wav_path, format="wav")
 
     def get_name(self) -> str:
@@ -97,4 +341,7 @@ class ElevenLabsTTSEngine(TTSEngine):
         return self.voice_id
 
     def get_cache_params(self) -> dict:
-        return {"model_id": self.model_id}
+        return {
+            "model_id": self.model_id,
+            "output_format": self.output_format,
+        }
@@ -1,13 +1,14 @@
 """Soprano TTS engine implementation."""
 
+import os
 import sys
+import threading
 from pathlib import Path
 
-import torch
-from soprano import SopranoTTS
-
 from .base import TTSEngine
 
+# torch and soprano import lazily inside _get_model; see qwen3.py
+
 
 class SopranoTTSEngine(TTSEngine):
     """Local Soprano TTS engine (~80M params, fast inference)."""
@@ -30,6 +31,11 @@ class SopranoTTSEngine(TTSEngine):
         self.backend = backend
         self.use_submodule = use_submodule
         self._model = None
+        self._model_lock = threading.Lock()
+        # Load the model in the background so the first synthesis
+        # doesn't pay the load; VIDEO_TOOLKIT_WARMUP=0 opts out
+        if os.environ.get("VIDEO_TOOLKIT_WARMUP", "1") == "1":
+            threading.Thread(target=self._warmup, daemon=True).start()
 
     def _setup_submodule_path(self):
         """Add submodule to Python path if using it."""
@@ -45,17 +51,35 @@ class SopranoTTSEngine(TTSEngine):
                 )
 
     def _get_model(self):
-        """Lazy-load the Soprano model."""
-        if self._model is None:
-            self._setup_submodule_path()
+        """Lazy-load the Soprano model (thread-safe).
 
-            if self.backend == "auto":
-                device = "cuda" if torch.cuda.is_available() else "cpu"
-                self._model = SopranoTTS(device=device)
-            else:
-                self._model = SopranoTTS(device=self.backend)
+        The lock keeps the background warmup thread and a concurrent
+        first synthesis from loading the model twice.
+        """
+        if self._model is not None:
+            return self._model
+
+        with self._model_lock:
+            if self._model is None:
+                self._setup_submodule_path()
+
+                import torch
+                from soprano import SopranoTTS
+
+                if self.backend == "auto":
+                    device = "cuda" if torch.cuda.is_available() else "cpu"
+                    self._model = SopranoTTS(device=device)
+                else:
+                    self._model = SopranoTTS(device=self.backend)
+
+            return self._model
 
-        return self._model
+    def _warmup(self) -> None:
+        """Load the model in the background; errors surface on first use."""
+        try:
+            self._get_model()
+        except Exception:
+            pass
 
     def synthesize(self, text: str, output_path: str) -> str:
         model = self._get_model()
@@ -1,5 +1,19 @@
 """Utility modules for the video toolkit."""
 
-from .text import create_text_clip, rgb_to_string, wrap_text
+from .text import (
+    create_text_clip,
+    render_text_sprite,
+    resolve_font_path,
+    rgb_to_string,
+    wrap_text,
+)
+from .text_cache import set_text_cache_dir
 
-__all__ = ["create_text_clip", "rgb_to_string", "wrap_text"]
+__all__ = [
+    "create_text_clip",
+    "render_text_sprite",
+    "resolve_font_path",
+    "rgb_to_string",
+    "set_text_cache_dir",
+    "wrap_text",
+]
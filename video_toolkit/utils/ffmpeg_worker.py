@@ -0,0 +1,105 @@
+"""In-process frame extraction via PyAV, avoiding ffmpeg startup cost."""
+
+import functools
+from pathlib import Path
+from typing import Optional, Union
+
+
+@functools.lru_cache(maxsize=1)
+def _load_av():
+    """Import PyAV once, or None when it isn't installed."""
+    try:
+        import av
+    except ImportError:
+        return None
+    return av
+
+
+@functools.lru_cache(maxsize=1)
+def _av_error():
+    """PyAV's decode-error base class, across PyAV versions.
+
+    PyAV >= 14 renamed AVError to FFmpegError; touching the missing
+    attribute in an except clause would raise AttributeError instead
+    of taking the subprocess-fallback path.
+    """
+    av = _load_av()
+    return getattr(av, "FFmpegError", getattr(av, "AVError", OSError))
+
+
+class FFmpegWorker:
+    """Keeps libavcodec loaded in-process for small one-shot jobs.
+
+    Spawning an ffmpeg subprocess costs tens of milliseconds of dynamic
+    linking and codec-registry setup before any work happens, which
+    dominates single-frame jobs like transition-frame extraction. PyAV
+    binds libavformat/libavcodec directly, so once imported each
+    extraction is a seek plus one decode in the current process (the
+    GIL is released during decode, so this composes with the build
+    worker pool).
+
+    PyAV is optional: callers fall back to the subprocess path when
+    methods return False.
+    """
+
+    def available(self) -> bool:
+        """Whether PyAV is importable."""
+        return _load_av() is not None
+
+    def extract_frame(
+        self,
+        video_path: Union[str, Path],
+        output_path: Union[str, Path],
+        position: str = "first",
+    ) -> bool:
+        """Extract the first or last frame of a video to a PNG.
+
+        Args:
+            video_path: Path to the source video.
+            output_path: Where to save the extracted frame.
+            position: "first" or "last".
+
+        Returns:
+            True on success; False when PyAV is unavailable or the
+            container can't be decoded (caller should fall back).
+        """
+        av = _load_av()
+        if av is None:
+            return False
+
+        output_path = Path(output_path)
+
+        try:
+            with av.open(str(video_path)) as container:
+                stream = container.streams.video[0]
+
+                if position == "last" and container.duration:
+                    # Seek to just before the end (duration is in
+                    # AV_TIME_BASE microseconds), then decode forward
+                    # keeping the final frame
+                    container.seek(max(container.duration - 200_000, 0))
+
+                frame = self._decode_frame(container, stream, position)
+                if frame is None:
+                    return False
+                frame.to_image().save(str(output_path))
+
+        except (_av_error(), OSError, IndexError):
+            return False
+
+        return output_path.exists()
+
+    @staticmethod
+    def _decode_frame(container, stream, position: str) -> Optional[object]:
+        """Decode the first frame, or the last remaining one."""
+        last = None
+        for frame in container.decode(stream):
+            if position == "first":
+                return frame
+            last = frame
+        return last
+
+
+# Shared worker: the win is keeping the codecs loaded per process, so
+# one instance serves every project in it
+shared_worker = FFmpegWorker()
@@ -4,10 +4,227 @@ This module provides consistent text rendering across the toolkit,
 ensuring proper margins to prevent text clipping issues.
 """
 
+import functools
+import math
+import os
+import re
 from typing import List, Optional, Tuple
 
-from moviepy import TextClip
-from PIL import ImageFont
+import numpy as np
+from moviepy import ImageClip, TextClip
+from PIL import Image, ImageDraw, ImageFont
+
+from . import text_cache
+
+# Fallbacks when the requested font isn't installed (DejaVu ships with
+# most Linux distributions and with Pillow's test assets)
+_FALLBACK_FONTS = ("Arial", "DejaVuSans")
+
+
+@functools.lru_cache(maxsize=64)
+def _get_font(name: str, font_size: int) -> Optional[ImageFont.FreeTypeFont]:
+    """Load one TrueType font, memoized so the TTF is parsed once."""
+    try:
+        return ImageFont.truetype(name, font_size)
+    except OSError:
+        return None
+
+
+def _load_font(font: str, font_size: int) -> Optional[ImageFont.FreeTypeFont]:
+    """Load a TrueType font, trying fallbacks; None if nothing resolves.
+
+    Font objects are cached per (name, size): every overlay render was
+    re-resolving and re-parsing the font file from disk.
+    """
+    for candidate in (font, *_FALLBACK_FONTS):
+        loaded = _get_font(candidate, font_size)
+        if loaded is not None:
+            return loaded
+    return None
+
+
+def resolve_font_path(font: str) -> Optional[str]:
+    """Resolve a font name to a TrueType file path, or None.
+
+    Used by the ffmpeg drawtext path, which needs a fontfile= argument
+    rather than a font name.
+    """
+    pil_font = _load_font(font, 16)
+    return pil_font.path if pil_font is not None else None
+
+
+def _parse_rgb(color: str) -> Tuple[int, int, int]:
+    """Parse an "rgb(r, g, b)" string into an RGB tuple."""
+    inner = color[color.index("(") + 1:color.index(")")]
+    r, g, b = (int(part) for part in inner.split(","))
+    return (r, g, b)
+
+
+def render_text_sprite(
+    text: str,
+    font: str,
+    font_size: int,
+    color: str,
+    stroke_color: Optional[str],
+    stroke_width: int,
+    margin: Tuple[int, int],
+    text_align: str,
+) -> np.ndarray:
+    """Rasterize text once with Pillow into an RGBA sprite.
+
+    Identical (text, style) combinations are rendered a single time and
+    reused across segments, instead of re-rendering through TextClip on
+    every overlay apply. The resolved font file's mtime is part of the
+    cache key, so a replaced font invalidates stale sprites.
+
+    Raises:
+        OSError: If no usable font can be loaded.
+    """
+    pil_font = _load_font(font, font_size)
+    if pil_font is None:
+        raise OSError(f"No usable font for {font!r}")
+
+    font_path = pil_font.path
+    font_mtime_ns = os.stat(font_path).st_mtime_ns
+
+    return _render_sprite_cached(
+        text,
+        font_path,
+        font_mtime_ns,
+        font_size,
+        color,
+        stroke_color,
+        stroke_width,
+        margin,
+        text_align,
+    )
+
+
+@functools.lru_cache(maxsize=512)
+def _render_sprite_cached(
+    text: str,
+    font_path: str,
+    font_mtime_ns: int,
+    font_size: int,
+    color: str,
+    stroke_color: Optional[str],
+    stroke_width: int,
+    margin: Tuple[int, int],
+    text_align: str,
+) -> np.ndarray:
+    """Memoized rasterization keyed on the resolved font file + mtime.
+
+    On a memory miss, the disk cache (when enabled via
+    text_cache.set_text_cache_dir) is consulted before rasterizing, and
+    fresh renders are persisted for future runs.
+    """
+    key = text_cache.sprite_key(
+        text,
+        font_path,
+        font_mtime_ns,
+        font_size,
+        color,
+        stroke_color,
+        stroke_width,
+        margin,
+        text_align,
+    )
+    cached = text_cache.load_sprite(key)
+    if cached is not None:
+        return cached
+
+    pil_font = _get_font(font_path, font_size)
+    if pil_font is None:
+        raise OSError(f"Cannot load font file {font_path!r}")
+
+    fill = _parse_rgb(color)
+    stroke_fill = _parse_rgb(stroke_color) if stroke_color else None
+
+    probe = ImageDraw.Draw(Image.new("RGBA", (1, 1)))
+    bbox = probe.multiline_textbbox(
+        (0, 0),
+        text,
+        font=pil_font,
+        stroke_width=stroke_width,
+        align=text_align,
+    )
+
+    # bbox values may be floats; round outward so glyphs aren't clipped
+    width = int(math.ceil(bbox[2] - bbox[0])) + 2 * margin[0]
+    height = int(math.ceil(bbox[3] - bbox[1])) + 2 * margin[1]
+
+    image = Image.new("RGBA", (max(width, 1), max(height, 1)), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(image)
+    draw.multiline_text(
+        (margin[0] - bbox[0], margin[1] - bbox[1]),
+        text,
+        font=pil_font,
+        fill=fill,
+        stroke_width=stroke_width,
+        stroke_fill=stroke_fill,
+        align=text_align,
+    )
+
+    sprite = np.asarray(image)
+    text_cache.store_sprite(key, sprite)
+    return sprite
+
+
+# Sentence boundary: terminal punctuation followed by whitespace and
+# an upper-case/digit/quote start. Deliberately simple — narration text
+# is plain prose, not arbitrary markup.
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'])")
+
+# Trailing tokens that end with a period but don't end a sentence
+_ABBREVIATIONS = frozenset((
+    "mr.", "mrs.", "ms.", "dr.", "prof.", "st.", "vs.", "etc.",
+    "e.g.", "i.e.", "fig.", "no.", "al.",
+))
+
+# Fragments shorter than this merge into the next sentence: they're
+# too short to be worth a separate synthesis request
+_MIN_SENTENCE_CHARS = 10
+
+
+def iter_sentences(text: str) -> List[str]:
+    """Split narration into sentences for per-sentence synthesis.
+
+    Splits on ``.!?`` boundaries while keeping common abbreviations and
+    sub-minimum fragments attached to their neighbours, so TTS engines
+    can pipeline long passages sentence by sentence.
+
+    Args:
+        text: Narration text
+
+    Returns:
+        Sentences in order; a single-element list when no boundary
+        is found
+    """
+    sentences: List[str] = []
+    pending = ""
+    for part in _SENTENCE_SPLIT.split(text.strip()):
+        pending = f"{pending} {part}".strip() if pending else part
+        last_word = pending.rsplit(None, 1)[-1].lower() if pending else ""
+        if len(pending) < _MIN_SENTENCE_CHARS or last_word in _ABBREVIATIONS:
+            continue
+        sentences.append(pending)
+        pending = ""
+    if pending:
+        if sentences:
+            sentences[-1] = f"{sentences[-1]} {pending}"
+        else:
+            sentences.append(pending)
+    return sentences
+
+
+@functools.lru_cache(maxsize=8192)
+def _word_width(pil_font: ImageFont.FreeTypeFont, word: str) -> float:
+    """Measured advance width of one word, memoized per (font, word).
+
+    Subtitles repeat the same vocabulary heavily, so repeat wraps turn
+    each measurement into a dict lookup.
+    """
+    return pil_font.getlength(word)
 
 
 def wrap_text(
@@ -19,6 +236,10 @@ def wrap_text(
     """
     Wrap text to fit within a maximum width.
 
+    Width accumulates incrementally from per-word measurements instead
+    of re-measuring the whole joined line for every word, which was
+    quadratic in line length.
+
     Args:
         text: The text to wrap
         font: Font name
@@ -31,33 +252,28 @@ def wrap_text(
     if not text or max_width <= 0:
         return text
 
-    try:
-        pil_font = ImageFont.truetype(font, font_size)
-    except OSError:
-        # Fallback if font not found - use default
-        try:
-            pil_font = ImageFont.truetype("Arial", font_size)
-        except OSError:
-            # Can't measure, return original text
-            return text
-
-    words = text.split()
+    pil_font = _load_font(font, font_size)
+    if pil_font is None:
+        # Can't measure, return original text
+        return text
+
+    space_width = _word_width(pil_font, " ")
     lines: List[str] = []
     current_line: List[str] = []
+    running_width = 0.0
 
-    for word in words:
-        # Try adding word to current line
-        test_line = " ".join(current_line + [word])
-        bbox = pil_font.getbbox(test_line)
-        width = bbox[2] - bbox[0] if bbox else 0
+    for word in text.split():
+        width = _word_width(pil_font, word)
+        added = width + space_width if current_line else width
 
-        if width <= max_width:
-            current_line.append(word)
-        else:
+        if current_line and running_width + added > max_width:
             # Word doesn't fit, start new line
-            if current_line:
-                lines.append(" ".join(current_line))
+            lines.append(" ".join(current_line))
             current_line = [word]
+            running_width = width
+        else:
+            current_line.append(word)
+            running_width += added
 
     # Add remaining words
     if current_line:
@@ -104,16 +320,31 @@ def create_text_clip(
     if max_width is not None:
         text = wrap_text(text, font, font_size, max_width)
 
-    clip = TextClip(
-        font,
-        text=text,
-        font_size=font_size,
-        color=color,
-        stroke_color=stroke_color if stroke_width else None,
-        stroke_width=stroke_width,
-        margin=margin,
-        text_align=text_align,
-    )
+    try:
+        sprite = render_text_sprite(
+            text,
+            font,
+            font_size,
+            color,
+            stroke_color if stroke_width else None,
+            stroke_width,
+            margin,
+            text_align,
+        )
+        clip = ImageClip(sprite, transparent=True)
+    except (OSError, ValueError):
+        # No usable font or unparseable color: let MoviePy's own text
+        # rendering handle it
+        clip = TextClip(
+            font,
+            text=text,
+            font_size=font_size,
+            color=color,
+            stroke_color=stroke_color if stroke_width else None,
+            stroke_width=stroke_width,
+            margin=margin,
+            text_align=text_align,
+        )
 
     if duration is not None:
         clip = clip.with_duration(duration)
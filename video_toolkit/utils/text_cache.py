@@ -0,0 +1,76 @@
+"""Disk-backed cache for rendered text sprites.
+
+The in-memory sprite cache in text.py disappears between CLI runs, so
+every invocation re-rasterizes the same title and subtitle strings.
+This module persists sprites as PNGs under ``<cache_dir>/text/`` keyed
+by a SHA1 of the full render parameters, so incremental rebuilds skip
+Pillow entirely on cache hits.
+"""
+
+import hashlib
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+from PIL import Image
+
+_cache_dir: Optional[Path] = None
+
+
+def set_text_cache_dir(path: Union[str, Path]) -> None:
+    """Enable on-disk sprite persistence under ``<path>/text/``.
+
+    Called by VideoProject on construction; until then the cache is
+    memory-only and rendering behaves as before.
+    """
+    global _cache_dir
+    _cache_dir = Path(path) / "text"
+    _cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+def sprite_key(*parts) -> str:
+    """Build a stable cache key from the render parameters."""
+    material = "|".join(str(part) for part in parts)
+    return hashlib.sha1(material.encode("utf-8")).hexdigest()
+
+
+def load_sprite(key: str) -> Optional[np.ndarray]:
+    """Load a previously persisted sprite, or None on miss."""
+    if _cache_dir is None:
+        return None
+
+    path = _cache_dir / f"{key}.png"
+    if not path.exists():
+        return None
+
+    try:
+        with Image.open(path) as image:
+            return np.asarray(image.convert("RGBA"))
+    except OSError:
+        # Corrupt or partially written file: treat as a miss
+        return None
+
+
+def store_sprite(key: str, sprite: np.ndarray) -> None:
+    """Persist a rendered sprite atomically (tmp file + os.replace).
+
+    The atomic rename keeps concurrent parallel builds from reading a
+    half-written PNG. Failures are silent: the disk cache is strictly
+    an optimization.
+    """
+    if _cache_dir is None:
+        return
+
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=_cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as handle:
+                Image.fromarray(sprite).save(handle, format="PNG")
+            os.replace(tmp_path, _cache_dir / f"{key}.png")
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+    except OSError:
+        pass